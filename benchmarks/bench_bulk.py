@@ -0,0 +1,47 @@
+"""Measures how `validate_bulk()` scales with the number of worker processes.
+
+Run it from the root of the repo with `PYTHONPATH=. python benchmarks/bench_bulk.py`.
+"""
+import os
+import time
+
+import hyperform as f
+
+
+NUM_RECORDS = 200_000
+
+
+class ImportForm(f.Form):
+    name = f.Text(required=True)
+    email = f.Email()
+    age = f.Integer(f.InRange(0, 120))
+    country = f.Text(f.ShorterThan(3))
+    subscribed = f.Boolean()
+
+
+def make_records():
+    for i in range(NUM_RECORDS):
+        yield {
+            "name": f"Person {i}",
+            "email": f"person{i}@example.com",
+            "age": str(i % 130),
+            "country": "PE",
+            "subscribed": "yes",
+        }
+
+
+if __name__ == "__main__":
+    cpus = os.cpu_count() or 1
+    base = None
+    workers = 1
+    while workers <= cpus:
+        start = time.perf_counter()
+        for _ in f.validate_bulk(ImportForm, make_records(), workers=workers):
+            pass
+        elapsed = time.perf_counter() - start
+        base = base or elapsed
+        print(
+            f"{workers:3d} workers: {elapsed:7.2f} s"
+            f"  {NUM_RECORDS / elapsed:9.0f} records/s  ({base / elapsed:4.1f}x)"
+        )
+        workers *= 2
@@ -0,0 +1,43 @@
+"""Compares validating a numeric column one value at the time with the
+vectorized `validate_column()`. Requires NumPy.
+
+Run it from the root of the repo with `PYTHONPATH=. python benchmarks/bench_columnar.py`.
+"""
+import random
+import timeit
+
+import hyperform as f
+from hyperform.columnar import validate_column
+
+
+NUM_ROWS = 200_000
+
+
+def scalar(field, column):
+    for raw in column:
+        tmp = field._bind(field.name)
+        tmp.input_values = [raw]
+        tmp.validate()
+
+
+if __name__ == "__main__":
+    rnd = random.Random(0)
+    clean = [str(rnd.randint(-50, 150)) for _ in range(NUM_ROWS)]
+    dirty = clean[:]
+    for i in range(0, NUM_ROWS, 100):
+        dirty[i] = "n/a"
+
+    for name, field in (
+        ("Integer", f.Integer(f.InRange(0, 100))),
+        ("Float", f.Float(f.InRange(0, 100))),
+    ):
+        for label, column in (("clean", clean), ("1% invalid", dirty)):
+            t_scalar = min(timeit.repeat(lambda: scalar(field, column), number=1, repeat=3))
+            t_column = min(timeit.repeat(
+                lambda: validate_column(field, column), number=1, repeat=3
+            ))
+            print(
+                f"{name:8s} {label:11s} scalar: {t_scalar * 1e3:7.1f} ms"
+                f"  columnar: {t_column * 1e3:7.1f} ms"
+                f"  ({t_scalar / t_column:5.1f}x)"
+            )
@@ -0,0 +1,64 @@
+"""Measures the memory and the time of the per-request work of the fields of
+a wide form: building the form, loading the data, and validating it.
+
+Run it from the root of the repo with `PYTHONPATH=. python benchmarks/bench_fields.py`.
+"""
+import gc
+import timeit
+import tracemalloc
+
+import hyperform as f
+
+
+NUM_FIELDS = 50
+NUM_FORMS = 500
+NUMBER = 2000
+
+
+def make_form_class():
+    attrs = {}
+    for i in range(NUM_FIELDS):
+        if i % 2:
+            attrs[f"field{i}"] = f.Integer(f.InRange(0, 1000))
+        else:
+            attrs[f"field{i}"] = f.Text(f.ShorterThan(50), required=True)
+    return type("WideForm", (f.Form,), attrs)
+
+
+def make_input_data():
+    return {
+        f"field{i}": str(i) if i % 2 else "lorem ipsum"
+        for i in range(NUM_FIELDS)
+    }
+
+
+def measure_memory(FormClass, input_data):
+    FormClass(input_data)
+    gc.collect()
+    tracemalloc.start()
+    forms = [FormClass(input_data) for _ in range(NUM_FORMS)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del forms
+    return size / NUM_FORMS
+
+
+def measure_time(func):
+    return min(timeit.repeat(func, number=NUMBER, repeat=5)) / NUMBER
+
+
+if __name__ == "__main__":
+    FormClass = make_form_class()
+    input_data = make_input_data()
+    form = FormClass(input_data)
+
+    def validate():
+        form._is_valid = None
+        form._valid_data = None
+        form.validate()
+
+    print(f"{NUM_FIELDS} fields")
+    print(f"memory:     {measure_memory(FormClass, input_data):8.0f} bytes per form")
+    print(f"build:      {measure_time(lambda: FormClass(input_data)) * 1e6:8.1f} µs")
+    print(f"load_data:  {measure_time(lambda: form.load_data(input_data)) * 1e6:8.1f} µs")
+    print(f"validate:   {measure_time(validate) * 1e6:8.1f} µs")
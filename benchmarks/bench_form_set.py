@@ -0,0 +1,42 @@
+"""Measures how the load of a formset grows with the number of rows posted.
+
+Run it from the root of the repo with `PYTHONPATH=. python benchmarks/bench_form_set.py`.
+"""
+import timeit
+
+import hyperform as f
+from hyperform.constants import SEP, NEW
+
+
+class RowForm(f.Form):
+    name = f.Text(required=True)
+    quantity = f.Integer()
+    price = f.Float()
+
+
+class TableForm(f.Form):
+    title = f.Text()
+    rows = f.FormSet(RowForm, max_num=1000)
+
+
+def make_input_data(num_rows):
+    data = {"title": "Table"}
+    for i in range(1, num_rows + 1):
+        prefix = f"rows{SEP}{NEW}{i}{SEP}"
+        data[prefix + "name"] = f"Row {i}"
+        data[prefix + "quantity"] = str(i)
+        data[prefix + "price"] = "9.99"
+    return data
+
+
+if __name__ == "__main__":
+    for num_rows in (100, 250, 500, 1000):
+        input_data = make_input_data(num_rows)
+        number = 10
+        best = min(timeit.repeat(
+            lambda: TableForm(input_data), number=number, repeat=3
+        )) / number
+        print(
+            f"{num_rows:5d} rows: {best * 1e3:8.2f} ms per load,"
+            f" {best / num_rows * 1e6:6.1f} µs per row"
+        )
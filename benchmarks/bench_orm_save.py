@@ -0,0 +1,113 @@
+"""Measures the save of a `SQLAForm` with a formset of new rows, with a flush per
+row (the old behavior) and with a single flush at the end, against SQLite in memory.
+
+Run it from the root of the repo with `PYTHONPATH=. python benchmarks/bench_orm_save.py`.
+"""
+import time
+
+from sqlalchemy import create_engine, event, Column, ForeignKey, Integer, String
+from sqlalchemy.orm import declarative_base, relationship, sessionmaker
+
+import hyperform as f
+from hyperform.constants import SEP, NEW
+
+
+NUM_ROWS = 300
+
+engine = create_engine("sqlite:///:memory:")
+session = sessionmaker(bind=engine)()
+Base = declarative_base()
+
+statements = []
+event.listen(engine, "before_cursor_execute", lambda *args: statements.append(1))
+
+
+class Invoice(Base):
+    __tablename__ = "invoices"
+
+    id = Column(Integer, primary_key=True)
+    title = Column(String, nullable=False)
+    rows = relationship("Row", back_populates="invoice")
+
+
+class Row(Base):
+    __tablename__ = "rows"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String, nullable=False)
+    quantity = Column(Integer, nullable=False)
+    invoice_id = Column(Integer, ForeignKey("invoices.id"))
+    invoice = relationship("Invoice", back_populates="rows")
+
+    try:
+        # Lets SQLite send the inserts of a flush in one statement
+        from sqlalchemy import insert_sentinel
+        _sentinel = insert_sentinel()
+    except ImportError:  # SQLAlchemy < 2.0.10
+        pass
+
+
+Base.metadata.create_all(engine)
+
+
+class RowForm(f.SQLAForm):
+    _model = Row
+    _session = session
+
+    name = f.Text(required=True)
+    quantity = f.Integer(required=True)
+
+
+class FlushPerRowForm(RowForm):
+    def create_object(self, data):
+        object = super().create_object(data)
+        self._session.flush()
+        return object
+
+
+class InvoiceForm(f.SQLAForm):
+    _model = Invoice
+    _session = session
+
+    title = f.Text(required=True)
+    rows = f.FormSet(RowForm, backref="invoice", max_num=1000)
+
+
+class FlushPerRowInvoiceForm(InvoiceForm):
+    rows = f.FormSet(FlushPerRowForm, backref="invoice", max_num=1000)
+
+
+def make_input_data():
+    data = {"title": "Invoice"}
+    for i in range(1, NUM_ROWS + 1):
+        prefix = f"rows{SEP}{NEW}{i}{SEP}"
+        data[prefix + "name"] = f"Row {i}"
+        data[prefix + "quantity"] = str(i)
+    return data
+
+
+def measure(FormClass, input_data, repeat=5):
+    best = None
+    for _ in range(repeat):
+        form = FormClass(input_data)
+        form.validate()
+        statements.clear()
+        start = time.perf_counter()
+        form.save()
+        elapsed = time.perf_counter() - start
+        session.rollback()
+        best = elapsed if best is None else min(best, elapsed)
+    return best, len(statements)
+
+
+if __name__ == "__main__":
+    input_data = make_input_data()
+    for label, FormClass in (
+        ("flush per row", FlushPerRowInvoiceForm),
+        ("single flush", InvoiceForm),
+    ):
+        best, num_statements = measure(FormClass, input_data)
+        print(
+            f"{label:>14}: {best * 1e3:8.2f} ms to save {NUM_ROWS} rows,"
+            f" {num_statements} statements"
+        )
@@ -0,0 +1,42 @@
+"""Measures the parsing of the date and time values sent by the browsers
+(`<input type="date">`, `<input type="time">`), and of the 12-hours formats
+typed by hand, that use the general grammar.
+
+Run it from the root of the repo with `PYTHONPATH=. python benchmarks/bench_temporal.py`.
+"""
+import timeit
+
+from hyperform.ftypes import (
+    type_date,
+    type_date_many,
+    type_datetime,
+    type_time,
+)
+
+
+NUMBER = 100_000
+
+CASES = [
+    ("date 2019-05-29", type_date, "2019-05-29"),
+    ("date 2019-5-9", type_date, "2019-5-9"),
+    ("time 16:20", type_time, "16:20"),
+    ("time 16:20:05", type_time, "16:20:05"),
+    ("time 4:20 pm", type_time, "4:20 pm"),
+    ("datetime 2019-05-29 16:20", type_datetime, "2019-05-29 16:20"),
+    ("datetime 2019-05-29 4:20 PM", type_datetime, "2019-05-29 4:20 PM"),
+]
+
+DATES = [f"2019-{month:02d}-{day:02d}" for month in range(1, 13) for day in range(1, 29)] * 30
+
+
+if __name__ == "__main__":
+    for name, func, value in CASES:
+        best = min(timeit.repeat(lambda: func(value), number=NUMBER, repeat=5))
+        print(f"{name:30s} {best / NUMBER * 1e6:5.2f} µs")
+
+    for name, func in (
+        ("type_date() x 10080", lambda: [type_date(value) for value in DATES]),
+        ("type_date_many() x 10080", lambda: type_date_many(DATES)),
+    ):
+        best = min(timeit.repeat(func, number=1, repeat=5))
+        print(f"{name:30s} {best * 1e3:5.2f} ms")
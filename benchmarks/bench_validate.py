@@ -0,0 +1,60 @@
+"""Compares the interpreted and the compiled `Form.validate()` on a wide form.
+
+Run it from the root of the repo with `PYTHONPATH=. python benchmarks/bench_validate.py`.
+"""
+import timeit
+
+import hyperform as f
+
+
+NUM_FIELDS = 40
+NUMBER = 2000
+
+
+def make_form_class(compiled=False):
+    attrs = {"_compiled": compiled}
+    for i in range(NUM_FIELDS):
+        if i % 4 == 0:
+            attrs[f"field{i}"] = f.Integer(f.InRange(0, 1000), required=True)
+        elif i % 4 == 1:
+            attrs[f"field{i}"] = f.Text(f.ShorterThan(50))
+        elif i % 4 == 2:
+            attrs[f"field{i}"] = f.Boolean()
+        else:
+            attrs[f"field{i}"] = f.Text(collection=True, max_num=10)
+    return type("WideForm", (f.Form,), attrs)
+
+
+def make_input_data():
+    data = {}
+    for i in range(NUM_FIELDS):
+        if i % 4 == 0:
+            data[f"field{i}"] = str(i)
+        elif i % 4 == 1:
+            data[f"field{i}"] = "lorem ipsum"
+        elif i % 4 == 2:
+            data[f"field{i}"] = "yes"
+        else:
+            data[f"field{i}"] = "a, b, c"
+    return data
+
+
+def bench(FormClass, input_data):
+    form = FormClass(input_data)
+
+    def run():
+        form._is_valid = None
+        form._valid_data = None
+        form.validate()
+
+    return min(timeit.repeat(run, number=NUMBER, repeat=5)) / NUMBER
+
+
+if __name__ == "__main__":
+    input_data = make_input_data()
+    interpreted = bench(make_form_class(), input_data)
+    compiled = bench(make_form_class(compiled=True), input_data)
+    print(f"{NUM_FIELDS} fields")
+    print(f"interpreted: {interpreted * 1e6:8.1f} µs per validate()")
+    print(f"compiled:    {compiled * 1e6:8.1f} µs per validate()")
+    print(f"speedup:     {interpreted / compiled:8.2f}x")
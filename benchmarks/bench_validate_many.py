@@ -0,0 +1,51 @@
+"""Compares the cost per record of `Form.validate_many()` with instantiating
+a new form for each record.
+
+Run it from the root of the repo with `PYTHONPATH=. python benchmarks/bench_validate_many.py`.
+"""
+import timeit
+
+import hyperform as f
+
+
+NUM_RECORDS = 5000
+
+
+class ContactForm(f.Form):
+    name = f.Text(required=True)
+    age = f.Integer(f.InRange(0, 120))
+    country = f.Text()
+    subscribed = f.Boolean()
+    notes = f.Text(f.ShorterThan(200))
+
+
+RECORDS = [
+    {
+        "name": f"Person {i}",
+        "age": str(i % 100),
+        "country": "PE",
+        "subscribed": "yes" if i % 2 else "",
+        "notes": "lorem ipsum",
+    }
+    for i in range(NUM_RECORDS)
+]
+
+
+def one_form_per_record():
+    for record in RECORDS:
+        form = ContactForm(record)
+        form.validate() or form.get_errors()
+
+
+def validate_many():
+    for _ in ContactForm.validate_many(RECORDS):
+        pass
+
+
+if __name__ == "__main__":
+    for name, func in (
+        ("one form per record", one_form_per_record),
+        ("validate_many()", validate_many),
+    ):
+        best = min(timeit.repeat(func, number=1, repeat=5))
+        print(f"{name:20s} {best / NUM_RECORDS * 1e6:6.1f} µs per record")
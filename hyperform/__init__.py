@@ -1,5 +1,8 @@
+from .bulk import *  # noqa
+from .compiler import *  # noqa
 from .fields import *  # noqa
 from .form import *  # noqa
 from .form_set import *  # noqa
 from .orm_form import *  # noqa
+from .streaming_form_set import *  # noqa
 from .validators import *  # noqa
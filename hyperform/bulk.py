@@ -0,0 +1,104 @@
+from collections import deque
+import importlib
+from itertools import islice
+import os
+
+
+__all__ = ("validate_bulk", )
+
+
+_form_classes = {}
+
+
+def validate_bulk(
+    FormClass,
+    records,
+    *,
+    workers=None,
+    chunk_size=1000,
+    max_pending=None,
+):
+    """Validates a stream of records, like the rows of a nightly import, in
+    parallel using a pool of processes.
+
+    The records are read in chunks of `chunk_size` and each chunk is validated
+    with `FormClass.validate_many()` in a worker process. Yields `(index, result)`
+    tuples, in the same order of the records, where the result is the valid data
+    or a `FormErrors` dictionary.
+
+    FormClass (Form|str):
+        The form class or its import path, like "myapp.forms:ContactForm".
+        The workers import the class by its path, so it must be defined at the
+        top level of a module.
+
+    workers (int|None):
+        Number of worker processes. By default, the number of CPUs.
+
+    chunk_size (int):
+        Number of records sent to a worker at once.
+
+    max_pending (int|None):
+        Maximum number of chunks submitted to the workers but not yet yielded.
+        The records are not read until there is room for more, so a slow
+        consumer doesn't fill the memory. By default, twice the number of workers.
+
+    """
+    # Imported here, because loading the process pool is slow
+    from concurrent.futures import ProcessPoolExecutor
+
+    form_path = FormClass if isinstance(FormClass, str) else get_form_path(FormClass)
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or workers * 2
+    records = iter(records)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        start = 0
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(pending) < max_pending:
+                    chunk = list(islice(records, chunk_size))
+                    if not chunk:
+                        exhausted = True
+                        break
+                    pending.append(
+                        executor.submit(validate_chunk, form_path, start, chunk)
+                    )
+                    start += len(chunk)
+
+                if not pending:
+                    break
+                yield from pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def get_form_path(FormClass):
+    qualname = FormClass.__qualname__
+    if "<locals>" in qualname:
+        raise ValueError(
+            "The form class must be defined at the top level of a module"
+            " to be imported by the workers."
+        )
+    return f"{FormClass.__module__}:{qualname}"
+
+
+def load_form_class(form_path):
+    FormClass = _form_classes.get(form_path)
+    if FormClass is None:
+        module_name, _, qualname = form_path.partition(":")
+        FormClass = importlib.import_module(module_name)
+        for name in qualname.split("."):
+            FormClass = getattr(FormClass, name)
+        _form_classes[form_path] = FormClass
+    return FormClass
+
+
+def validate_chunk(form_path, start, records):
+    FormClass = load_form_class(form_path)
+    return [
+        (start + index, result)
+        for index, result in FormClass.validate_many(records)
+    ]
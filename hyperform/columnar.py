@@ -0,0 +1,251 @@
+from collections import namedtuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+from .fields import Field, Float, Integer
+from .validators import InRange, LessThan, MoreThan
+
+
+__all__ = ("ColumnResult", "validate_column", )
+
+
+ColumnResult = namedtuple("ColumnResult", (
+    "values",
+    "valid",
+    "empty",
+    "errors",
+    "messages",
+))
+ColumnResult.__doc__ = """The result of `validate_column()`.
+
+values:
+    Array with the converted values. The values of the invalid or empty
+    rows are undefined.
+
+valid:
+    Boolean mask of the rows that validated.
+
+empty:
+    Boolean mask of the valid rows without a value (the field would
+    return `None` for them).
+
+errors:
+    Indices of the rows that didn't validate.
+
+messages:
+    List with the error message of each row in `errors`.
+
+"""
+
+# Error codes. The ones of the validators start at VALIDATOR
+OK = 0
+REQUIRED = 1
+TYPE = 2
+MIN_NUM = 3
+MAX_NUM = 4
+VALIDATOR = 5
+
+INT64_MAX_DIGITS = 18
+
+
+def validate_column(field, column):
+    """Validates a column of raw values, one for each row, against a numeric
+    field, using vectorized NumPy operations instead of calling `field.validate()`
+    for each one.
+
+    The results are the same as with the scalar path, including the behavior
+    with `strict=False`. A `None` in the column is a missing value (an empty list
+    of input values) and everything else is converted to a string and stripped.
+
+    Only single-valued `Integer` or `Float` fields, without custom `clean`, and
+    with `InRange`, `LessThan` or `MoreThan` validators are supported. Requires
+    NumPy.
+
+    """
+    if np is None:  # pragma: no cover
+        raise ImportError("The columnar validation requires NumPy.")
+    check_supported(field)
+
+    raw = np.asarray(column, dtype=object)
+    num_rows = len(raw)
+    missing = np.equal(raw, None)
+    strings = np.char.strip(raw.astype(str))
+    codes = np.zeros(num_rows, dtype=np.int8)
+
+    values, converted = typecast_column(field, strings, missing)
+    not_converted = ~missing & ~converted
+    if field.strict:
+        codes[not_converted] = TYPE
+    else:
+        # With `strict=False` the invalid values are ignored, like if they
+        # were missing.
+        missing = missing | not_converted
+
+    present = ~missing
+    if field.required:
+        codes[missing & (codes == OK)] = REQUIRED
+    elif not field.strict:
+        # An empty list of input values returns `None` right away, but an empty
+        # list of typecasted values is still checked.
+        check_num_values(field, codes, not_converted, 0)
+    check_num_values(field, codes, present, 1)
+
+    pending = present & (codes == OK)
+    for i, validator in enumerate(field.validators):
+        if not pending.any():
+            break
+        failed = np.zeros(num_rows, dtype=bool)
+        failed[pending] = ~run_validator(validator, values[pending])
+        codes[failed] = VALIDATOR + i
+        pending &= ~failed
+
+    valid = codes == OK
+    errors = np.flatnonzero(~valid)
+    messages = get_messages(field, codes[errors])
+    return ColumnResult(values, valid, valid & missing, errors, messages)
+
+
+def check_supported(field):
+    cls = field.__class__
+    if cls.type not in (Integer.type, Float.type) or not all(
+        getattr(cls, method) is getattr(Field, method)
+        for method in ("validate", "_pre", "_typecast_values", "_validate_values")
+    ):
+        raise ValueError(f"{cls.__name__} fields are not supported.")
+    if field.multiple or field.collection:
+        raise ValueError("Only single-valued fields are supported.")
+    if field.custom_clean:
+        raise ValueError("Fields with a custom `clean` are not supported.")
+    if field.batch_validators:
+        raise ValueError("Fields with batch validators are not supported.")
+    for validator in field.validators:
+        if validator.__class__ not in (InRange, LessThan, MoreThan):
+            raise ValueError(f"The {validator.__class__.__name__} validator is not supported.")
+
+
+def typecast_column(field, strings, missing):
+    """Converts the strings to numbers. The conversion of NumPy calls `int()` or
+    `float()`, like the scalar path, but it fails for the whole array if any
+    value is invalid. When that happens, only the values that look like numbers
+    are converted together, and the rest, one by one.
+    """
+    is_int = field.__class__.type is Integer.type
+    dtype = np.int64 if is_int else np.float64
+    pytype = int if is_int else float
+    present = ~missing
+
+    values = np.zeros(len(strings), dtype=dtype)
+    converted = present.copy()
+    try:
+        values[present] = strings[present].astype(dtype)
+        return values, converted
+    except (ValueError, TypeError, OverflowError):
+        pass
+
+    candidates = present & (looks_like_int(strings) if is_int else looks_like_float(strings))
+    try:
+        values[candidates] = strings[candidates].astype(dtype)
+        rest = present & ~candidates
+    except (ValueError, TypeError, OverflowError):
+        rest = present
+
+    pyvalues = {}
+    for index in np.flatnonzero(rest):
+        try:
+            pyvalues[index] = pytype(strings[index])
+        except (ValueError, TypeError, IndexError):
+            converted[index] = False
+
+    if is_int and any(not int64_safe(value) for value in pyvalues.values()):
+        values = values.astype(object)
+    for index, value in pyvalues.items():
+        values[index] = value
+    return values, converted
+
+
+def looks_like_int(strings):
+    """Mask of the strings made of an optional sign followed by up to 18
+    ASCII digits, that can be converted together to int64.
+    """
+    points = codepoints(strings)
+    digits = (points >= ord("0")) & (points <= ord("9"))
+    signed = (points[:, 0] == ord("-")) | (points[:, 0] == ord("+"))
+    length = np.char.str_len(strings)
+    num_digits = digits.sum(axis=1)
+    return (
+        (length > 0)
+        & (num_digits == length - signed)
+        & (num_digits > 0)
+        & (num_digits <= INT64_MAX_DIGITS)
+        & (signed | digits[:, 0])
+    )
+
+
+def looks_like_float(strings):
+    """Mask of the strings made only of ASCII digits, signs, dots and exponents.
+    Some of them could still be invalid, like "1.2.3".
+    """
+    points = codepoints(strings)
+    allowed = (points == 0) | ((points >= ord("0")) & (points <= ord("9")))
+    for char in "+-.eE":
+        allowed |= points == ord(char)
+    return allowed.all(axis=1) & (np.char.str_len(strings) > 0)
+
+
+def codepoints(strings):
+    """A 2D array with the unicode code points of each string, padded with zeros.
+    """
+    width = max(strings.dtype.itemsize // 4, 1)
+    strings = strings.astype(f"U{width}")
+    return strings.view(np.uint32).reshape(len(strings), width)
+
+
+def int64_safe(value):
+    return -(2 ** 63) <= value < 2 ** 63
+
+
+def check_num_values(field, codes, rows, num_values):
+    if field.min_num is not None:
+        codes[rows & (codes == OK) & (field.min_num > num_values)] = MIN_NUM
+    if field.max_num is not None:
+        codes[rows & (codes == OK) & (field.max_num < num_values)] = MAX_NUM
+
+
+def run_validator(validator, values):
+    """Vectorized version of the test of each supported validator.
+    """
+    if isinstance(validator, InRange):
+        result = ~(values < validator.minval) & ~(values > validator.maxval)
+    elif isinstance(validator, LessThan):
+        result = values <= validator.value
+    else:
+        result = values >= validator.value
+    return np.asarray(result, dtype=bool)
+
+
+def get_messages(field, codes):
+    cache = {}
+    messages = []
+    for code in codes.tolist():
+        if code not in cache:
+            cache[code] = get_message(field, code)
+        messages.append(cache[code])
+    return messages
+
+
+def get_message(field, code):
+    if code >= VALIDATOR:
+        return field.validators[code - VALIDATOR].message
+    tmp = field._bind(field.name)
+    if code == REQUIRED:
+        tmp._set_error("required")
+    elif code == TYPE:
+        tmp._set_error("type")
+    elif code == MIN_NUM:
+        tmp._set_error("min_num", num=field.min_num)
+    else:
+        tmp._set_error("max_num", num=field.max_num)
+    return tmp.error
@@ -8,6 +8,7 @@ from .float import *  # noqa
 from .hex_color import *  # noqa
 from .integer import *  # noqa
 from .month import *  # noqa
+from .options import *  # noqa
 from .password import *  # noqa
 from .slug import *  # noqa
 from .splitted import *  # noqa
@@ -8,5 +8,9 @@ __all__ = ("Boolean", )
 
 class Boolean(Text):
 
+    __slots__ = ()
+
+    widget = "checkbox"
+
     def type(self, value):
         return type_boolean(value)
@@ -1,4 +1,4 @@
-from ..ftypes import type_date
+from ..ftypes import format_date, type_date
 
 from .text import Text
 
@@ -10,6 +10,8 @@ class Date(Text):
     """A simple date field formatted as `YYYY-MM-dd`. Example: "1980-07-28".
     """
 
+    __slots__ = ()
+
     input_type = "date"
 
     def __init__(self, *args, **kwargs):
@@ -19,7 +21,7 @@ class Date(Text):
         )
 
     def prepare(self, object_value):
-        return [object_value.strftime("%Y-%m-%d")]
+        return [format_date(object_value)]
 
     def type(self, value):
         return type_date(value)
@@ -1,7 +1,4 @@
-from datetime import datetime
-
-from ..ftypes import type_date
-from ..ftypes import type_time
+from ..ftypes import format_date, format_time, type_datetime
 
 from .text import Text
 
@@ -14,8 +11,17 @@ class DateTime(Text):
     24-hours format, seconds optional.
 
     Examples: "1980-07-28 5:03 AM", "2019-09-08 4:20:16 PM", "2019-09-08 16:34".
+
+    Options:
+
+        tz (str|tzinfo|None):
+            The timezone of the values, as an IANA name like "America/Lima" or
+            as a `tzinfo`. If used, the values are timezone-aware datetimes.
+
     """
 
+    __slots__ = ()
+
     input_type = "date"
 
     def __init__(self, *args, **kwargs):
@@ -32,20 +38,10 @@ class DateTime(Text):
         ]
 
     def _prepare_date(self, object_value):
-        return object_value.strftime("%Y-%m-%d")
+        return format_date(object_value)
 
     def _prepare_time(self, object_value):
-        value = "{}:{:02d}".format(
-            object_value.hour if object_value.hour <= 12 else object_value.hour - 12,
-            object_value.minute,
-        )
-        if object_value.second:
-            value += ":{:02d}".format(object_value.second)
-        value += object_value.strftime(" %p")
-        return value
-
-    def type(self, value):
-        if " " not in value:
-            value += " 00:00"  # So it always has a time
-        date_part, time_part = value.split(" ", maxsplit=1)
-        return datetime.combine(type_date(date_part), type_time(time_part))
+        return format_time(object_value)
+
+    def type(self, value, tz=None):
+        return type_datetime(value, tz=tz)
@@ -1,3 +1,6 @@
+import asyncio
+from functools import partial
+
 from .text import Text
 
 from ..ftypes import type_email
@@ -36,13 +39,32 @@ class Email(Text):
             [SMTPUTF8 (RFC 6531)](https://tools.ietf.org/html/rfc6531) extension.
             By default this is set to `False`.
 
+        dns_cache (DeliverabilityCache|None):
+            The cache of the domains already checked with `check_dns`.
+            By default, the one shared by all the fields.
+
     """
 
+    __slots__ = ()
+
     input_type = "email"
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.error_messages.setdefault("type", "Doesn‘t look like a valid e-mail.")
 
-    def type(self, value, check_dns=False, allow_smtputf8=False):
-        return type_email(value, check_dns=check_dns, allow_smtputf8=allow_smtputf8)
+    def type(self, value, check_dns=False, allow_smtputf8=False, dns_cache=None):
+        return type_email(
+            value,
+            check_dns=check_dns,
+            allow_smtputf8=allow_smtputf8,
+            dns_cache=dns_cache,
+        )
+
+    async def atype(self, value, check_dns=False, **kwargs):
+        func = partial(self.type, value, check_dns=check_dns, **kwargs)
+        if not check_dns:
+            return func()
+        # The DNS lookup blocks, so it runs in a thread to not stall the event loop
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, func)
@@ -1,9 +1,12 @@
+import asyncio
+from collections import namedtuple
 import re
 
-from .field_renderable import FieldRenderable
+from ..utils import maybe_await
+from .field_renderable import FieldRenderable, SelectedValues
 
 
-__all__ = ("Field", )
+__all__ = ("Field", "FieldSpec", )
 
 
 default_error_messages = {
@@ -16,6 +19,27 @@ default_error_messages = {
 HARD_MAX_NUM = 1000
 
 
+FieldSpec = namedtuple("FieldSpec", (
+    "validators",
+    "required",
+    "strict",
+    "error_messages",
+    "multiple",
+    "min_num",
+    "max_num",
+    "collection",
+    "sep",
+    "extra",
+    "batch_validators",
+))
+FieldSpec.__doc__ = """The declared options of a field.
+Is shared by all the copies of the field made by the form instances, that
+copy these options to their own slots.
+"""
+
+_MISSING = object()
+
+
 class Field(FieldRenderable):
     r"""
 
@@ -48,8 +72,12 @@ class Field(FieldRenderable):
     """
 
     __slots__ = (
-        "validators",
+        "_spec",
         "name",
+        "custom_prepare",
+        "custom_clean",
+        # Declared options, copied from the spec
+        "validators",
         "required",
         "strict",
         "error_messages",
@@ -59,15 +87,26 @@ class Field(FieldRenderable):
         "collection",
         "sep",
         "extra",
+        "batch_validators",
+        # Per-request data
+        "input_values",
+        "object_value",
+        "error",
+        "error_value",
+        "updated",
+        # The object value formatted by `prepare()`, and the object value
+        # it was computed for
+        "_prepared",
+        "_prepared_for",
+        # Lookup of the current values, for rendering options, and the
+        # values it was computed for
+        "_selected",
+        "_selected_for",
     )
 
-    object_value = None
-    input_values = None
     input_type = "text"
-
-    error = None
-    error_value = None
-    updated = False
+    # The default widget when the field is rendered by `Form.iter_html()`
+    widget = "input"
 
     def __init__(
         self,
@@ -89,28 +128,40 @@ class Field(FieldRenderable):
 
         **extra
     ):
-        self.validators = validators
-        self.name = name or ""
-
-        self.required = required
-        self.strict = strict
-        self.min_num = min_num
         if max_num is not None:
             max_num = min(max_num, HARD_MAX_NUM)
-        self.max_num = max_num
-        self.error_messages = error_messages or {}
-
-        self.collection = collection
         if collection:
-            self.sep = sep
             multiple = False
-        self.multiple = multiple
 
+        # The validators that check the values of many forms together,
+        # like `Unique`, are run by the form or formset.
+        batch_validators = tuple(
+            validator for validator in validators if getattr(validator, "batch", False)
+        )
+        if batch_validators:
+            validators = tuple(
+                validator for validator in validators if validator not in batch_validators
+            )
+
+        self._spec = FieldSpec(
+            validators=validators,
+            required=required,
+            strict=strict,
+            error_messages=error_messages or {},
+            multiple=multiple,
+            min_num=min_num,
+            max_num=max_num,
+            collection=collection,
+            sep=sep if collection else None,
+            extra=extra,
+            batch_validators=batch_validators,
+        )
+        self._load_spec()
+        self._reset_state()
+        self.name = name or ""
         self.custom_prepare = prepare
         self.custom_clean = clean
 
-        self.extra = extra
-
     def load_data(self, input_values=None, object_value=None):
         self.input_values = input_values
         self.object_value = object_value
@@ -119,10 +170,27 @@ class Field(FieldRenderable):
     def values(self):
         if self.input_values:
             return self.input_values
-        if self.object_value:
-            return (self.custom_prepare or self.prepare)(self.object_value)
+        object_value = self.object_value
+        if object_value:
+            if self._prepared_for is not object_value:
+                self._prepared = (self.custom_prepare or self.prepare)(object_value)
+                self._prepared_for = object_value
+            return self._prepared
         return []
 
+    def is_selected(self, value):
+        """Returns `True` if the value, or the value as a string, is one of the
+        values of the field or one of them as a string.
+
+        The lookup is built once, so rendering a select with many options is
+        linear on the number of options.
+        """
+        values = self.values
+        if self._selected_for is not values:
+            self._selected = SelectedValues(values or [])
+            self._selected_for = values
+        return value in self._selected
+
     @property
     def value(self):
         return self.values[0] if self.values else ""
@@ -142,6 +210,9 @@ class Field(FieldRenderable):
         if not values:
             if self.required:
                 self._set_error("required")
+                return None
+            # The value is cleared
+            self.updated = self.object_value is not None
             return None
 
         values = self._pre(values)
@@ -165,11 +236,97 @@ class Field(FieldRenderable):
         self.updated = pyvalue != self.object_value
         return pyvalue
 
+    async def avalidate(self):
+        """Like `validate()`, but awaits the `type` method, the validators, and
+        the custom `clean` function if they are coroutines. The values of a
+        multiple field are typecasted concurrently.
+        """
+        if self.__class__.validate is not Field.validate:
+            return self.validate()
+
+        self._reset()
+        values = [str(value).strip() for value in self.input_values or []]
+
+        if not values:
+            if self.required:
+                self._set_error("required")
+                return None
+            # The value is cleared
+            self.updated = self.object_value is not None
+            return None
+
+        values = self._pre(values)
+        pyvalues = await self._atypecast_values(values)
+        if self.error:
+            return None
+
+        if (not pyvalues or pyvalues[0] == "") and self.required:
+            self._set_error("required")
+            return None
+
+        await self._avalidate_values(pyvalues)
+        if self.error:
+            return None
+
+        pyvalue = self._post(pyvalues)
+        if self.custom_clean:
+            pyvalue = await maybe_await(self.custom_clean(pyvalue))
+        self.updated = pyvalue != self.object_value
+        return pyvalue
+
     def type(self, value, **kwargs):
         return str(value)
 
+    def atype(self, value, **kwargs):
+        """The `type` used by `avalidate()`. Can return an awaitable, so fields
+        that do I/O to typecast a value can override it with a coroutine.
+        """
+        return self.type(value, **kwargs)
+
     # Private
 
+    def _bind(self, name, prepare=None, clean=None):
+        """Make a copy of the field for a form instance, sharing the same
+        spec but with its own, empty, per-request data.
+        """
+        field = object.__new__(self.__class__)
+        # Fields subclasses without `__slots__` could have their own attributes
+        if hasattr(self, "__dict__"):
+            field.__dict__.update(self.__dict__)
+        field._spec = self._spec
+        field._load_spec()
+        field._reset_state()
+        field.name = name
+        field.custom_prepare = self.custom_prepare or prepare
+        field.custom_clean = self.custom_clean or clean
+        return field
+
+    def _load_spec(self):
+        # Copied to slots, so reading them doesn't go through the spec
+        spec = self._spec
+        self.validators = spec.validators
+        self.required = spec.required
+        self.strict = spec.strict
+        self.error_messages = spec.error_messages
+        self.multiple = spec.multiple
+        self.min_num = spec.min_num
+        self.max_num = spec.max_num
+        self.collection = spec.collection
+        self.sep = spec.sep
+        self.extra = spec.extra
+        self.batch_validators = spec.batch_validators
+
+    def _reset_state(self):
+        self.input_values = None
+        self.object_value = None
+        self.error = None
+        self.error_value = None
+        self.updated = False
+        self._prepared = None
+        self._prepared_for = _MISSING
+        self._selected = None
+        self._selected_for = _MISSING
+
     def _reset(self):
         self.error = None
         self.error_value = None
@@ -209,26 +366,71 @@ class Field(FieldRenderable):
             pyvalues.append(pyvalue)
         return pyvalues
 
+    async def _atypecast_values(self, values):
+        # Fields with their own typecasting, like `SplittedDateTime`,
+        # don't call `type()` for each value.
+        if self.__class__._typecast_values is not Field._typecast_values:
+            return self._typecast_values(values)
+
+        results = await asyncio.gather(*[self._atype(value) for value in values])
+        pyvalues = []
+        for value, pyvalue in zip(values, results):
+            if pyvalue is None:
+                if self.strict:
+                    self._set_error("type")
+                    self.error_value = value
+                    return
+                continue
+            pyvalues.append(pyvalue)
+        return pyvalues
+
+    async def _atype(self, value):
+        try:
+            return await maybe_await(self.atype(value, **self.extra))
+        except (ValueError, TypeError, IndexError):
+            return None
+
     def _validate_values(self, pyvalues):
+        if not self._check_num_values(pyvalues):
+            return
+
+        for validator in self.validators:
+            if not self._check_validator_result(validator(pyvalues)):
+                return
+
+    async def _avalidate_values(self, pyvalues):
+        if not self._check_num_values(pyvalues):
+            return
+
+        # The validators run in order, so the error is always the one
+        # of the first validator that fails.
+        for validator in self.validators:
+            valid = await maybe_await(validator(pyvalues))
+            if not self._check_validator_result(valid):
+                return
+
+    def _check_num_values(self, pyvalues):
         num_values = len(pyvalues)
 
         if self.min_num is not None and self.min_num > num_values:
             self._set_error("min_num", num=self.min_num)
-            return
+            return False
 
         if self.max_num is not None and self.max_num < num_values:
             self._set_error("max_num", num=self.max_num)
-            return
+            return False
 
-        for validator in self.validators:
-            message = "Invalid value"
-            valid = validator(pyvalues)
-            if valid not in (True, False):
-                valid, message = valid
+        return True
 
-            if not valid:
-                self.error = message
-                return
+    def _check_validator_result(self, valid):
+        message = "Invalid value"
+        if valid not in (True, False):
+            valid, message = valid
+
+        if not valid:
+            self.error = message
+            return False
+        return True
 
     def _set_error(self, name, **kwargs):
         msg = self.error_messages.get(name) or default_error_messages.get(name, "")
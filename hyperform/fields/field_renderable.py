@@ -4,11 +4,13 @@ from ..ftypes import type_boolean
 from ..utils import get_html_attrs
 
 
-__all__ = ("FieldRenderable", "get_html_attrs", "in_")
+__all__ = ("FieldRenderable", "SelectedValues", "get_html_attrs", "in_")
 
 
 class FieldRenderable(object):
 
+    __slots__ = ()
+
     def render_attrs(self, **attrs):
         html = get_html_attrs(attrs, show_error=self.error)
         return Markup(html)
@@ -90,7 +92,7 @@ class FieldRenderable(object):
 
         value = attrs.get("value")
         if value is not None:
-            attrs.setdefault("checked", in_(value, self.values))
+            attrs.setdefault("checked", self.is_selected(value))
         else:
             attrs.setdefault("checked", type_boolean(self.value))
         html_attrs = get_html_attrs(attrs, show_error=self.error)
@@ -123,7 +125,7 @@ class FieldRenderable(object):
 
         value = attrs.get("value")
         if value is not None:
-            attrs.setdefault("checked", in_(value, self.values))
+            attrs.setdefault("checked", self.is_selected(value))
         else:
             attrs.setdefault("checked", type_boolean(self.value))
         html_attrs = get_html_attrs(attrs, show_error=self.error)
@@ -162,7 +164,7 @@ class FieldRenderable(object):
     def as_select(self, items, *, label=None, **attrs):
         """Renders the field as a `<select>` tag.
 
-        items (list):
+        items (list|Options):
             ...
 
         **attrs:
@@ -170,20 +172,30 @@ class FieldRenderable(object):
             It follows the same rules as `get_html_attrs`
 
         """
+        return Markup("".join(self.iter_select(items, label=label, **attrs)))
 
-        html = [str(self.as_select_tag(label=label, **attrs))]
+    def iter_select(self, items, *, label=None, **attrs):
+        """Like `as_select()`, but yields the HTML in chunks, the opening tag
+        and then each option or option group, instead of building the whole
+        string in memory. Joined, the chunks are the same as `as_select()`.
+        """
+        yield str(self.as_select_tag(label=label, **attrs))
 
-        for item in items:
-            label, value = item[:2]
-            if isinstance(value, (list, tuple)):
-                tags = self.render_optgroup(label, value)
-            else:
-                opattrs = item[2] if len(item) > 2 else {}
-                tags = self.render_option(label, value, **opattrs)
-            html.append(str(tags))
+        if hasattr(items, "iter_html"):
+            # Pre-rendered `Options`
+            for html in items.iter_html(self):
+                yield "\n" + html
+        else:
+            for item in items:
+                label, value = item[:2]
+                if isinstance(value, (list, tuple)):
+                    yield "\n"
+                    yield from self.iter_optgroup(label, value)
+                else:
+                    opattrs = item[2] if len(item) > 2 else {}
+                    yield "\n" + self.render_option(label, value, **opattrs)
 
-        html.append("</select>")
-        return Markup("\n".join(html))
+        yield "\n</select>"
 
     def render_optgroup(self, label, items, **attrs):
         """Renders an <optgroup> tag with <options>.
@@ -202,18 +214,19 @@ class FieldRenderable(object):
             It follows the same rules as `get_html_attrs`
 
         """
-        attrs["label"] = escape_silent(str(label))
-        html_attrs = get_html_attrs(attrs, show_error=self.error)
-        html = ['<optgroup {}>'.format(html_attrs)]
+        return Markup("".join(self.iter_optgroup(label, items, **attrs)))
+
+    def iter_optgroup(self, label, items, **attrs):
+        """Like `render_optgroup()`, but yields the HTML in chunks.
+        """
+        yield render_optgroup_tag(label, attrs, self.error)
 
         for item in items:
             oplabel, opvalue = item[:2]
             opattrs = item[2] if len(item) > 2 else {}
-            tag = self.render_option(oplabel, opvalue, **opattrs)
-            html.append(str(tag))
+            yield "\n" + self.render_option(oplabel, opvalue, **opattrs)
 
-        html.append("</optgroup>")
-        return Markup("\n".join(html))
+        yield "\n</optgroup>"
 
     def render_option(self, label, value=None, **attrs):
         """Renders an <option> tag
@@ -229,14 +242,9 @@ class FieldRenderable(object):
             It follows the same rules as `get_html_attrs`
 
         """
-        values = self.values or []
         value = label if value is None else value
-        attrs.setdefault("value", value)
-        attrs["selected"] = in_(value, values)
-        label = escape_silent(str(label))
-        html_attrs = get_html_attrs(attrs, show_error=self.error)
-        tag = "<option {}>{}</option>".format(html_attrs, label)
-        return Markup(tag)
+        selected = self.is_selected(value)
+        return Markup(render_option(label, value, attrs, selected, self.error))
 
     def render_error(self, tag="div", **attrs):
         if not self.error:
@@ -249,6 +257,73 @@ class FieldRenderable(object):
             error=self.error,
         ))
 
+    def render_to(self, write, widget="input", *args, **kwargs):
+        """Renders the field with one of the `as_*` methods and passes the HTML
+        to `write`, a callable like `file.write` or the `write` of a response.
+
+        widget (str):
+            "input", "textarea", "checkbox", "radio", "select_tag", "select",
+            "optgroup", "option" or "error". The select and option groups are
+            written in chunks, one option at the time.
+
+        *args, **kwargs:
+            Passed to the rendering method.
+
+        >>> import io
+        >>> from hyperform import Text
+        >>> buffer = io.StringIO()
+        >>> field = Text(name="size")
+        >>> field.render_to(buffer.write, "select", [("S", "s"), ("M", "m")])
+        >>> print(buffer.getvalue())
+        <select name="size">
+        <option value="s">S</option>
+        <option value="m">M</option>
+        </select>
+
+        """
+        for html in self.iter_html(widget, *args, **kwargs):
+            write(html)
+
+    def iter_html(self, widget="input", *args, **kwargs):
+        """Like `render_to()`, but yields the chunks of HTML instead.
+        """
+        if widget not in WIDGETS:
+            raise ValueError("Unknown widget {!r}".format(widget))
+        if widget in ("select", "optgroup"):
+            yield from getattr(self, "iter_" + widget)(*args, **kwargs)
+            return
+
+        html = getattr(self, WIDGETS[widget])(*args, **kwargs)
+        if html:
+            yield html
+
+
+WIDGETS = {
+    "input": "as_input",
+    "textarea": "as_textarea",
+    "checkbox": "as_checkbox",
+    "radio": "as_radio",
+    "select_tag": "as_select_tag",
+    "select": "as_select",
+    "optgroup": "render_optgroup",
+    "option": "render_option",
+    "error": "render_error",
+}
+
+
+def render_option(label, value, attrs, selected, show_error):
+    attrs.setdefault("value", value)
+    attrs["selected"] = selected
+    label = escape_silent(str(label))
+    html_attrs = get_html_attrs(attrs, show_error=show_error)
+    return "<option {}>{}</option>".format(html_attrs, label)
+
+
+def render_optgroup_tag(label, attrs, show_error):
+    attrs["label"] = escape_silent(str(label))
+    html_attrs = get_html_attrs(attrs, show_error=show_error)
+    return "<optgroup {}>".format(html_attrs)
+
 
 def in_(value, values):
     """Test if the value is in a list of values, or if the value as string is, or
@@ -256,3 +331,34 @@ def in_(value, values):
     """
     ext_values = values + [str(val) for val in values]
     return value in ext_values or str(value) in ext_values
+
+
+class SelectedValues(object):
+    """A precomputed `in_(value, values)`, for testing many values against
+    the same list.
+
+    >>> selected = SelectedValues([1, "b"])
+    >>> "1" in selected, "b" in selected, "c" in selected
+    (True, True, False)
+
+    """
+
+    __slots__ = ("values", "_lookup")
+
+    def __init__(self, values):
+        self.values = values
+        try:
+            self._lookup = frozenset(values) | frozenset(str(val) for val in values)
+        except TypeError:
+            # Unhashable values
+            self._lookup = None
+
+    def __contains__(self, value):
+        if self._lookup is None:
+            return in_(value, self.values)
+        try:
+            if value in self._lookup:
+                return True
+        except TypeError:
+            return in_(value, self.values)
+        return str(value) in self._lookup
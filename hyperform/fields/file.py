@@ -6,4 +6,6 @@ __all__ = ("File", )
 
 class File(Text):
 
+    __slots__ = ()
+
     input_type = "file"
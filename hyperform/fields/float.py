@@ -6,6 +6,8 @@ __all__ = ("Float", )
 
 class Float(Text):
 
+    __slots__ = ()
+
     input_type = "number"
 
     def __init__(self, *args, **kwargs):
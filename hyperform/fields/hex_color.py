@@ -18,6 +18,8 @@ class HexColor(Text):
     - "rgba(221, 96, 89, 0.3)" -> "#dd60594c"
     """
 
+    __slots__ = ()
+
     input_type = "color"
 
     def __init__(self, *args, **kwargs):
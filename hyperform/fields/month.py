@@ -1,4 +1,4 @@
-from ..ftypes import type_date
+from ..ftypes import format_month, type_date
 
 from .text import Text
 
@@ -10,6 +10,8 @@ class Month(Text):
     """A simple month field formatted as `YYYY-MM`. Example: "1980-07".
     """
 
+    __slots__ = ()
+
     input_type = "month"
 
     def __init__(self, *args, **kwargs):
@@ -19,7 +21,7 @@ class Month(Text):
         )
 
     def prepare(self, object_value):
-        return [object_value.strftime("%Y-%m")]
+        return [format_month(object_value)]
 
     def type(self, value):
         value = str(value or "") + "-01"
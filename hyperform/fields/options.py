@@ -0,0 +1,98 @@
+from .field_renderable import render_option, render_optgroup_tag
+
+
+__all__ = ("Options", )
+
+
+class Options(object):
+    """A list of items for `as_select()` whose HTML is rendered once, and
+    cached, instead of on every call.
+
+    Takes the same items as `as_select()`: `(label, value)` or
+    `(label, value, attrs)` tuples for the options, and `(label, items)` for
+    the option groups. Create it once, at import time, and reuse it:
+
+    >>> from hyperform import Text
+    >>> COUNTRIES = Options([("Peru", "PE"), ("Chile", "CL")])
+    >>> field = Text(name="country")
+    >>> field.load_data(object_value="PE")
+    >>> print(field.as_select(COUNTRIES))
+    <select name="country">
+    <option value="PE" selected>Peru</option>
+    <option value="CL">Chile</option>
+    </select>
+
+    Each option has up to four variants, selected or not and with or without
+    the error class, and each is rendered the first time it's needed.
+    Rendering a select is then a lookup of the selected values plus joining
+    the cached fragments.
+
+    """
+
+    __slots__ = ("_nodes", )
+
+    def __init__(self, items):
+        self._nodes = []
+        for item in items:
+            label, value = item[:2]
+            if isinstance(value, (list, tuple)):
+                self._nodes.append(OptGroupFragments(label, value))
+            else:
+                self._nodes.append(OptionFragments(*item))
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def iter_html(self, field):
+        """Yields the HTML of the options and option groups, one by one,
+        for the current values of `field`.
+        """
+        show_error = bool(field.error)
+        is_selected = field.is_selected
+        for node in self._nodes:
+            if isinstance(node, OptGroupFragments):
+                yield node.get_html(is_selected, show_error)
+            else:
+                yield node.get_html(is_selected(node.value), show_error)
+
+
+class OptionFragments(object):
+
+    __slots__ = ("label", "value", "attrs", "variants")
+
+    def __init__(self, label, value=None, attrs=None):
+        self.label = label
+        self.value = label if value is None else value
+        self.attrs = attrs or {}
+        self.variants = [None, None, None, None]
+
+    def get_html(self, selected, show_error):
+        index = selected * 2 + show_error
+        html = self.variants[index]
+        if html is None:
+            html = self.variants[index] = render_option(
+                self.label, self.value, dict(self.attrs), selected, show_error
+            )
+        return html
+
+
+class OptGroupFragments(object):
+
+    __slots__ = ("label", "options", "open_tags")
+
+    def __init__(self, label, items):
+        self.label = label
+        self.options = [OptionFragments(*item) for item in items]
+        self.open_tags = [None, None]
+
+    def get_html(self, is_selected, show_error):
+        tag = self.open_tags[show_error]
+        if tag is None:
+            tag = self.open_tags[show_error] = render_optgroup_tag(
+                self.label, {}, show_error
+            )
+        html = [tag]
+        for option in self.options:
+            html.append(option.get_html(is_selected(option.value), show_error))
+        html.append("</optgroup>")
+        return "\n".join(html)
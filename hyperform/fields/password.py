@@ -6,6 +6,8 @@ __all__ = ("Password", )
 
 class Password(Text):
 
+    __slots__ = ()
+
     input_type = "password"
 
     @property
@@ -45,6 +45,8 @@ class Slug(Text):
 
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         *validators,
@@ -5,6 +5,9 @@ __all__ = ("Splitted", )
 
 
 class Splitted(Text):
+
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         assert not kwargs.get("collection"), "A splitted field cannot be a collection."
         super().__init__(*args, **kwargs)
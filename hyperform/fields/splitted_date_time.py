@@ -1,7 +1,12 @@
 from datetime import datetime
 
-from ..ftypes import type_date
-from ..ftypes import type_time
+from ..ftypes import (
+    format_date,
+    format_time,
+    get_timezone,
+    type_date,
+    type_time,
+)
 
 from .splitted import Splitted
 
@@ -12,32 +17,36 @@ __all__ = ("SplittedDateTime", )
 class SplittedDateTime(Splitted):
     """A Datetime field splitted in a date and a time field (with the same name).
     The first value is the date and the second one the time.
+
+    Options:
+
+        tz (str|tzinfo|None):
+            The timezone of the values, as an IANA name like "America/Lima" or
+            as a `tzinfo`. If used, the values are timezone-aware datetimes.
+
     """
 
+    __slots__ = ()
+
     def prepare(self, object_value):
         return [self._prepare_date(object_value), self._prepare_time(object_value)]
 
     def _prepare_date(self, object_value):
-        return object_value.strftime("%Y-%m-%d")
+        return format_date(object_value)
 
     def _prepare_time(self, object_value):
-        value = "{}:{:02d}".format(
-            object_value.hour if object_value.hour <= 12 else object_value.hour - 12,
-            object_value.minute
-        )
-        if object_value.second:
-            value += ":{:02d}".format(object_value.second)
-        value += object_value.strftime(" %p")
-        return value
+        return format_time(object_value)
 
     def _typecast_values(self, values):
         pyvalues = []
         values.append("00:00")  # So it always has a time
         pairs = zip(values[::2], values[1::2])
+        tz = self.extra.get("tz")
+        tzinfo = get_timezone(tz) if tz is not None else None
 
         for date, time in pairs:
             try:
-                pyvalue = datetime.combine(type_date(date), type_time(time))
+                pyvalue = datetime.combine(type_date(date), type_time(time), tzinfo)
             except (ValueError, TypeError, IndexError):
                 pyvalue = None
 
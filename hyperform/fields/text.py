@@ -5,4 +5,4 @@ __all__ = ("Text", )
 
 
 class Text(Field):
-    pass
+    __slots__ = ()
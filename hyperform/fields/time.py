@@ -1,4 +1,4 @@
-from ..ftypes import type_time
+from ..ftypes import format_time, type_time
 
 from .text import Text
 
@@ -11,6 +11,8 @@ class Time(Text):
     Examples: "5:03 AM", "11:00 PM", "4:20:16 PM".
     """
 
+    __slots__ = ()
+
     input_type = "time"
 
     def __init__(self, *args, **kwargs):
@@ -20,14 +22,7 @@ class Time(Text):
         )
 
     def prepare(self, object_value):
-        value = "{}:{:02d}".format(
-            object_value.hour if object_value.hour <= 12 else object_value.hour - 12,
-            object_value.minute
-        )
-        if object_value.second:
-            value += ":{:02d}".format(object_value.second)
-        value += object_value.strftime(" %p")
-        return [value]
+        return [format_time(object_value)]
 
     def type(self, value):
         return type_time(value)
@@ -28,6 +28,8 @@ class URL(Text):
 
     """
 
+    __slots__ = ()
+
     input_type = "url"
 
     def __init__(self, *args, **kwargs):
@@ -1,14 +1,45 @@
+import asyncio
 from copy import copy
 
 from markupsafe import Markup
 
+from .compiler import compile_form
 from .constants import SEP, DELETED, ID
 from .fields import Field
 from .form_set import FormSet
-from .utils import FakeMultiDict, get_input_values, get_object_value, get_html_attrs
-
-
-__all__ = ("Form",)
+from .utils import (
+    FakeMultiDict,
+    InputIndex,
+    get_input_values,
+    get_object_value,
+    get_html_attrs,
+)
+
+
+__all__ = ("Form", "FormErrors")
+
+RESERVED_ATTRS = (
+    "updated_fields",
+    "prefix",
+    "load_data",
+    "validate",
+    "avalidate",
+    "save",
+    "create_object",
+    "update_object",
+    "delete_object",
+    "get_errors",
+    "get_db_session",
+    "validate_many",
+    "iter_html",
+    "render_to",
+    "load_options",
+)
+
+
+class FormErrors(dict):
+    """The error messages of a form, by field name. See `Form.get_errors()`.
+    """
 
 
 class Form(object):
@@ -21,11 +52,69 @@ class Form(object):
     _model = None
     _is_valid = None
     _valid_data = None
-    _fields = None
-    _formsets = None
     _deleted = False
     _can_delete = False
 
+    # Compiled once per class by `__init_subclass__`
+    _fields = ()
+    _formsets = ()
+    _field_specs = ()
+    _formset_specs = ()
+    _batch_specs = ()
+
+    # Set by the formsets, that run the batch validators of all their
+    # forms together.
+    _defer_batch = False
+
+    # Set to `True` to generate a specialized `validate()` for the class.
+    # See `hyperform.compiler.compile_form`
+    _compiled = False
+    _compiled_validate = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._compile_schema()
+        cls._compiled_validate = None
+        if cls._compiled:
+            compile_form(cls)
+
+    @classmethod
+    def _compile_schema(cls):
+        """Collect the fields and formsets of the class, with the names of their
+        `prepare_*` and `clean_*` hooks, so the instances doesn't have to
+        inspect the class again.
+        """
+        field_specs = []
+        formset_specs = []
+
+        for name in dir(cls):
+            if name.startswith("_") or name in RESERVED_ATTRS:
+                continue
+            attr = getattr(cls, name)
+
+            if isinstance(attr, Field):
+                prepare = "prepare_" + name
+                clean = "clean_" + name
+                field_specs.append((
+                    name,
+                    attr,
+                    prepare if hasattr(cls, prepare) else None,
+                    clean if hasattr(cls, clean) else None,
+                ))
+
+            elif isinstance(attr, FormSet):
+                formset_specs.append((name, attr))
+
+        cls._field_specs = tuple(field_specs)
+        cls._formset_specs = tuple(formset_specs)
+        cls._fields = tuple(spec[0] for spec in field_specs)
+        cls._formsets = tuple(spec[0] for spec in formset_specs)
+        cls._batch_specs = tuple(
+            (spec[0], spec[1].batch_validators)
+            for spec in field_specs
+            if spec[1].batch_validators
+        )
+
     def __init__(
         self,
         input_data=None,
@@ -48,7 +137,8 @@ class Form(object):
         self._valid_data = None
         self.updated_fields = None
 
-        input_data = FakeMultiDict() if input_data is None else input_data
+        if not isinstance(input_data, InputIndex):
+            input_data = InputIndex(input_data)
         file_data = FakeMultiDict() if file_data is None else file_data
         object = object or {}
         if isinstance(object, dict) or object is None:
@@ -58,6 +148,7 @@ class Form(object):
 
         self._id = get_object_value(object, "id")
 
+        self._deleted = False
         if self._can_delete:
             _deleted = self.prefix + SEP + DELETED if self.prefix else DELETED
             if _deleted in input_data:
@@ -77,92 +168,226 @@ class Form(object):
             error=self.error,
         ))
 
-    def validate(self):  # noqa: C901
+    def iter_html(self, **widgets):
+        """Yields the HTML of the whole form in chunks, each ending in a new
+        line: the form error, then each field followed by its error, and then
+        the forms of each formset. The options of the selects are yielded one
+        by one, so the form is never fully built in memory.
+
+        By default, the fields are rendered as inputs, and the `Boolean` fields
+        as checkboxes. Use the named arguments to choose how to render a field:
+        the name of a widget (see `Field.render_to()`), or a callable that
+        takes the field and returns its HTML or an iterable of chunks of it,
+        like `country=lambda field: field.iter_select(COUNTRIES)`.
+
+        The same widgets are used for the forms of the formsets.
+
+        """
+        error = self.render_error()
+        if error:
+            yield error + "\n"
+
+        for name in self._fields:
+            field = getattr(self, name)
+            widget = widgets.get(name, field.widget)
+            if callable(widget):
+                html = widget(field)
+                if isinstance(html, str):
+                    html = (html, )
+            else:
+                html = field.iter_html(widget)
+            yield from html
+            yield "\n"
+
+            error = field.render_error()
+            if error:
+                yield error + "\n"
+
+        for name in self._formsets:
+            yield from getattr(self, name).iter_html(**widgets)
+
+    def render_to(self, write, **widgets):
+        """Writes the HTML of the form, as generated by `iter_html()`, to
+        `write`, a callable like `file.write` or the `write` of a streaming
+        response.
+        """
+        for html in self.iter_html(**widgets):
+            write(html)
+
+    def validate(self):
         if self._is_valid is False:
             return None
         if self._valid_data is not None:
             return self._valid_data
 
-        self.error = None
-        is_valid = True
-        updated = []
-        valid_data = {}
+        valid_data, updated = self._start_validation()
+        if self._deleted:
+            return self._end_validation(True, valid_data, updated)
 
-        if self._id is not None:
-            valid_data[ID] = self._id
+        validate_fields = self._compiled_validate or self._validate_fields
+        is_valid = validate_fields(valid_data, updated)
 
-        if self._deleted:
-            self._is_valid = True
-            self.updated_fields = updated
-            valid_data[DELETED] = True
-            self._valid_data = valid_data
-            return self._valid_data
+        py_values = [getattr(self, name).validate() for name in self._formsets]
+        is_valid = self._collect_formsets(py_values, valid_data, updated) and is_valid
+        if is_valid and self._batch_specs and not self._defer_batch:
+            is_valid = not self._check_batch([(self, valid_data)])
+        return self._end_validation(is_valid, valid_data, updated)
 
-        for name in self._fields:
-            field = getattr(self, name)
-            py_value = field.validate()
+    async def avalidate(self):
+        """Like `validate()`, but awaits the validators, `type` methods, and
+        `clean` functions that are coroutines.
 
-            if field.error:
-                is_valid = False
-                self.error = field.error
-                continue
+        All the fields and formsets are validated concurrently, so any I/O
+        they do, like a DNS lookup or a database query, doesn't block the others.
+        """
+        if self._is_valid is False:
+            return None
+        if self._valid_data is not None:
+            return self._valid_data
 
-            valid_data[name] = py_value
-            if field.updated:
-                updated.append(name)
+        valid_data, updated = self._start_validation()
+        if self._deleted:
+            return self._end_validation(True, valid_data, updated)
+
+        num_fields = len(self._fields)
+        py_values = await asyncio.gather(
+            *[getattr(self, name).avalidate() for name in self._fields],
+            *[getattr(self, name).avalidate() for name in self._formsets],
+        )
+        is_valid = self._collect_fields(py_values[:num_fields], valid_data, updated)
+        is_valid = self._collect_formsets(
+            py_values[num_fields:], valid_data, updated
+        ) and is_valid
+        if is_valid and self._batch_specs and not self._defer_batch:
+            is_valid = not self._check_batch([(self, valid_data)])
+        return self._end_validation(is_valid, valid_data, updated)
+
+    def get_errors(self):
+        """Returns a dictionary with the error messages of the fields and
+        formsets that didn't validate. The errors of the forms inside a formset
+        are grouped by their prefix.
+        """
+        errors = FormErrors()
+        for name in self._fields:
+            error = getattr(self, name).error
+            if error:
+                errors[name] = error
 
         for name in self._formsets:
             formset = getattr(self, name)
-            py_value = formset.validate()
-
-            if not formset.validate():
-                is_valid = False
-                self.error = formset.error
+            if formset.error:
+                errors[name] = formset.error
                 continue
-
-            valid_data[name] = py_value
-            if formset.updated:
-                updated.append(name)
-
-        self._is_valid = is_valid
-        if is_valid:
-            self._valid_data = valid_data
-            self.updated_fields = updated
-            return valid_data
+            forms_errors = {
+                form.prefix: form.get_errors()
+                for form in formset._forms
+                if form is not None and form._is_valid is False
+            }
+            if forms_errors:
+                errors[name] = forms_errors
+
+        return errors
+
+    @classmethod
+    def validate_many(cls, records, **kwargs):
+        """Validates many payloads, like the rows of a CSV or the items of a JSON
+        array, reusing a single form instance.
+
+        Yields `(index, result)` tuples, one for each record, as they are
+        validated. The result is the valid data or, if the record didn't
+        validate, a `FormErrors` dictionary with the error messages.
+
+        The `kwargs` are used to instantiate the form.
+
+        >>> from hyperform import Integer
+        >>> class MyForm(Form):
+        ...     num = Integer(required=True)
+        >>> list(MyForm.validate_many([{"num": "1"}, {"num": "x"}]))
+        [(0, {'num': 1}), (1, {'num': 'Not a valid integer.'})]
+
+        """
+        form = cls(**kwargs)
+        for index, record in enumerate(records):
+            form.load_data(record)
+            valid_data = form.validate()
+            if form._is_valid:
+                yield index, valid_data
+            else:
+                yield index, form.get_errors()
 
     def save(self, **data):
+        """Creates, updates or deletes the object of the form, and of the forms
+        in its formsets, and returns it.
+
+        When updating, only the fields and formsets that changed are written,
+        plus the named arguments. `update_object()` isn't called if there is
+        nothing to write, and the formsets without changes are not saved.
+        """
         if not self.validate():
             return None
 
-        data.update(self._valid_data)
         if not self._model:
+            data.update(self._valid_data)
             return data
 
-        data.pop(ID, None)
-        data.pop(DELETED, None)
-
         if self._object and self._deleted:
             self.delete_object()
             return None
 
+        if self._object:
+            updated = self.updated_fields
+            if not updated and not data:
+                return self._object
+            for name in updated:
+                data[name] = self._valid_data[name]
+        else:
+            updated = None
+            data.update(self._valid_data)
+
+        data.pop(ID, None)
+        data.pop(DELETED, None)
+        self._save_formsets(data)
+
+        if not self._object:
+            obj = self.create_object(data)
+        elif data:
+            obj = self.update_object(data)
+        else:
+            # Only the formsets with a `backref` changed
+            obj = self._object
+
+        self._save_backref_formsets(obj, updated)
+        return obj
+
+    def _save_formsets(self, data):
+        """Saves the formsets in `data` that are stored as a value of the
+        object, and removes from `data` the ones with a `backref`, which
+        are saved after the object.
+        """
         for name in self._formsets:
+            if name not in data:
+                continue
             formset = getattr(self, name)
             if formset.backref:
-                data.pop(name, None)
+                data.pop(name)
                 continue
             data[name] = formset.save()
 
-        if self._object:
-            obj = self.update_object(data)
-        else:
-            obj = self.create_object(data)
-
+    def _save_backref_formsets(self, obj, updated):
+        """Saves the formsets with a `backref` to the saved object.
+        When updating, the formsets not in `updated` are skipped.
+        """
         for name in self._formsets:
             formset = getattr(self, name)
             if formset.backref is None:
                 continue
-            formset.save(parent=obj)
+            if updated is not None and name not in updated:
+                continue
+            formset.save(parent=self._get_backref_value(formset, obj))
 
+    def _get_backref_value(self, formset, obj):
+        """The value of the `backref` of the formset forms: the saved object.
+        """
         return obj
 
     def create_object(self, data):  # pragma: no cover
@@ -176,47 +401,124 @@ class Form(object):
     def delete_object(self):  # pragma: no cover
         pass
 
-    def _setup_fields(self):
-        fields = []
-        formsets = []
-        attrs = (
-            "updated_fields",
-            "prefix",
-            "load_data",
-            "validate",
-            "save",
-            "create_object",
-            "update_object",
-            "delete_object",
-            "get_db_session",
-        )
-        for name in dir(self):
-            if name.startswith("_") or name in attrs:
+    @classmethod
+    def _check_batch(cls, items):
+        """Runs the batch validators, like `Unique`, with the values of many
+        forms at once. `items` is a list of `(form, valid_data)` tuples.
+
+        Sets the error of the fields that didn't validate, and returns a list
+        of those forms.
+        """
+        failed = {}
+        # The rows edited or deleted by the forms, whose values in the
+        # database are being replaced, as `(model, primary key)` tuples.
+        exclude = {
+            (form._model, form._id) for form, _ in items if form._id is not None
+        }
+
+        for name, validators in cls._batch_specs:
+            for validator in validators:
+                first_forms = {}
+                for form, valid_data in items:
+                    if id(form) in failed:
+                        continue
+                    value = valid_data.get(name)
+                    values = value if isinstance(value, list) else [value]
+                    # A value repeated in the same form isn't a conflict
+                    for value in dict.fromkeys(values):
+                        if value is None or value == "":
+                            continue
+                        if value in first_forms:
+                            # Repeated in the same submission
+                            cls._set_batch_error(form, name, validator, failed)
+                            break
+                        first_forms[value] = form
+
+                if not first_forms:
+                    continue
+                form = next(iter(first_forms.values()))
+                used = validator.find_used(list(first_forms), exclude, form)
+                for value in used:
+                    cls._set_batch_error(first_forms[value], name, validator, failed)
+
+        return list(failed.values())
+
+    @staticmethod
+    def _set_batch_error(form, name, validator, failed):
+        if id(form) in failed:
+            return
+        failed[id(form)] = form
+        error = validator.message
+        getattr(form, name).error = error
+        form.error = error
+
+    def _start_validation(self):
+        self.error = None
+        valid_data = {}
+        if self._id is not None:
+            valid_data[ID] = self._id
+        if self._deleted:
+            valid_data[DELETED] = True
+        return valid_data, []
+
+    def _end_validation(self, is_valid, valid_data, updated):
+        self._is_valid = is_valid
+        if is_valid:
+            self._valid_data = valid_data
+            self.updated_fields = updated
+            return valid_data
+
+    def _validate_fields(self, valid_data, updated):
+        py_values = [getattr(self, name).validate() for name in self._fields]
+        return self._collect_fields(py_values, valid_data, updated)
+
+    def _collect_fields(self, py_values, valid_data, updated):
+        is_valid = True
+
+        for name, py_value in zip(self._fields, py_values):
+            field = getattr(self, name)
+            if field.error:
+                is_valid = False
+                self.error = field.error
                 continue
-            attr = getattr(self, name)
 
-            if isinstance(attr, Field):
-                self._setup_field(attr, name)
-                fields.append(name)
+            valid_data[name] = py_value
+            if field.updated:
+                updated.append(name)
 
-            if isinstance(attr, FormSet):
-                self._setup_formset(attr, name)
-                formsets.append(name)
+        return is_valid
 
-        self._fields = fields
-        self._formsets = formsets
+    def _collect_formsets(self, py_values, valid_data, updated):
+        is_valid = True
+
+        for name, py_value in zip(self._formsets, py_values):
+            formset = getattr(self, name)
+            if not py_value:
+                is_valid = False
+                self.error = formset.error
+                continue
 
-    def _setup_field(self, field, name):
-        field = copy(field)
+            valid_data[name] = py_value
+            if formset.updated:
+                updated.append(name)
+
+        return is_valid
+
+    def _setup_fields(self):
+        for name, field, prepare, clean in self._field_specs:
+            self._setup_field(field, name, prepare, clean)
+
+        for name, formset in self._formset_specs:
+            self._setup_formset(formset, name)
+
+    def _setup_field(self, field, name, prepare=None, clean=None):
+        full_name = self.prefix + SEP + name if self.prefix else name
+        field = field._bind(
+            full_name,
+            prepare=getattr(self, prepare) if prepare else None,
+            clean=getattr(self, clean) if clean else None,
+        )
         setattr(self, name, field)
-        if self.prefix:
-            field.name = self.prefix + SEP + name
-        else:
-            field.name = name
-        if field.custom_prepare is None:
-            field.custom_prepare = getattr(self, "prepare_" + name, None)
-        if field.custom_clean is None:
-            field.custom_clean = getattr(self, "clean_" + name, None)
 
     def _setup_formset(self, formset, name):
         formset = copy(formset)
@@ -227,6 +529,8 @@ class Form(object):
             formset.prefix = name + SEP
 
     def _load_field_data(self, input_data, object, file_data):
+        # Plain field lookups go straight to the underlying dict
+        input_data = input_data.data
         for name in self._fields:
             field = getattr(self, name)
             full_name = field.name
@@ -1,5 +1,7 @@
-from .constants import SEP, NEW
-from .utils import get_object_value
+import asyncio
+
+from .constants import NEW
+from .utils import InputIndex, get_object_value
 
 
 __all__ = ("FormSet",)
@@ -23,10 +25,15 @@ class FormSet(object):
         "max_num",
         "can_delete",
         "can_create",
+        "lazy",
         "error_messages",
         "prefix",
         "_is_valid",
+        "_valid_data",
+        "_rows",
         "_forms",
+        "_input_data",
+        "_file_data",
         "error",
         "updated",
     )
@@ -41,6 +48,7 @@ class FormSet(object):
         max_num=None,
         can_delete=True,
         can_create=True,
+        lazy=False,
         error_messages=None,
     ):
         self.FormClass = FormClass
@@ -53,117 +61,233 @@ class FormSet(object):
 
         self.can_delete = can_delete
         self.can_create = can_create
+        self.lazy = lazy
         self.error_messages = error_messages or {}
 
         self.prefix = ""
         self._is_valid = None
+        self._valid_data = None
         self.error = None
         self.updated = False
+        self._rows = []
         self._forms = []
+        self._input_data = None
+        self._file_data = None
 
     def __len__(self):
-        return len(self._forms)
+        return len(self._rows)
 
     def __getitem__(self, index):
-        return self._forms[index]
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._rows)))]
+        form = self._forms[index]
+        if form is None:
+            form = self._forms[index] = self._build_form(self._rows[index])
+        return form
+
+    def __iter__(self):
+        for index in range(len(self._rows)):
+            yield self[index]
 
     def load_data(self, input_data, objects_data, file_data):
+        """Reads the rows of the formset.
+
+        Unless the formset is lazy, a form is built for every row right away.
+        Otherwise, only the prefixes and objects of the rows are stored, and
+        the forms are built when accessed.
+        """
         self._is_valid = None
-        self._forms = []
+        self._valid_data = None
         self.error = None
         self.updated = False
 
         objects_data = objects_data or []
-        prefixes = get_prefixes(self.prefix, input_data, file_data)
-        forms = []
+        if not isinstance(input_data, InputIndex):
+            input_data = InputIndex(input_data)
+        prefixes = dict.fromkeys(input_data.get_rows(self.prefix))
+        rows = []
 
         for object in objects_data:
             obj_id = get_object_value(object, "id")
             assert obj_id, "Object in a FormSet must have an `id` attribute."
             prefix = f"{self.prefix}{obj_id}"
-            if prefix in prefixes:
-                prefixes.remove(prefix)
-            form = self.FormClass(
-                input_data,
-                object,
-                file_data,
-                prefix=prefix,
-                can_delete=self.can_delete
-            )
-            forms.append(form)
+            prefixes.pop(prefix, None)
+            rows.append((prefix, object, True))
 
         if self.can_create:
             for prefix in prefixes:
-                form = self.FormClass(input_data, file_data=file_data, prefix=prefix)
-                forms.append(form)
+                rows.append((prefix, None, True))
 
-            for i in range(len(forms), self.extra):
+            for i in range(len(rows), self.extra):
                 prefix = f"{self.prefix}{NEW}{i + 1}"
-                forms.append(self.FormClass(prefix=prefix))
-
-        self._forms = forms
+                rows.append((prefix, None, False))
+
+        self._rows = rows
+        self._input_data = input_data
+        self._file_data = file_data
+        if self.lazy:
+            self._forms = [None] * len(rows)
+        else:
+            self._forms = [self._build_form(row) for row in rows]
+
+    def iter_html(self, **widgets):
+        """Yields the HTML of each form in chunks. See `Form.iter_html()`.
+
+        With `lazy=True`, the forms not yet built are rendered and discarded
+        one at a time, instead of being kept in the formset.
+        """
+        for index, row in enumerate(self._rows):
+            form = self._forms[index] or self._build_form(row)
+            yield from form.iter_html(**widgets)
 
     def validate(self):
-        data = []
-
-        num_forms = len(self._forms)
-
-        if self.min_num is not None and num_forms < self.min_num:
-            self._set_error("min_num", num=self.min_num)
-            self._is_valid = False
+        if self._is_valid is False:
             return None
-
-        if self.max_num is not None and num_forms > self.max_num:
-            self._set_error("max_num", num=self.max_num)
-            self._is_valid = False
+        if self._valid_data is not None:
+            return self._valid_data
+        if not self._start_validation():
             return None
 
+        data = []
         is_valid = True
+        # With batch validators, the forms are collected after those run
+        batch = [] if self.FormClass._batch_specs else None
 
-        for form in self._forms:
+        for index, row in enumerate(self._rows):
+            # Lazy formsets validate the forms not yet accessed without keeping
+            # them, unless they have errors to show.
+            form = self._forms[index] or self._build_form(row)
             form_data = form.validate()
-            if not form.validate():
-                is_valid = False
+            if batch is not None:
+                batch.append((index, form, form_data))
                 continue
+            is_valid = self._collect_form(index, form, form_data, data) and is_valid
+
+        if batch:
+            is_valid = self._collect_batch(batch, data) and is_valid
+        return self._end_validation(is_valid, data)
 
-            data.append(form_data)
+    async def avalidate(self):
+        """Like `validate()`, but validates all the forms concurrently,
+        awaiting their async validators. See `Form.avalidate()`.
+        """
+        if self._is_valid is False:
+            return None
+        if self._valid_data is not None:
+            return self._valid_data
+        if not self._start_validation():
+            return None
 
-            if form.updated_fields:
-                self.updated = True
-            if form._deleted:
-                self.updated = True
+        forms = [
+            self._forms[index] or self._build_form(row)
+            for index, row in enumerate(self._rows)
+        ]
+        forms_data = await asyncio.gather(*[form.avalidate() for form in forms])
 
-        self._is_valid = is_valid
-        if is_valid:
-            return data
+        data = []
+        if self.FormClass._batch_specs:
+            batch = list(zip(range(len(forms)), forms, forms_data))
+            return self._end_validation(self._collect_batch(batch, data), data)
+
+        is_valid = True
+        for index, (form, form_data) in enumerate(zip(forms, forms_data)):
+            is_valid = self._collect_form(index, form, form_data, data) and is_valid
+
+        return self._end_validation(is_valid, data)
 
     def save(self, parent=None):
-        if self._is_valid is None:  # pragma: no cover
-            self.validate()
-        if self.validate() is False:  # pragma: no cover
+        if self.validate() is None:  # pragma: no cover
             return None
 
         data = {}
         if self.backref:
             data = {self.backref: parent}
 
-        return list(filter(None, [form.save(**data) for form in self._forms]))
+        objects = []
+        for index, row in enumerate(self._rows):
+            form = self._forms[index] or self._build_form(row)
+            # The existing objects already belong to the parent
+            objects.append(form.save(**data) if form._object is None else form.save())
+        return list(filter(None, objects))
 
     # Private
 
+    def _start_validation(self):
+        self.error = None
+        self.updated = False
+        num_forms = len(self._forms)
+
+        if self.min_num is not None and num_forms < self.min_num:
+            self._set_error("min_num", num=self.min_num)
+            self._is_valid = False
+            return False
+
+        if self.max_num is not None and num_forms > self.max_num:
+            self._set_error("max_num", num=self.max_num)
+            self._is_valid = False
+            return False
+
+        return True
+
+    def _collect_form(self, index, form, form_data, data):
+        if not form_data:
+            self._forms[index] = form
+            return False
+
+        data.append(form_data)
+        if form.updated_fields or form._deleted:
+            self.updated = True
+        return True
+
+    def _collect_batch(self, results, data):
+        """Runs the batch validators of the forms, like `Unique`, with the
+        values of all of them at once, and then collects the forms.
+        `results` is a list of `(index, form, form_data)` tuples.
+        """
+        failed = self.FormClass._check_batch([
+            (form, form_data) for _, form, form_data in results if form_data
+        ])
+        for form in failed:
+            form._is_valid = False
+            form._valid_data = None
+            form.updated_fields = None
+        failed = {id(form) for form in failed}
+
+        is_valid = True
+        for index, form, form_data in results:
+            if id(form) in failed:
+                form_data = None
+            is_valid = self._collect_form(index, form, form_data, data) and is_valid
+        return is_valid
+
+    def _end_validation(self, is_valid, data):
+        self._is_valid = is_valid
+        if is_valid:
+            self._valid_data = data
+            return data
+
+    def _build_form(self, row):
+        prefix, object, with_input = row
+        if object is not None:
+            form = self.FormClass(
+                self._input_data,
+                object,
+                self._file_data,
+                prefix=prefix,
+                can_delete=self.can_delete,
+            )
+        elif with_input:
+            form = self.FormClass(
+                self._input_data, file_data=self._file_data, prefix=prefix
+            )
+        else:
+            form = self.FormClass(prefix=prefix)
+        # The formset runs the batch validators of all its forms together
+        form._defer_batch = True
+        return form
+
     def _set_error(self, name, **kwargs):
         msg = self.error_messages.get(name) or default_error_messages.get(name, "")
         for key, repl in kwargs.items():
             msg = msg.replace("{" + key + "}", str(repl))
         self.error = msg or name
-
-
-def get_prefixes(prefix, input_data, file_data):
-    prefixes = []
-    for key in input_data:
-        if SEP not in key:
-            continue
-        prefix, field_name = key.rsplit(SEP, maxsplit=1)
-        if prefix not in prefixes:
-            prefixes.append(prefix)
-    return prefixes
@@ -1,7 +1,7 @@
 from .boolean import *  # noqa
+from .cache import *  # noqa
 from .color import *  # noqa
-from .date import *  # noqa
 from .email import *  # noqa
 from .slug import *  # noqa
-from .time import *  # noqa
+from .temporal import *  # noqa
 from .url import *  # noqa
@@ -0,0 +1,165 @@
+from collections import OrderedDict, namedtuple
+from functools import wraps
+import threading
+
+
+__all__ = (
+    "TypeCache",
+    "TypeCacheInfo",
+    "cached_type",
+    "disable_type_cache",
+    "enable_type_cache",
+    "get_type_cache",
+)
+
+
+TypeCacheInfo = namedtuple("TypeCacheInfo", (
+    "hits",
+    "misses",
+    "evictions",
+    "maxsize",
+    "currsize",
+))
+
+_MISSING = object()
+_type_cache = None
+
+
+class TypeCache(object):
+    """A thread-safe LRU cache of the results of the type functions, keyed by
+    `(function, value, options)`.
+
+    The unhashable options, like the `stopwords` or `replacements` lists of
+    `type_slug`, are converted to tuples for the key.
+    """
+
+    __slots__ = (
+        "maxsize",
+        "hits",
+        "misses",
+        "evictions",
+        "_entries",
+        "_lock",
+    )
+
+    def __init__(self, maxsize=4096):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def call(self, func, value, options):
+        """Returns `func(value, **options)`, from the cache if it's there.
+        """
+        try:
+            key = (func, value, make_hashable(options))
+            hash(key)
+        except TypeError:
+            return func(value, **options)
+
+        with self._lock:
+            result = self._entries.get(key, _MISSING)
+            if result is not _MISSING:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return result
+            self.misses += 1
+
+        # The functions are pure, so if two threads call it at the same
+        # time with the same arguments, both get the same result.
+        result = func(value, **options)
+
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return result
+
+    def cache_info(self):
+        with self._lock:
+            return TypeCacheInfo(
+                self.hits,
+                self.misses,
+                self.evictions,
+                self.maxsize,
+                len(self._entries),
+            )
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+
+def enable_type_cache(maxsize=4096):
+    """Starts caching the results of the expensive type functions
+    (`type_email`, `type_url`, and `type_slug`), used by the `Email`, `URL`,
+    and `Slug` fields. Returns the new cache.
+
+    The cache is shared by all the threads. Calling it again replaces the cache
+    with an empty one.
+
+    >>> from hyperform.ftypes import type_slug
+    >>> cache = enable_type_cache(maxsize=100)
+    >>> type_slug("Hello world"), type_slug("Hello world")
+    ('hello-world', 'hello-world')
+    >>> cache.cache_info()
+    TypeCacheInfo(hits=1, misses=1, evictions=0, maxsize=100, currsize=1)
+    >>> disable_type_cache()
+
+    """
+    global _type_cache
+    _type_cache = TypeCache(maxsize)
+    return _type_cache
+
+
+def disable_type_cache():
+    global _type_cache
+    _type_cache = None
+
+
+def get_type_cache():
+    """Returns the current type cache, or `None` if it isn't enabled.
+    """
+    return _type_cache
+
+
+def cached_type(func=None, *, unless=None):
+    """Decorator for the type functions that are worth caching.
+    Unless the cache is enabled, the function is called directly.
+
+    unless (str|None):
+        The name of an option that, if true, skip the cache. For example,
+        `type_email` with `check_dns` has its own cache with expiration.
+
+    """
+    if func is None:
+        return lambda func: cached_type(func, unless=unless)
+
+    @wraps(func)
+    def wrapper(value, *args, **options):
+        cache = _type_cache
+        if cache is None or args or (unless and options.get(unless)):
+            return func(value, *args, **options)
+        return cache.call(func, value, options)
+
+    return wrapper
+
+
+def make_hashable(value):
+    if isinstance(value, dict):
+        return tuple(sorted(
+            (key, make_hashable(item)) for key, item in value.items()
+        ))
+    if isinstance(value, (list, tuple)):
+        return tuple(make_hashable(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(make_hashable(item) for item in value)
+    return value
@@ -1,12 +1,6 @@
-import datetime
+# The date parsing now lives in `temporal`. This module is kept so the
+# imports from `hyperform.ftypes.date` keep working.
+from .temporal import type_date
 
 
 __all__ = ("type_date", )
-
-
-def type_date(value):
-    try:
-        ldt = [int(f) for f in value.split("-")]
-        return datetime.date(*ldt)
-    except (ValueError, TypeError):
-        return None
@@ -1,10 +1,196 @@
-from email_validator import validate_email
+from collections import OrderedDict, namedtuple
+from concurrent.futures import Future
+import threading
+import time
 
+from email_validator import EmailUndeliverableError, validate_email
 
-__all__ = ("type_email", )
+try:
+    from email_validator.deliverability import validate_email_deliverability
+except ImportError:  # pragma: no cover
+    # email-validator < 2.0
+    from email_validator import validate_email_deliverability
 
+from .cache import cached_type
 
-def type_email(value, check_dns=False, allow_smtputf8=False):
+
+__all__ = (
+    "DeliverabilityCache",
+    "DeliverabilityCacheInfo",
+    "check_deliverability",
+    "deliverability_cache",
+    "type_email",
+)
+
+
+DeliverabilityCacheInfo = namedtuple("DeliverabilityCacheInfo", (
+    "hits",
+    "misses",
+    "evictions",
+    "maxsize",
+    "currsize",
+))
+
+
+def check_deliverability(domain, domain_i18n):
+    """The default resolver of `DeliverabilityCache`. Checks that the domain
+    has a MX record (or an A/AAAA record as fallback) using email-validator.
+
+    Returns `True` if the domain can receive emails, `False` if it can't, and
+    `None` if it isn't known, for example, because the DNS lookup timed out.
+    """
+    try:
+        info = validate_email_deliverability(domain, domain_i18n)
+    except EmailUndeliverableError:
+        return False
+    if info and info.get("unknown-deliverability"):
+        return None
+    return True
+
+
+class DeliverabilityCache(object):
+    """A thread-safe cache of the deliverability of email domains, so the
+    DNS lookup of `type_email(check_dns=True)` is done once per domain instead
+    of once per submission.
+
+    The results are kept for `ttl` seconds, or `negative_ttl` seconds for the
+    domains that can't receive emails, up to `maxsize` domains. When full, the
+    least recently used domain is evicted. The concurrent checks of a domain
+    that isn't in the cache wait for a single lookup.
+
+    resolver (callable):
+        Called with the ASCII and the internationalized form of the domain, must
+        return `True`, `False`, or `None` if the deliverability is unknown
+        (these results are not cached). By default, `check_deliverability`.
+
+    >>> cache = DeliverabilityCache(lambda domain, domain_i18n: domain != "nope.test")
+    >>> cache.check("example.com"), cache.check("example.com"), cache.check("nope.test")
+    (True, True, False)
+    >>> cache.cache_info()
+    DeliverabilityCacheInfo(hits=1, misses=2, evictions=0, maxsize=1024, currsize=2)
+
+    """
+
+    __slots__ = (
+        "resolver",
+        "maxsize",
+        "ttl",
+        "negative_ttl",
+        "clock",
+        "hits",
+        "misses",
+        "evictions",
+        "_entries",
+        "_inflight",
+        "_lock",
+    )
+
+    def __init__(
+        self,
+        resolver=check_deliverability,
+        *,
+        maxsize=1024,
+        ttl=3600,
+        negative_ttl=300,
+        clock=time.monotonic,
+    ):
+        self.resolver = resolver
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._inflight = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def check(self, domain, domain_i18n=None):
+        """Returns `False` if the domain can't receive emails, and `True` otherwise.
+        """
+        domain = domain.lower()
+        with self._lock:
+            deliverable = self._get(domain)
+            if deliverable is not None:
+                self.hits += 1
+                return deliverable
+
+            future = self._inflight.get(domain)
+            if future is not None:
+                self.hits += 1
+                owner = False
+            else:
+                self.misses += 1
+                future = self._inflight[domain] = Future()
+                owner = True
+
+        if not owner:
+            return future.result()
+
+        try:
+            deliverable = self.resolver(domain, domain_i18n or domain)
+        except BaseException as error:
+            with self._lock:
+                del self._inflight[domain]
+            future.set_exception(error)
+            raise
+
+        with self._lock:
+            del self._inflight[domain]
+            if deliverable is not None:
+                self._set(domain, deliverable)
+        future.set_result(deliverable is not False)
+        return deliverable is not False
+
+    def cache_info(self):
+        with self._lock:
+            return DeliverabilityCacheInfo(
+                self.hits,
+                self.misses,
+                self.evictions,
+                self.maxsize,
+                len(self._entries),
+            )
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    # Private
+
+    def _get(self, domain):
+        entry = self._entries.get(domain)
+        if entry is None:
+            return None
+        deliverable, expires = entry
+        if expires <= self.clock():
+            del self._entries[domain]
+            return None
+        self._entries.move_to_end(domain)
+        return deliverable
+
+    def _set(self, domain, deliverable):
+        ttl = self.ttl if deliverable else self.negative_ttl
+        if ttl <= 0 or self.maxsize <= 0:
+            return
+        self._entries[domain] = (deliverable, self.clock() + ttl)
+        self._entries.move_to_end(domain)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+
+# Shared by all the calls to `type_email` without their own cache.
+deliverability_cache = DeliverabilityCache()
+
+
+@cached_type(unless="check_dns")
+def type_email(value, check_dns=False, allow_smtputf8=False, dns_cache=None):
     """Validates and normalize an email address using the
     JoshData/python-email-validator library.
 
@@ -34,13 +220,23 @@ def type_email(value, check_dns=False, allow_smtputf8=False):
             [SMTPUTF8 (RFC 6531)](https://tools.ietf.org/html/rfc6531) extension.
             By default this is set to `False`.
 
+        dns_cache (DeliverabilityCache|None):
+            The cache used to remember which domains can receive emails, when
+            `check_dns` is `True`. By default, the shared `deliverability_cache`.
+
     """
     try:
         v = validate_email(
             value,
-            check_deliverability=check_dns,
+            check_deliverability=False,
             allow_smtputf8=allow_smtputf8,
         )
-        return v["email"]
     except (ValueError, TypeError):
         return None
+
+    if check_dns and v.ascii_domain:
+        if dns_cache is None:
+            dns_cache = deliverability_cache
+        if not dns_cache.check(v.ascii_domain, v.domain):
+            return None
+    return v["email"]
@@ -1,9 +1,12 @@
 from slugify import slugify
 
+from .cache import cached_type
+
 
 __all__ = ("type_slug", )
 
 
+@cached_type
 def type_slug(
     value,
     max_length=0,
@@ -0,0 +1,240 @@
+import datetime
+from functools import lru_cache
+import re
+
+try:
+    import zoneinfo
+except ImportError:  # pragma: no cover
+    try:
+        from backports import zoneinfo
+    except ImportError:
+        zoneinfo = None
+
+
+__all__ = (
+    "format_date",
+    "format_month",
+    "format_time",
+    "get_timezone",
+    "type_date",
+    "type_date_many",
+    "type_datetime",
+    "type_datetime_many",
+    "type_time",
+    "type_time_many",
+)
+
+rx_noon = re.compile(r"^12\s*m?$", re.IGNORECASE)
+rx_time = re.compile(
+    r"^(?P<hour>[0-9]{1,2})(:(?P<minute>[0-9]{1,2}))?"
+    r"(:(?P<second>[0-9]{1,2}))?\s*(?P<tt>am|pm)?$",
+    re.IGNORECASE,
+)
+
+# Python < 3.7 doesn't have `fromisoformat`, so it always uses the general grammar
+HAS_FROMISOFORMAT = hasattr(datetime.date, "fromisoformat")
+
+
+def type_date(value):
+    """Parses a date in a `YYYY-MM-dd` format. The month and the day can have
+    one or two digits. Returns `None` if the date is invalid.
+    """
+    # Fast path for the format sent by the browsers
+    if HAS_FROMISOFORMAT and is_iso_date(value):
+        try:
+            return datetime.date.fromisoformat(value)
+        except ValueError:
+            pass
+
+    try:
+        ldt = [int(f) for f in value.split("-")]
+        return datetime.date(*ldt)
+    except (ValueError, TypeError):
+        return None
+
+
+def type_time(value):
+    """Parses a time in a 12-hours or 24-hours format, seconds optional.
+    Examples: "16:20", "4:20 pm", "4:20:16 p.m.", "12m".
+    Returns `None` if the time is invalid.
+    """
+    # Fast path for the format sent by the browsers
+    if HAS_FROMISOFORMAT and is_iso_time(value):
+        try:
+            return datetime.time.fromisoformat(value)
+        except ValueError:
+            pass
+
+    if rx_noon.match(value):
+        return datetime.time(12, 0, 0)
+
+    value = value.upper()
+    value = value.replace("P.M.", "PM").replace("A.M.", "AM")
+    match = rx_time.match(value)
+    if not match:
+        return None
+
+    gd = match.groupdict()
+    hour = int(gd["hour"])
+    minute = int(gd["minute"] or 0)
+    second = int(gd["second"] or 0)
+    if gd["tt"] == "PM":
+        hour += 12
+
+    try:
+        return datetime.time(hour, minute, second)
+    except (ValueError, TypeError):
+        return None
+
+
+def type_datetime(value, tz=None):
+    """Parses a date and a time separated by a space, like "2019-09-08 16:34"
+    or "1980-07-28 5:03 AM". The time is optional.
+    Returns `None` if the date or the time are invalid.
+
+    Options:
+
+        tz (str|tzinfo|None):
+            The timezone of the value, as an IANA name like "America/Lima" or
+            as a `tzinfo`. If used, the returned datetime is timezone-aware.
+
+    """
+    dt = None
+    # Fast path for the format sent by the browsers
+    if HAS_FROMISOFORMAT and is_iso_datetime(value):
+        try:
+            dt = datetime.datetime.fromisoformat(value)
+        except ValueError:
+            pass
+
+    if dt is None:
+        if " " not in value:
+            value += " 00:00"  # So it always has a time
+        date_part, time_part = value.split(" ", maxsplit=1)
+        date = type_date(date_part)
+        time = type_time(time_part)
+        if date is None or time is None:
+            return None
+        dt = datetime.datetime.combine(date, time)
+
+    if tz is not None:
+        dt = dt.replace(tzinfo=get_timezone(tz))
+    return dt
+
+
+def type_date_many(values):
+    """Like `type_date()`, but for a collection of values.
+    The repeated values are parsed only once.
+    """
+    return parse_many(type_date, values)
+
+
+def type_time_many(values):
+    """Like `type_time()`, but for a collection of values.
+    The repeated values are parsed only once.
+    """
+    return parse_many(type_time, values)
+
+
+def type_datetime_many(values, tz=None):
+    """Like `type_datetime()`, but for a collection of values.
+    The repeated values are parsed only once.
+
+    >>> type_datetime_many(["2019-09-08 16:34", "nope", "2019-09-08 16:34"])
+    [datetime.datetime(2019, 9, 8, 16, 34), None, datetime.datetime(2019, 9, 8, 16, 34)]
+
+    """
+    if tz is not None:
+        tz = get_timezone(tz)
+    return parse_many(type_datetime, values, tz=tz)
+
+
+def format_date(value):
+    """Formats a date, or datetime, as `YYYY-MM-dd`, like
+    `value.strftime("%Y-%m-%d")` but without the locale lookup.
+    The year is always padded to four digits.
+    """
+    return "%04d-%02d-%02d" % (value.year, value.month, value.day)
+
+
+def format_month(value):
+    """Formats a date, or datetime, as `YYYY-MM`.
+    """
+    return "%04d-%02d" % (value.year, value.month)
+
+
+def format_time(value):
+    """Formats a time, or datetime, in a 12-hours format, as `H:mm:ss AM/PM`,
+    or `H:mm AM/PM` if the seconds are zero. This is one of the formats
+    parsed by `type_time()`.
+
+    >>> format_time(datetime.time(16, 20)), format_time(datetime.time(4, 20, 16))
+    ('4:20 PM', '4:20:16 AM')
+
+    """
+    hour = value.hour
+    meridiem = "PM" if hour >= 12 else "AM"
+    if hour > 12:
+        hour -= 12
+    if value.second:
+        return "%d:%02d:%02d %s" % (hour, value.minute, value.second, meridiem)
+    return "%d:%02d %s" % (hour, value.minute, meridiem)
+
+
+@lru_cache(maxsize=None)
+def _get_zone(key):
+    if zoneinfo is None:  # pragma: no cover
+        raise ImportError(
+            "Using timezone names requires Python 3.9+ or `backports.zoneinfo`."
+        )
+    return zoneinfo.ZoneInfo(key)
+
+
+def get_timezone(tz):
+    """Returns the `tzinfo` for an IANA timezone name, like "America/Lima",
+    cached so it's only loaded once. A `tzinfo` is returned as is.
+    """
+    if isinstance(tz, datetime.tzinfo):
+        return tz
+    return _get_zone(tz)
+
+
+def is_iso_date(value):
+    """`YYYY-MM-dd`. Only with this shape `date.fromisoformat()` parses
+    the same dates as the general grammar.
+    """
+    return len(value) == 10 and value[4] == "-" and value[7] == "-"
+
+
+def is_iso_time(value):
+    """`HH:mm` or `HH:mm:ss`, but not midnight as "24:00", that
+    some versions of `time.fromisoformat()` accept.
+    """
+    size = len(value)
+    return (
+        (size == 5 or (size == 8 and value[5] == ":"))
+        and value[2] == ":"
+        and value[:2] != "24"
+    )
+
+
+def is_iso_datetime(value):
+    """`YYYY-MM-dd HH:mm` or `YYYY-MM-dd HH:mm:ss`.
+    """
+    return (
+        len(value) in (16, 19)
+        and value[10] == " "
+        and is_iso_date(value[:10])
+        and is_iso_time(value[11:])
+    )
+
+
+def parse_many(parse, values, **options):
+    parsed = {}
+    result = []
+    for value in values:
+        pyvalue = parsed.get(value, parsed)
+        if pyvalue is parsed:
+            pyvalue = parsed[value] = parse(value, **options)
+        result.append(pyvalue)
+    return result
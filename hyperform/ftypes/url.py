@@ -3,14 +3,23 @@ from urllib.parse import urlsplit, urlunsplit
 
 import idna
 
+from .cache import cached_type
 
-__all__ = ("type_url", )
+
+__all__ = ("type_url", "type_url_many", )
 
 rx_scheme = re.compile(r"^[a-z]{3,7}://[^/]")
 rx_url = r"^([a-z]{3,7}://)?([^./:][^/:]+[^./:]%s|([0-9]{1,3}\.){3}[0-9]{1,3})(:[0-9]+)?(\/.*)?$"  # noqa: E501
 rx_tld = r"\.[a-z]{2,10}"
 
+rx_url_without_tld = re.compile(rx_url % "", re.IGNORECASE)
+rx_url_with_tld = re.compile(rx_url % rx_tld, re.IGNORECASE)
+
+# Possible typos of the scheme
+TYPOS = ("http//", "http:")
+
 
+@cached_type
 def type_url(value, require_tld=False):
     """Validates and normalize an URL address.
 
@@ -32,13 +41,36 @@ def type_url(value, require_tld=False):
             `localhost`.
 
     """
-    rx = re.compile(rx_url % (rx_tld if require_tld else ""), re.IGNORECASE)
+    return normalize_url(value, rx_url_with_tld if require_tld else rx_url_without_tld)
+
+
+def type_url_many(values, require_tld=False):
+    """Like `type_url()`, but for a collection of values. Returns a list with
+    the normalized URLs, or `None` for the invalid ones.
+
+    The repeated values are normalized only once.
+
+    >>> type_url_many(["example.com", "nope..com", "example.com"])
+    ['http://example.com', None, 'http://example.com']
+
+    """
+    rx = rx_url_with_tld if require_tld else rx_url_without_tld
+    normalized = {}
+    result = []
+    for value in values:
+        url = normalized.get(value, normalized)
+        if url is normalized:
+            url = normalized[value] = normalize_url(value, rx)
+        result.append(url)
+    return result
+
+
+def normalize_url(value, rx):
     if not rx.match(value):
         return None
 
     if not rx_scheme.match(value):
-        # Check for possible typos
-        if value.startswith(("http//", "http:/", "http:///", "http:")):
+        if value.startswith(TYPOS):
             return None
         value = "http://" + value
 
@@ -47,9 +79,24 @@ def type_url(value, require_tld=False):
     if ".." in domain or "//" in domain:
         return None
 
-    try:
-        domain = idna.uts46_remap(domain, std3_rules=False, transitional=False)
-    except idna.IDNAError:  # pragma: no cover
+    domain = normalize_domain(domain)
+    if domain is None:
         return None
 
     return urlunsplit((scheme, domain, path, query, fragment))
+
+
+def normalize_domain(domain):
+    try:
+        domain.encode("ascii")
+    except UnicodeEncodeError:
+        pass
+    else:
+        # For ASCII characters, and without the STD3 rules, the UTS-46
+        # mapping just lowercases the letters.
+        return domain.lower()
+
+    try:
+        return idna.uts46_remap(domain, std3_rules=False, transitional=False)
+    except idna.IDNAError:  # pragma: no cover
+        return None
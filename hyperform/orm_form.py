@@ -1,4 +1,8 @@
+from functools import lru_cache
+import threading
+
 from .form import Form
+from .sqla import get_max_params
 
 
 __all__ = ("PonyForm", "SQLAForm")
@@ -12,14 +16,209 @@ class PonyForm(Form):
         return self._object.delete()
 
 
+# The `SaveContext` of the `SQLAForm.save()` running in each thread
+_local = threading.local()
+
+
+class SaveContext(object):
+    """The database work delayed until the end of a `SQLAForm.save()`,
+    including the saves of the forms in its formsets.
+    """
+
+    __slots__ = ("sessions", "deleted")
+
+    def __init__(self):
+        # The sessions to flush
+        self.sessions = []
+        # The objects to delete, by `(session, model)`
+        self.deleted = {}
+
+    def add_session(self, session):
+        if not any(sess is session for sess in self.sessions):
+            self.sessions.append(session)
+
+    def finish(self):
+        # The deletes run before the flush, as they did with a flush per
+        # row, so a new row can take the unique value of a deleted one.
+        for (session, model), objects in self.deleted.items():
+            delete_many(session, model, objects)
+        for session in self.sessions:
+            session.flush()
+
+
 class SQLAForm(Form):
+    def save(self, **data):
+        """Saves the form, and the forms of its formsets, flushing the session
+        only once at the end, so SQLAlchemy can send the inserts of each table
+        together instead of one round trip per row.
+
+        The exception is a formset with a `backref` to a column, like
+        `owner_id`, instead of a relationship: the parent object is flushed
+        first, to get its generated primary key.
+
+        The deleted objects are also grouped by model and deleted with one
+        `DELETE ... WHERE id IN (...)` per model, before the flush. A bulk
+        delete doesn't go through the unit of work, so the models with
+        `before_delete` or `after_delete` listeners, or with relationships
+        SQLAlchemy would have to update or cascade the delete to, are still
+        deleted with `session.delete()`.
+        """
+        if getattr(_local, "context", None) is not None:
+            # The save of a form in a formset
+            return super().save(**data)
+
+        _local.context = context = SaveContext()
+        try:
+            obj = super().save(**data)
+        finally:
+            _local.context = None
+
+        context.finish()
+        return obj
+
+    @classmethod
+    def load_options(cls):
+        """Returns the `selectinload()` options to load, with the object of the
+        form, the related objects of its formsets, and of the formsets of those
+        forms, and so on. That way, loading the object for editing makes one
+        query per formset instead of one for each object with a formset.
+        For example: `select(Person).options(*PersonForm.load_options())`.
+
+        Formsets that are not relationships of the model are ignored.
+        """
+        from sqlalchemy.orm import selectinload
+
+        return get_load_options(cls, selectinload)
+
     def create_object(self, data):
         object = self._model(**data)
         self._session.add(object)
-        self._session.flush()
+        context = getattr(_local, "context", None)
+        if context is None:
+            self._session.flush()
+        else:
+            context.add_session(self._session)
+        return object
+
+    def update_object(self, data):
+        object = super().update_object(data)
+        context = getattr(_local, "context", None)
+        if context is not None:
+            context.add_session(self._session)
         return object
 
     def delete_object(self):
+        context = getattr(_local, "context", None)
+        if (
+            context is not None
+            and can_delete_many(self._model)
+            and not has_delete_listeners(self._model)
+        ):
+            key = (self._session, self._model)
+            context.deleted.setdefault(key, []).append(self._object)
+            context.add_session(self._session)
+            return None
+
         result = self._session.delete(self._object)
-        self._session.flush()
+        if context is None:
+            self._session.flush()
+        else:
+            context.add_session(self._session)
         return result
+
+    def _get_backref_value(self, formset, obj):
+        model = formset.FormClass._model
+        if model is None or is_relationship(model, formset.backref):
+            return obj
+
+        from sqlalchemy import inspect
+
+        state = inspect(obj)
+        if state.identity is None:
+            self._session.flush()
+        identity = state.identity
+        return identity[0] if len(identity) == 1 else identity
+
+
+@lru_cache(maxsize=None)
+def is_relationship(model, name):
+    from sqlalchemy import inspect
+
+    return name in inspect(model).relationships
+
+
+def get_load_options(FormClass, selectinload):
+    """The chains of `selectinload` options for the formsets of `FormClass`.
+    `selectinload` is the function, or the method of the parent option,
+    to add the options for each relationship.
+    """
+    model = FormClass._model
+    options = []
+    if model is None:
+        return options
+
+    for name, formset in FormClass._formset_specs:
+        if not is_relationship(model, name):
+            continue
+        option = selectinload(getattr(model, name))
+        nested = get_load_options(formset.FormClass, option.selectinload)
+        options.extend(nested or [option])
+    return options
+
+
+@lru_cache(maxsize=None)
+def can_delete_many(model):
+    """If the rows of the model can be deleted with a bulk `DELETE`, without
+    going through the unit of work. Only for models with a single-column primary
+    key, without inheritance, and without relationships to other models that
+    SQLAlchemy would have to update or cascade the delete to.
+    """
+    from sqlalchemy import inspect
+    from sqlalchemy.orm import MANYTOONE
+
+    mapper = inspect(model)
+    return (
+        len(mapper.primary_key) == 1
+        and mapper.inherits is None
+        and not mapper.polymorphic_map
+        and all(
+            rel.direction is MANYTOONE and not rel.cascade.delete
+            for rel in mapper.relationships
+        )
+    )
+
+
+def has_delete_listeners(model):
+    """If the mapper of the model has `before_delete` or `after_delete`
+    listeners, which a bulk `DELETE` would skip. Not cached, because the
+    listeners can be added at any time.
+    """
+    from sqlalchemy import inspect
+
+    dispatch = inspect(model).dispatch
+    return bool(dispatch.before_delete) or bool(dispatch.after_delete)
+
+
+def delete_many(session, model, objects):
+    """Deletes the objects with one `DELETE ... WHERE id IN (...)` per chunk
+    of `get_max_params()` objects, and removes them from the session.
+    """
+    from sqlalchemy import delete, inspect
+
+    mapper = inspect(model)
+    pk = mapper.primary_key[0]
+    # The identity doesn't need to load the expired objects
+    ids = [inspect(obj).identity[0] for obj in objects]
+
+    size = get_max_params(session, mapper)
+
+    # The pending objects are flushed after the deletes, as they would
+    # have been with a flush per row.
+    with session.no_autoflush:
+        for start in range(0, len(ids), size):
+            stmt = delete(model).where(pk.in_(ids[start:start + size]))
+            session.execute(stmt.execution_options(synchronize_session=False))
+
+    for obj in objects:
+        if obj in session:
+            session.expunge(obj)
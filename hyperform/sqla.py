@@ -0,0 +1,19 @@
+"""Helpers for the queries to SQLAlchemy sessions, shared by the `SQLAForm`
+and the `Unique` validator.
+"""
+
+# Maximum number of bound parameters in a statement, by dialect name
+MAX_PARAMS = {
+    "sqlite": 999,
+    "mssql": 2000,
+    "oracle": 1000,
+}
+DEFAULT_MAX_PARAMS = 10000
+
+
+def get_max_params(session, mapper):
+    """The maximum number of bound parameters in a statement, for the
+    database of the mapper in that session.
+    """
+    dialect = session.get_bind(mapper=mapper).dialect
+    return MAX_PARAMS.get(dialect.name, DEFAULT_MAX_PARAMS)
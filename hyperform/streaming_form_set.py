@@ -0,0 +1,276 @@
+import sys
+
+from .constants import DELETED, ID, NEW, SEP
+from .utils import InputIndex, get_object_value
+
+
+__all__ = ("StreamingFormSet", "StreamSummary")
+
+
+class StreamSummary(object):
+    """The result of processing the rows of a `StreamingFormSet`.
+
+    The error messages of the rows that didn't validate are stored in `errors`,
+    grouped by their prefix, up to `max_errors` rows. The rest are only
+    counted in `invalid`.
+    """
+
+    __slots__ = (
+        "created",
+        "updated",
+        "deleted",
+        "unchanged",
+        "invalid",
+        "errors",
+        "max_errors",
+    )
+
+    def __init__(self, max_errors=None):
+        self.created = 0
+        self.updated = 0
+        self.deleted = 0
+        self.unchanged = 0
+        self.invalid = 0
+        self.errors = {}
+        self.max_errors = max_errors
+
+    def __repr__(self):
+        return (
+            f"StreamSummary(created={self.created}, updated={self.updated}, "
+            f"deleted={self.deleted}, unchanged={self.unchanged}, "
+            f"invalid={self.invalid})"
+        )
+
+    @property
+    def is_valid(self):
+        return self.invalid == 0
+
+    def add_error(self, prefix, errors):
+        self.invalid += 1
+        if self.max_errors is None or len(self.errors) < self.max_errors:
+            self.errors[prefix] = errors
+
+
+class StreamingFormSet(object):
+    """A formset for collections too large to keep in memory, like bulk-edit
+    screens with tens of thousands of rows.
+
+    Unlike a `FormSet`, it isn't declared inside a form and it has no
+    `HARD_MAX_NUM` limit. The objects are read from an iterator and the rows
+    are validated, and saved, in chunks of `chunk_size`, so only one chunk of
+    forms is alive at any time.
+
+    The prefixes of the rows aren't collected either. The rows of the objects
+    are the ones with their `id`, and the new rows, the ones with a "_NEW"
+    prefix, are found in a second pass over the input data. The rows with
+    an `id` that isn't in the objects are ignored.
+
+    The batch validators, like `Unique`, check the values of all the rows of a
+    chunk together. Only when saving, the values repeated in different chunks
+    are found, because the rows of the previous chunks are already saved.
+
+    name (str):
+        The name used to prefix the fields, like the name of a formset in a form.
+        Eg: "rows" for "rows--123--title".
+
+    chunk_size (int):
+        Number of rows validated, and saved, at once.
+
+    max_chunk_bytes (int|None):
+        Memory ceiling of a chunk. The chunk is validated, and saved, as soon
+        as the size of the input values of its rows reaches this number of
+        bytes, even if it has less than `chunk_size` rows. The size is an
+        estimate: the length of the strings and bytes, and `sys.getsizeof()`
+        of the rest, like the uploaded files.
+
+    max_errors (int|None):
+        Maximum number of rows with errors whose messages are kept in the summary.
+        The rest are only counted. With `None`, the messages of every invalid
+        row are kept, so the summary grows with the number of rows.
+
+    on_chunk (callable|None):
+        Called with the summary after each chunk is saved. Useful to flush or
+        commit a database session, or to report the progress.
+
+    """
+
+    __slots__ = (
+        "FormClass",
+        "prefix",
+        "backref",
+        "chunk_size",
+        "max_chunk_bytes",
+        "max_errors",
+        "can_delete",
+        "can_create",
+        "on_chunk",
+    )
+
+    def __init__(
+        self,
+        FormClass,
+        *,
+        name,
+        backref=None,
+        chunk_size=100,
+        max_chunk_bytes=None,
+        max_errors=100,
+        can_delete=True,
+        can_create=True,
+        on_chunk=None,
+    ):
+        assert chunk_size > 0, "`chunk_size` must be a positive number."
+        self.FormClass = FormClass
+        self.prefix = name + SEP
+        self.backref = backref
+        self.chunk_size = chunk_size
+        self.max_chunk_bytes = max_chunk_bytes
+        self.max_errors = max_errors
+        self.can_delete = can_delete
+        self.can_create = can_create
+        self.on_chunk = on_chunk
+
+    def validate(self, input_data, objects_data=None, file_data=None):
+        """Validates all the rows without saving them.
+        Returns a `StreamSummary`.
+        """
+        return self._process(input_data, objects_data, file_data, save=False)
+
+    def save(self, input_data, objects_data=None, file_data=None, *, parent=None):
+        """Validates and saves the rows, one chunk at the time.
+        The invalid rows are skipped and reported in the returned `StreamSummary`.
+        """
+        data = {self.backref: parent} if self.backref else {}
+        return self._process(input_data, objects_data, file_data, save=True, data=data)
+
+    # Private
+
+    def _process(self, input_data, objects_data, file_data, *, save, data=None):
+        if not isinstance(input_data, InputIndex):
+            input_data = InputIndex(input_data)
+        summary = StreamSummary(max_errors=self.max_errors)
+        chunk = []
+        chunk_bytes = 0
+
+        for form in self._iter_forms(input_data, objects_data, file_data):
+            chunk.append(form)
+            if self.max_chunk_bytes is not None:
+                chunk_bytes += get_input_size(form)
+            if len(chunk) >= self.chunk_size or (
+                self.max_chunk_bytes is not None
+                and chunk_bytes >= self.max_chunk_bytes
+            ):
+                self._process_chunk(chunk, summary, save, data)
+                chunk = []
+                chunk_bytes = 0
+
+        if chunk:
+            self._process_chunk(chunk, summary, save, data)
+        return summary
+
+    def _iter_forms(self, input_data, objects_data, file_data):
+        for object in objects_data or ():
+            obj_id = get_object_value(object, "id")
+            assert obj_id, "Object in a FormSet must have an `id` attribute."
+            form = self.FormClass(
+                input_data,
+                object,
+                file_data,
+                prefix=f"{self.prefix}{obj_id}",
+                can_delete=self.can_delete,
+            )
+            # The batch validators run once for all the forms of the chunk
+            form._defer_batch = True
+            yield form
+
+        if not self.can_create:
+            return
+        for prefix in self._iter_new_prefixes(input_data):
+            form = self.FormClass(input_data, file_data=file_data, prefix=prefix)
+            form._defer_batch = True
+            yield form
+
+    def _iter_new_prefixes(self, input_data):
+        """Yields the prefix of each new row once, without keeping the ones
+        already seen: a row is yielded at the key of its first field in the
+        input data (or of its `_ID` or `_DELETED` values).
+
+        Only the rows without any of those, with just the values of their
+        nested formsets, are yielded at their first key and remembered.
+        """
+        new_prefix = self.prefix + NEW
+        start = len(self.prefix)
+        suffixes = [SEP + name for name in self.FormClass._fields]
+        suffixes.extend((SEP + ID, SEP + DELETED))
+        nested_only = set()
+
+        for key in input_data:
+            if not key.startswith(new_prefix):
+                continue
+            row_id = key[start:].split(SEP, 1)[0].split(".", 1)[0]
+            prefix = self.prefix + row_id
+            for suffix in suffixes:
+                if prefix + suffix in input_data:
+                    if key == prefix + suffix:
+                        yield prefix
+                    break
+            else:
+                if prefix not in nested_only:
+                    nested_only.add(prefix)
+                    yield prefix
+
+    def _process_chunk(self, chunk, summary, save, data):
+        results = [(form, form.validate()) for form in chunk]
+        if self.FormClass._batch_specs:
+            self._check_batch(results)
+
+        for form, form_data in results:
+            if not form._is_valid:
+                summary.add_error(form.prefix, form.get_errors())
+                continue
+
+            if form._deleted:
+                summary.deleted += 1
+            elif form._object is None:
+                summary.created += 1
+            elif form.updated_fields:
+                summary.updated += 1
+            else:
+                summary.unchanged += 1
+
+            if not save:
+                continue
+            if form._object is None:
+                form.save(**data)
+            else:
+                # The existing objects already belong to the parent
+                form.save()
+
+        if save and self.on_chunk:
+            self.on_chunk(summary)
+
+    def _check_batch(self, results):
+        """Runs the batch validators, like `Unique`, with the values of all
+        the valid forms of the chunk at once.
+        """
+        failed = self.FormClass._check_batch([
+            (form, form_data) for form, form_data in results if form_data
+        ])
+        for form in failed:
+            form._is_valid = False
+            form._valid_data = None
+            form.updated_fields = None
+
+
+def get_input_size(form):
+    """Estimates the size, in bytes, of the input values of the fields of
+    the form.
+    """
+    size = 0
+    for name in form._fields:
+        for value in getattr(form, name).input_values or ():
+            if isinstance(value, (str, bytes)):
+                size += len(value)
+            else:
+                size += sys.getsizeof(value)
+    return size
@@ -1,8 +1,21 @@
+from bisect import insort
+from functools import lru_cache
+import inspect
+from itertools import chain
 import re
 from xml.sax.saxutils import quoteattr
 
+from .constants import SEP
 
-__all__ = ("FakeMultiDict", "get_input_values", "get_object_value", "get_html_attrs", )
+
+__all__ = (
+    "FakeMultiDict",
+    "InputIndex",
+    "get_input_values",
+    "get_object_value",
+    "get_html_attrs",
+    "maybe_await",
+)
 
 
 class FakeMultiDict(dict):
@@ -10,6 +23,73 @@ class FakeMultiDict(dict):
         return []
 
 
+class InputIndex(object):
+    """Request-scoped index of the input data.
+
+    The first time a formset asks for its rows, the keys are read once and
+    the prefixes of the rows of every formset, nested or not, are collected in
+    a single pass. For example, "sections--1.tags--_NEW1--name" is a field of
+    the "sections--1.tags--_NEW1" row, of the "sections--1.tags--" formset, and
+    also adds the "sections--1" row to the "sections--" formset.
+
+    Forms without formsets never build the index: the values of the fields
+    are read directly from the input data.
+
+    Behaves like a MultiDict, so it can be used as the `input_data` of forms.
+
+    >>> index = InputIndex({"title": "x", "sections--_NEW1--title": "y"})
+    >>> index.getall("sections--_NEW1--title")
+    ['y']
+    >>> index.get_rows("sections--")
+    ['sections--_NEW1']
+
+    """
+
+    __slots__ = ("_data", "_rows")
+
+    def __init__(self, data=None):
+        self._data = {} if data is None else data
+        self._rows = None
+
+    @property
+    def data(self):
+        """The input data being indexed."""
+        return self._data
+
+    def __contains__(self, name):
+        return name in self._data
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def getall(self, name):
+        return get_input_values(self._data, name)
+
+    def get_rows(self, prefix):
+        """Returns the prefixes of the rows of the formset with that prefix, in
+        the order they appear in the input data.
+        """
+        if self._rows is None:
+            self._rows = index_rows(self._data)
+        return list(self._rows.get(prefix, ()))
+
+
+def index_rows(data):
+    rows = {}
+    for key in data:
+        row = key.rsplit(SEP, maxsplit=1)[0]
+        while SEP in row:
+            parent, _ = row.rsplit(SEP, maxsplit=1)
+            rows.setdefault(parent + SEP, {})[row] = None
+            if "." not in parent:
+                break
+            row = parent.rsplit(".", maxsplit=1)[0]
+    return rows
+
+
 def get_input_values(data, name):
     # - WebOb, Bottle, and Proper uses `getall`
     # - Django, Werkzeug, cgi.FieldStorage, etc. uses `getlist`
@@ -43,6 +123,10 @@ def get_object_value(obj, name):
 
 rx_spaces = re.compile(r"\s+")
 
+# Attributes that usually change on every render, or on every row of a
+# formset, so they are left out of the cache key.
+DYNAMIC_ATTRS = ("id", "name", "for", "value", "checked", "selected")
+
 
 def get_html_attrs(attrs=None, show_error=False):
     """Generate HTML attributes from the provided attributes.
@@ -67,28 +151,81 @@ def get_html_attrs(attrs=None, show_error=False):
 
     """
     attrs = attrs or {}
-    attrs_list = []
-    props_list = []
 
     classes = attrs.pop("classes", "")
     error_classes = attrs.pop("error", "error")
-    if show_error:
-        classes = classes + " " + error_classes
-    classes = classes.strip()
+    classes = normalize_classes(classes, error_classes if show_error else "")
+    if classes:
+        attrs["class"] = classes
+
+    # The serialization of the attributes that doesn't change between renders
+    # is cached, and the rest are inserted in their sorted positions.
+    static = []
+    dynamic = []
+    for key, value in attrs.items():
+        if key in DYNAMIC_ATTRS:
+            dynamic.append((key, value))
+        else:
+            static.append((key, type(value), str(value), value))
 
-    classes_list = rx_spaces.split(classes) if classes else []
-    if classes_list:
-        attrs["class"] = " ".join(classes_list)
+    attrs_list, props_list = get_static_html_attrs(static)
+    for key, value in dynamic:
+        key = key.replace("_", "-")
+        if value is True:
+            insort(props_list, key)
+        elif value not in (False, None):
+            insort(attrs_list, "{}={}".format(key, quoteattr(str(value))))
 
-    for key, value in attrs.items():
+    return " ".join(chain(attrs_list, props_list))
+
+
+@lru_cache(maxsize=1024)
+def normalize_classes(classes, error_classes):
+    """Joins the classes and the error classes, collapsing the whitespace."""
+    classes = (classes + " " + error_classes).strip()
+    return " ".join(rx_spaces.split(classes)) if classes else ""
+
+
+def get_static_html_attrs(static):
+    """Returns lists of the serialized attributes and properties of the
+    `static` items, from the cache if all the values are hashable.
+    """
+    if not static:
+        return [], []
+    try:
+        attrs_list, props_list = compile_html_attrs(tuple(static))
+    except TypeError:  # Unhashable values
+        attrs_list, props_list = compile_html_attrs.__wrapped__(static)
+    return list(attrs_list), list(props_list)
+
+
+@lru_cache(maxsize=4096)
+def compile_html_attrs(items):
+    """Serializes `(key, type, str(value), value)` items, returning the sorted
+    attributes and the sorted properties. The type and the string are part
+    of the items so values that are equal, like `1` and `True`, or `0.0` and
+    `-0.0`, are not cached as the same.
+    """
+    attrs_list = []
+    props_list = []
+
+    for key, _, str_value, value in items:
         key = key.replace("_", "-")
         if value is True:
             props_list.append(key)
         elif value not in (False, None):
-            value = quoteattr(str(value))
-            attrs_list.append("{}={}".format(key, value))
+            attrs_list.append("{}={}".format(key, quoteattr(str_value)))
 
     attrs_list.sort()
     props_list.sort()
-    attrs_list.extend(props_list)
-    return " ".join(attrs_list)
+    return tuple(attrs_list), tuple(props_list)
+
+
+async def maybe_await(value):
+    """Returns the result of `value` if it's awaitable, or `value` itself.
+    Used by the async validation to accept both sync and async
+    validators, `type` methods, and `clean` functions.
+    """
+    if inspect.isawaitable(value):
+        return await value
+    return value
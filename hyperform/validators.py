@@ -1,6 +1,8 @@
 from itertools import groupby
 import datetime
 
+from .sqla import get_max_params
+
 
 __all__ = (
     "After",
@@ -13,6 +15,7 @@ __all__ = (
     "LongerThan",
     "MoreThan",
     "ShorterThan",
+    "Unique",
 )
 
 
@@ -294,3 +297,69 @@ class ShorterThan(object):
             return len(value) <= self.length
 
         return validate_values(values, test, self.message)
+
+
+class Unique(object):
+    """Validates that the value isn't used by another row in the database,
+    nor by another form of the same formset.
+
+    This is a *batch* validator: instead of one query for each form, the
+    values of all the forms of a formset are checked together, with one
+    `... WHERE column IN (...)` query, after the other validations. The
+    values repeated in the same submission are found with a set.
+
+    The rows edited or deleted by the forms are ignored, because their value
+    in the database is being replaced.
+
+    Only SQLAlchemy is supported: there is no query for Pony entities.
+
+    column:
+        The column to check, as an attribute of a SQLAlchemy model, like
+        `User.email`.
+
+    session:
+        The session used for the query. By default, the `_session` of the
+        form. A `ValueError` is raised if there is neither.
+
+    message (str):
+        Error message to raise in case of a validation error.
+
+    """
+
+    batch = True
+    message = "This value is already in use."
+
+    def __init__(self, column, session=None, message=None):
+        self.column = column
+        self.session = session
+        if message is not None:
+            self.message = message
+
+    def find_used(self, values, exclude, form):
+        """Returns the values, of the list `values`, used by the rows that
+        aren't in `exclude`, a set of `(model, primary key)` tuples.
+        """
+        model = self.column.class_
+        rows = self._query_sqlalchemy(values, form)
+        return {value for pk, value in rows if (model, pk) not in exclude}
+
+    def _query_sqlalchemy(self, values, form):
+        from sqlalchemy import inspect, select
+
+        session = self.session or getattr(form, "_session", None)
+        if session is None:
+            raise ValueError(
+                "The Unique validator needs a session. Pass one as `session`,"
+                " or use it in a form with a `_session`."
+            )
+        mapper = inspect(self.column.class_)
+        pk = mapper.primary_key[0]
+        size = get_max_params(session, mapper)
+
+        rows = []
+        for start in range(0, len(values), size):
+            stmt = select(pk, self.column).where(
+                self.column.in_(values[start:start + size])
+            )
+            rows.extend(session.execute(stmt).all())
+        return rows
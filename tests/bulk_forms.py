@@ -0,0 +1,12 @@
+"""Forms for test_bulk.py, in their own module so the worker processes can
+import them by path.
+"""
+import hyperform as f
+
+
+class ContactForm(f.Form):
+    name = f.Text(required=True)
+    age = f.Integer(f.InRange(0, 120))
+
+    def clean_name(self, pyvalue):
+        return pyvalue.title()
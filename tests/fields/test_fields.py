@@ -356,6 +356,41 @@ def test_splitted_date_time_multiple_not_strict():
     assert field.error_value is None
 
 
+def test_date_time_fields_with_timezone():
+    field = f.DateTime(tz="America/Lima")
+    field.input_values = ["1973-09-11 5:34 AM"]
+    value = field.validate()
+    assert value.replace(tzinfo=None) == datetime(1973, 9, 11, 5, 34)
+    assert str(value.tzinfo) == "America/Lima"
+
+    field = f.SplittedDateTime(tz="America/Lima")
+    field.input_values = ["1973-09-11", "5:34 AM"]
+    assert field.validate() == value
+
+
+def test_prepared_values_are_memoized():
+    calls = []
+
+    def prepare(object_value):
+        calls.append(object_value)
+        return [str(object_value)]
+
+    field = f.Text(prepare=prepare)
+    field.load_data(object_value=1)
+    assert field.values == ["1"]
+    assert field.value == "1"
+    assert field.get_value(0) == "1"
+    assert calls == [1]
+
+    field.load_data(object_value=2)
+    assert field.values == ["2"]
+    assert calls == [1, 2]
+
+    field.load_data(input_values=["3"], object_value=2)
+    assert field.values == ["3"]
+    assert calls == [1, 2]
+
+
 def test_splitted_fields_cannot_be_a_collection():
     with pytest.raises(AssertionError):
         f.SplittedDateTime(collection=True)
@@ -374,3 +409,47 @@ def test_splitted_fields_take_all_values():
     field.input_values = ["a", "b", "c", "d"]
     assert field.validate() == "a"
     assert field.called_with == ["a", "b", "c", "d"]
+
+
+@pytest.mark.parametrize("Field", [
+    f.Boolean, f.Date, f.DateTime, f.Email, f.File, f.Float, f.HexColor,
+    f.Integer, f.Month, f.Password, f.Slug, f.SplittedDateTime, f.Text,
+    f.Time, f.URL,
+])
+def test_fields_are_slotted(Field):
+    field = Field()
+    assert not hasattr(field, "__dict__")
+
+
+def test_bound_fields_share_the_spec():
+    field = f.Text(required=True, min_num=2)
+    bound1 = field._bind("a")
+    bound2 = field._bind("b")
+
+    assert bound1._spec is field._spec
+    assert bound2._spec is field._spec
+
+    bound1.input_values = ["foo"]
+    assert bound1.validate() is None
+    assert bound1.error == "You need at least 2 values."
+    assert bound2.error is None
+    assert field.error is None
+
+
+def test_field_spec_is_shared_not_modified():
+    field = f.Text(required=True)
+    bound = field._bind("a")
+    bound.required = False
+    assert field._spec.required
+    assert field.required
+    assert field._bind("b").required
+
+
+def test_bind_keeps_attributes_of_not_slotted_subclasses():
+    class MyField(f.Text):
+        def __init__(self, *args, choices=(), **kwargs):
+            super().__init__(*args, **kwargs)
+            self.choices = choices
+
+    field = MyField(choices=("a", "b"))
+    assert field._bind("meh").choices == ("a", "b")
@@ -1,4 +1,9 @@
+import random
+import re
+from xml.sax.saxutils import quoteattr
+
 import hyperform.fields as f
+from hyperform.utils import compile_html_attrs, get_html_attrs
 
 
 def test_render_attrs():
@@ -64,3 +69,78 @@ def test_render_error():
         str(field.render_error(classes="errorMessage"))
         == f'<div class="errorMessage">{error}</div>'
     )
+
+
+def old_get_html_attrs(attrs=None, show_error=False):
+    """The original implementation, without caching."""
+    attrs = attrs or {}
+    attrs_list = []
+    props_list = []
+
+    classes = attrs.pop("classes", "")
+    error_classes = attrs.pop("error", "error")
+    if show_error:
+        classes = classes + " " + error_classes
+    classes = classes.strip()
+
+    classes_list = re.split(r"\s+", classes) if classes else []
+    if classes_list:
+        attrs["class"] = " ".join(classes_list)
+
+    for key, value in attrs.items():
+        key = key.replace("_", "-")
+        if value is True:
+            props_list.append(key)
+        elif value not in (False, None):
+            value = quoteattr(str(value))
+            attrs_list.append("{}={}".format(key, value))
+
+    attrs_list.sort()
+    props_list.sort()
+    attrs_list.extend(props_list)
+    return " ".join(attrs_list)
+
+
+def test_get_html_attrs_same_as_old_implementation():
+    rnd = random.Random(5)
+    keys = [
+        "id", "name", "type", "value", "checked", "selected", "required",
+        "data_id", "data-id", "placeholder", "class", "classes", "error", "for",
+        "value_x", "aria_label",
+    ]
+    values = [
+        True, False, None, 0, 1, 1.0, 0.0, -0.0, "", "x", "a b", "  a   b ",
+        'say "hi"', "it's", "<&>", "\n", ["unhashable"],
+    ]
+    for _ in range(3000):
+        attrs = {
+            key: rnd.choice(values)
+            for key in rnd.sample(keys, rnd.randint(0, 6))
+        }
+        for key in ("classes", "error"):
+            if key in attrs and not isinstance(attrs[key], str):
+                attrs[key] = "c1 c2"
+        show_error = rnd.choice([False, True, "Error"])
+        old_attrs = dict(attrs)
+
+        html = get_html_attrs(attrs, show_error=show_error)
+        assert html == old_get_html_attrs(old_attrs, show_error=show_error)
+        # The attrs are still modified in the same way
+        assert attrs == old_attrs
+
+
+def test_get_html_attrs_rows_share_the_cache():
+    compile_html_attrs.cache_clear()
+    for row in range(100):
+        html = get_html_attrs({
+            "id": "items--{}--name".format(row),
+            "name": "items--{}--name".format(row),
+            "type": "text",
+            "classes": "input",
+            "required": True,
+        })
+        assert html == (
+            'class="input" id="items--{0}--name" name="items--{0}--name" '
+            'type="text" required'.format(row)
+        )
+    assert compile_html_attrs.cache_info().currsize == 1
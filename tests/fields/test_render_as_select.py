@@ -1,4 +1,5 @@
 import hyperform.fields as f
+from hyperform.fields.field_renderable import SelectedValues, in_
 
 
 def test_render_as_select_tag():
@@ -162,3 +163,67 @@ def test_text_render_as_select_with_optgroups():
         "</select>"
     )
     assert result == expected
+
+
+def test_selected_values_same_as_in_():
+    values_list = [[], [1], ["1"], [1, "b"], [True], [1.0], [None], [[1, 2]], ["a b", 3]]
+    candidates = [1, "1", 1.0, True, 0, "b", "a b", None, "None", 3, "3", [1, 2], "[1, 2]"]
+    for values in values_list:
+        selected = SelectedValues(values)
+        for value in candidates:
+            assert (value in selected) == in_(value, values), (value, values)
+
+
+def test_render_large_select_prepares_once():
+    calls = []
+
+    def prepare(object_value):
+        calls.append(object_value)
+        return [str(value) for value in object_value]
+
+    field = f.Text(multiple=True, prepare=prepare)
+    field.load_data(object_value=[5, 7])
+    items = [(f"Option {i}", i) for i in range(2000)]
+    html = field.as_select(items)
+
+    assert calls == [[5, 7]]
+    assert html.count(" selected>") == 2
+    assert '<option value="7" selected>Option 7</option>' in html
+
+    field.load_data(object_value=[8])
+    assert '<option value="8" selected>Option 8</option>' in field.as_select(items)
+    assert field.is_selected(8)
+    assert not field.is_selected(7)
+
+
+OPTIONS_ITEMS = [
+    ("Select...", ""),
+    ("Lima", "lima"),
+    ("Files", [
+        ("<b>Escaped</b>", "x&y"),
+        ("Disabled", "dis", {"disabled": True, "data_id": 3}),
+    ]),
+    ("One", 1),
+    ("Two", "2", {"classes": "big"}),
+]
+
+
+def test_options_same_as_items():
+    options = f.Options(OPTIONS_ITEMS)
+    assert len(options) == 5
+
+    for kwargs, object_value, error in [
+        ({}, None, None),
+        ({}, "lima", None),
+        ({"multiple": True}, ["1", "x&y", "dis"], None),
+        ({}, "2", "Invalid"),
+        ({}, 1, "Invalid"),
+    ]:
+        field = f.Text(name="city", **kwargs)
+        field.load_data(object_value=object_value)
+        field.error = error
+        # Twice, to use the cached fragments
+        for _ in range(2):
+            assert field.as_select(options, label="City", classes="x") == (
+                field.as_select(OPTIONS_ITEMS, label="City", classes="x")
+            )
@@ -0,0 +1,107 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from hyperform.ftypes import (
+    cached_type,
+    disable_type_cache,
+    enable_type_cache,
+    get_type_cache,
+    type_email,
+    type_slug,
+    type_url,
+)
+
+
+@pytest.fixture()
+def cache():
+    yield enable_type_cache(maxsize=3)
+    disable_type_cache()
+
+
+calls = []
+
+
+@cached_type
+def type_counted(value, **options):
+    calls.append((value, options))
+    return value.upper()
+
+
+def test_disabled_by_default():
+    assert get_type_cache() is None
+    calls.clear()
+    type_counted("a")
+    type_counted("a")
+    assert len(calls) == 2
+
+
+def test_cached_results(cache):
+    calls.clear()
+    assert type_counted("a") == "A"
+    assert type_counted("a") == "A"
+    assert type_counted("b") == "B"
+    assert len(calls) == 2
+
+    info = cache.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 2, 2)
+
+
+def test_options_are_part_of_the_key(cache):
+    calls.clear()
+    type_counted("a", sep="-")
+    type_counted("a", sep="_")
+    type_counted("a", sep="-")
+    assert len(calls) == 2
+
+
+def test_unhashable_options(cache):
+    assert type_slug("the quick fox", stopwords=["the"]) == "quick-fox"
+    assert type_slug("the quick fox", stopwords=["quick"]) == "the-fox"
+    assert type_slug(
+        "the quick fox", replacements=[["quick", "slow"]]
+    ) == "the-slow-fox"
+    assert type_slug("the quick fox", stopwords=["the"]) == "quick-fox"
+    assert cache.cache_info().hits == 1
+
+
+def test_lru_eviction(cache):
+    calls.clear()
+    for value in ["a", "b", "c", "a", "d"]:  # "b" is evicted
+        type_counted(value)
+    assert cache.cache_info().evictions == 1
+    assert len(cache) == 3
+
+    type_counted("a")
+    assert len(calls) == 4
+    type_counted("b")
+    assert len(calls) == 5
+
+
+def test_cached_type_functions(cache):
+    assert type_url("example.com") == type_url("example.com") == "http://example.com"
+    assert type_email("a@Example.com") == type_email("a@Example.com") == "a@example.com"
+    assert type_email("nope") is type_email("nope") is None
+    assert cache.cache_info().hits == 3
+
+
+def test_check_dns_skips_the_cache(cache, monkeypatch):
+    from hyperform.ftypes import email
+
+    monkeypatch.setattr(email.deliverability_cache, "resolver", lambda *args: True)
+    type_email("a@example.com", check_dns=True)
+    type_email("a@example.com", check_dns=True)
+    assert len(cache) == 0
+
+
+def test_thread_safety(cache):
+    cache.maxsize = 50
+    values = [str(i % 100) for i in range(5000)]
+
+    with ThreadPoolExecutor(8) as executor:
+        results = list(executor.map(type_counted, values))
+
+    assert results == values
+    info = cache.cache_info()
+    assert info.hits + info.misses == len(values)
+    assert info.currsize == 50
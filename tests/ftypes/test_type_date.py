@@ -35,3 +35,9 @@ def test_type_date_valid(value, expected):
 @pytest.mark.parametrize("value", INVALID_DATES)
 def test_type_date_invalid(value):
     assert type_date(value) is None
+
+
+def test_old_module_path():
+    from hyperform.ftypes.date import type_date as old_type_date
+
+    assert old_type_date is type_date
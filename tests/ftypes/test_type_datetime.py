@@ -0,0 +1,204 @@
+import datetime
+import random
+import re
+
+import pytest
+
+from hyperform.ftypes import (
+    format_date,
+    format_month,
+    format_time,
+    get_timezone,
+    type_date,
+    type_date_many,
+    type_datetime,
+    type_datetime_many,
+    type_time,
+    type_time_many,
+)
+
+
+VALID_DATETIMES = [
+    ("2019-09-08 16:34", datetime.datetime(2019, 9, 8, 16, 34)),
+    ("2019-09-08 16:34:05", datetime.datetime(2019, 9, 8, 16, 34, 5)),
+    ("1980-07-28 5:03 AM", datetime.datetime(1980, 7, 28, 5, 3)),
+    ("2019-09-08 4:20:16 PM", datetime.datetime(2019, 9, 8, 16, 20, 16)),
+    ("2019-9-8", datetime.datetime(2019, 9, 8)),
+]
+
+INVALID_DATETIMES = [
+    "",
+    "2019-09-08T16:34",
+    "2019-09-08 24:00",
+    "2019-02-30 16:34",
+    "2019-09-08 16:60",
+    "nope 16:34",
+]
+
+
+@pytest.mark.parametrize("value, expected", VALID_DATETIMES)
+def test_type_datetime_valid(value, expected):
+    assert type_datetime(value) == expected
+
+
+@pytest.mark.parametrize("value", INVALID_DATETIMES)
+def test_type_datetime_invalid(value):
+    assert type_datetime(value) is None
+
+
+def test_type_datetime_tz():
+    value = type_datetime("2019-09-08 16:34", tz="America/Lima")
+    assert value.tzinfo is get_timezone("America/Lima")
+    assert value.utcoffset() == datetime.timedelta(hours=-5)
+
+    utc = datetime.timezone.utc
+    assert type_datetime("2019-09-08 4:34 pm", tz=utc) == datetime.datetime(
+        2019, 9, 8, 16, 34, tzinfo=utc
+    )
+
+
+def test_many():
+    assert type_date_many(["2019-05-29", "", "2019-05-29"]) == [
+        datetime.date(2019, 5, 29), None, datetime.date(2019, 5, 29),
+    ]
+    assert type_time_many(["16:20", "4:20 pm", "nope"]) == [
+        datetime.time(16, 20), datetime.time(16, 20), None,
+    ]
+    values = type_datetime_many(["2019-09-08 16:34"] * 2, tz="UTC")
+    assert values[0] == values[1]
+    assert values[0].tzinfo is get_timezone("UTC")
+
+
+# The original implementations, to check that the fast paths
+# return exactly the same results.
+
+def old_type_date(value):
+    try:
+        ldt = [int(f) for f in value.split("-")]
+        return datetime.date(*ldt)
+    except (ValueError, TypeError):
+        return None
+
+
+rx_noon = re.compile(r"^12\s*m?$", re.IGNORECASE)
+rx_time = re.compile(
+    r"^(?P<hour>[0-9]{1,2})(:(?P<minute>[0-9]{1,2}))?"
+    r"(:(?P<second>[0-9]{1,2}))?\s*(?P<tt>am|pm)?$",
+    re.IGNORECASE,
+)
+
+
+def old_type_time(value):
+    if rx_noon.match(value):
+        return datetime.time(12, 0, 0)
+
+    value = value.upper()
+    value = value.replace("P.M.", "PM").replace("A.M.", "AM")
+    match = rx_time.match(value)
+    if not match:
+        return None
+
+    gd = match.groupdict()
+    hour = int(gd["hour"])
+    minute = int(gd["minute"] or 0)
+    second = int(gd["second"] or 0)
+    if gd["tt"] == "PM":
+        hour += 12
+
+    try:
+        return datetime.time(hour, minute, second)
+    except (ValueError, TypeError):
+        return None
+
+
+def old_type_datetime(value):
+    if " " not in value:
+        value += " 00:00"
+    date_part, time_part = value.split(" ", maxsplit=1)
+    try:
+        return datetime.datetime.combine(
+            old_type_date(date_part), old_type_time(time_part)
+        )
+    except TypeError:
+        return None
+
+
+def random_corpus(size=3000, seed=7):
+    rnd = random.Random(seed)
+    digits = "0123456789"
+
+    def num(width):
+        return "".join(rnd.choice(digits) for _ in range(width))
+
+    def noise(value):
+        if rnd.random() < 0.2:
+            i = rnd.randrange(len(value) + 1)
+            value = value[:i] + rnd.choice("-: +T.Z٣\n") + value[i:]
+        return value
+
+    dates = [
+        noise(f"{num(4)}-{num(2)}-{num(2)}") for _ in range(size)
+    ] + [
+        noise(f"{rnd.randint(1, 2999)}-{rnd.randint(0, 13)}-{rnd.randint(0, 32)}")
+        for _ in range(size)
+    ]
+    times = [
+        noise(f"{num(2)}:{num(2)}") for _ in range(size)
+    ] + [
+        noise(f"{num(2)}:{num(2)}:{num(2)}") for _ in range(size)
+    ] + [
+        noise(f"{rnd.randint(0, 25)}:{num(2)}{rnd.choice(['', ' am', ' PM', 'p.m.'])}")
+        for _ in range(size)
+    ]
+    return dates, times
+
+
+EXTRA_DATES = ["0000-01-01", "+019-05-29", "2019-05-2٣", "20190529", "2019-W01-1"]
+EXTRA_TIMES = ["24:00", "24:00:00", "16:20:05.123", "16:20Z", "1620", "16", "16:20\n"]
+
+
+def test_same_as_old_implementation():
+    dates, times = random_corpus()
+    dates += EXTRA_DATES
+    times += EXTRA_TIMES
+
+    for value in dates:
+        assert type_date(value) == old_type_date(value), value
+    for value in times:
+        assert type_time(value) == old_type_time(value), value
+
+    rnd = random.Random(11)
+    for _ in range(3000):
+        value = f"{rnd.choice(dates)} {rnd.choice(times)}"
+        assert type_datetime(value) == old_type_datetime(value), value
+
+
+def test_formatters_same_as_strftime():
+    rnd = random.Random(3)
+    for _ in range(2000):
+        value = datetime.datetime(
+            rnd.randint(1000, 9999),
+            rnd.randint(1, 12),
+            rnd.randint(1, 28),
+            rnd.randint(0, 23),
+            rnd.randint(0, 59),
+            rnd.choice([0, rnd.randint(0, 59)]),
+        )
+        assert format_date(value) == value.strftime("%Y-%m-%d")
+        assert format_month(value) == value.strftime("%Y-%m")
+        hour = value.hour if value.hour <= 12 else value.hour - 12
+        expected = f"{hour}:{value.minute:02d}"
+        if value.second:
+            expected += f":{value.second:02d}"
+        expected += value.strftime(" %p")
+        assert format_time(value) == expected
+        # And they round-trip, except for "12:xx PM" that `type_time` reads
+        # as hour 24.
+        if value.hour != 12:
+            assert type_datetime(format_date(value) + " " + format_time(value)) == value
+
+
+def test_formatters_pad_the_year():
+    assert format_date(datetime.date(5, 1, 2)) == "0005-01-02"
+    assert format_month(datetime.date(5, 1, 2)) == "0005-01"
+    assert type_date(format_date(datetime.date(5, 1, 2))) == datetime.date(5, 1, 2)
@@ -1,6 +1,10 @@
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+
 import pytest
 
-from hyperform.ftypes import type_email
+from hyperform.ftypes import DeliverabilityCache, type_email
 
 
 VALID_EMAILS = [
@@ -65,3 +69,135 @@ def test_type_email_invalid_with_smtputf8(value):
 @pytest.mark.parametrize("value", VALID_UTF8_EMAILS)
 def test_type_email_invalid_without_smtputf8(value):
     assert type_email(value, allow_smtputf8=False) is None
+
+
+class StubResolver(object):
+    def __init__(self, undeliverable=(), unknown=()):
+        self.undeliverable = undeliverable
+        self.unknown = unknown
+        self.calls = []
+
+    def __call__(self, domain, domain_i18n):
+        self.calls.append(domain)
+        if domain in self.unknown:
+            return None
+        return domain not in self.undeliverable
+
+
+class FakeClock(object):
+    now = 0
+
+    def __call__(self):
+        return self.now
+
+
+def test_type_email_check_dns_uses_the_cache():
+    resolver = StubResolver(undeliverable=["nope.com"])
+    cache = DeliverabilityCache(resolver)
+
+    assert type_email("a@Example.com", check_dns=True, dns_cache=cache) == "a@example.com"
+    assert type_email("b@example.com", check_dns=True, dns_cache=cache) == "b@example.com"
+    assert type_email("a@nope.com", check_dns=True, dns_cache=cache) is None
+    assert type_email("b@nope.com", check_dns=True, dns_cache=cache) is None
+    assert resolver.calls == ["example.com", "nope.com"]
+
+    info = cache.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (2, 2, 2)
+
+
+def test_type_email_check_dns_invalid_syntax_skips_the_lookup():
+    resolver = StubResolver()
+    cache = DeliverabilityCache(resolver)
+    assert type_email("lalala", check_dns=True, dns_cache=cache) is None
+    assert resolver.calls == []
+
+
+def test_deliverability_cache_ttl():
+    resolver = StubResolver(undeliverable=["nope.test"])
+    clock = FakeClock()
+    cache = DeliverabilityCache(resolver, ttl=100, negative_ttl=10, clock=clock)
+
+    assert cache.check("example.com")
+    assert not cache.check("nope.test")
+
+    clock.now = 50
+    assert cache.check("example.com")
+    assert not cache.check("nope.test")
+    assert resolver.calls == ["example.com", "nope.test", "nope.test"]
+
+    clock.now = 100
+    assert cache.check("example.com")
+    assert resolver.calls[-1] == "example.com"
+
+
+def test_deliverability_cache_unknown_results_are_not_cached():
+    resolver = StubResolver(unknown=["slow.test"])
+    cache = DeliverabilityCache(resolver)
+
+    assert cache.check("slow.test")
+    assert cache.check("slow.test")
+    assert resolver.calls == ["slow.test", "slow.test"]
+    assert len(cache) == 0
+
+
+def test_deliverability_cache_lru_eviction():
+    resolver = StubResolver()
+    cache = DeliverabilityCache(resolver, maxsize=2)
+
+    cache.check("a.test")
+    cache.check("b.test")
+    cache.check("a.test")
+    cache.check("c.test")  # evicts b.test
+    assert len(cache) == 2
+    assert cache.cache_info().evictions == 1
+
+    cache.check("a.test")
+    assert resolver.calls == ["a.test", "b.test", "c.test"]
+    cache.check("b.test")
+    assert resolver.calls == ["a.test", "b.test", "c.test", "b.test"]
+
+
+def test_deliverability_cache_inflight_deduplication():
+    num_threads = 8
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def slow_resolver(domain, domain_i18n):
+        calls.append(domain)
+        started.set()
+        release.wait(timeout=2)
+        return True
+
+    cache = DeliverabilityCache(slow_resolver)
+
+    with ThreadPoolExecutor(num_threads) as executor:
+        first = executor.submit(cache.check, "example.com")
+        try:
+            assert started.wait(timeout=2)
+            rest = [
+                executor.submit(cache.check, "example.com")
+                for _ in range(num_threads - 1)
+            ]
+            # Wait until all the others are waiting for the first lookup
+            deadline = time.monotonic() + 2
+            while cache.cache_info().hits < num_threads - 1:
+                assert time.monotonic() < deadline, "The lookups didn't wait"
+                time.sleep(0.001)
+        finally:
+            release.set()
+        results = [first.result()] + [future.result() for future in rest]
+
+    assert results == [True] * num_threads
+    assert calls == ["example.com"]
+
+
+def test_deliverability_cache_resolver_errors_are_not_cached():
+    def failing_resolver(domain, domain_i18n):
+        raise RuntimeError("boom")
+
+    cache = DeliverabilityCache(failing_resolver)
+    with pytest.raises(RuntimeError):
+        cache.check("example.com")
+    assert len(cache) == 0
+    assert cache._inflight == {}
@@ -53,3 +53,9 @@ def test_type_hex_color_valid(value, expected):
 @pytest.mark.parametrize("value", INVALID_TIMES)
 def test_type_hex_color_invalid(value):
     assert type_time(value) is None
+
+
+def test_old_module_path():
+    from hyperform.ftypes.time import type_time as old_type_time
+
+    assert old_type_time is type_time
@@ -1,6 +1,11 @@
+import random
+import re
+from urllib.parse import urlsplit, urlunsplit
+
+import idna
 import pytest
 
-from hyperform.ftypes import type_url
+from hyperform.ftypes import type_url, type_url_many
 
 
 VALID_URLS = [
@@ -38,3 +43,112 @@ def test_type_url_invalid(value):
 def test_type_url_tld():
     assert type_url("localhost", require_tld=True) is None
     assert type_url("localhost", require_tld=False) == "http://localhost"
+
+
+def test_type_url_many():
+    values = ["example.com", "", "localhost", "example.com", "mañana.co"]
+    assert type_url_many(values) == [type_url(value) for value in values]
+    assert type_url_many(values, require_tld=True) == [
+        type_url(value, require_tld=True) for value in values
+    ]
+
+
+def old_type_url(value, require_tld=False):
+    """The original implementation, to check that the optimized one returns
+    exactly the same results.
+    """
+    rx_scheme = re.compile(r"^[a-z]{3,7}://[^/]")
+    rx_url = r"^([a-z]{3,7}://)?([^./:][^/:]+[^./:]%s|([0-9]{1,3}\.){3}[0-9]{1,3})(:[0-9]+)?(\/.*)?$"  # noqa: E501
+    rx_tld = r"\.[a-z]{2,10}"
+
+    rx = re.compile(rx_url % (rx_tld if require_tld else ""), re.IGNORECASE)
+    if not rx.match(value):
+        return None
+
+    if not rx_scheme.match(value):
+        if value.startswith(("http//", "http:/", "http:///", "http:")):
+            return None
+        value = "http://" + value
+
+    scheme, domain, path, query, fragment = urlsplit(value)
+
+    if ".." in domain or "//" in domain:
+        return None
+
+    try:
+        domain = idna.uts46_remap(domain, std3_rules=False, transitional=False)
+    except idna.IDNAError:
+        return None
+
+    return urlunsplit((scheme, domain, path, query, fragment))
+
+
+CORPUS = [value for value, _ in VALID_URLS] + INVALID_URLS + [
+    "EXAMPLE.COM",
+    "HTTP://Example.com",
+    "Http://Example.Com/Path?Q=1#Frag",
+    "ftp://files.example.org/a",
+    "example.com?",
+    "example.com#",
+    "example.com/?#",
+    "user:pass@example.com:8080/x",
+    "User@Example.com",
+    "example.com:99999",
+    "192.168.0.1:80/admin",
+    "999.999.999.999",
+    "sub_domain.example.com",
+    "exa mple.com",
+    "example.com/a b",
+    "example.com/\t/x",
+    " example.com",
+    "example.com ",
+    "ex\x00ample.com",
+    "example.c",
+    "example.comcomcomcom",
+    "localhost",
+    "LOCALHOST:5000",
+    "a.b",
+    "ab",
+    "-example-.com",
+    "例え.テスト",
+    "ＥＸＡＭＰＬＥ.com",
+    "example。com",
+    "Straße.de",
+    "ΣΊΣΥΦΟΣ.gr",
+    "me⒈com.com",
+    "xn--mnana-wqa.co",
+    "http:/example.com",
+    "http:example.com",
+    "https//example.com",
+    "javascript://alert(1)",
+    "[::1]:80",
+    "http://[::1]/x",
+]
+
+
+def random_corpus(size=2000, seed=42):
+    rnd = random.Random(seed)
+    alphabet = "abcXYZ019.-_:/?#@% ÁñßΣ例。．⒈\t"
+    return [
+        "".join(rnd.choice(alphabet) for _ in range(rnd.randint(1, 20)))
+        for _ in range(size)
+    ] + [
+        rnd.choice(["", "http://", "HTTPS://", "ftp://"])
+        + rnd.choice(["example", "ÉXAMPLE", "sub.example", "ex--ample"])
+        + rnd.choice(["", ".com", ".CO", ".ñandú", ".c"])
+        + rnd.choice(["", ":80", ":x"])
+        + rnd.choice(["", "/", "/a?b=c", "/#", "?", "#"])
+        for _ in range(size)
+    ]
+
+
+@pytest.mark.parametrize("require_tld", [False, True])
+def test_type_url_same_as_old_implementation(require_tld):
+    for value in CORPUS + random_corpus():
+        try:
+            expected = old_type_url(value, require_tld=require_tld)
+        except ValueError as error:
+            with pytest.raises(type(error)):
+                type_url(value, require_tld=require_tld)
+            continue
+        assert type_url(value, require_tld=require_tld) == expected, value
@@ -0,0 +1,195 @@
+import asyncio
+import threading
+
+import pytest
+
+import hyperform as f
+from hyperform.fields import email as email_module
+
+
+@pytest.fixture(autouse=True)
+def loop():
+    # A new loop for each test, set before the test creates its
+    # `asyncio.Event` objects, that before Python 3.10 are bound to the
+    # current loop. `asyncio.run()` isn't available in Python 3.6.
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    yield loop
+    asyncio.set_event_loop(None)
+    loop.close()
+
+
+def run(coro):
+    loop = asyncio.get_event_loop()
+    return loop.run_until_complete(asyncio.wait_for(coro, timeout=2))
+
+
+def test_avalidate_same_as_validate():
+    class ContactForm(f.Form):
+        name = f.Text(required=True)
+        age = f.Integer(f.InRange(18, 99))
+        tags = f.Text(multiple=True)
+
+    for data in [
+        {"name": "Bob", "age": "30", "tags": ["a", "b"]},
+        {"name": "", "age": "30"},
+        {"name": "Bob", "age": "nope"},
+        {"name": "Bob", "age": "12"},
+    ]:
+        form = ContactForm(data)
+        expected = form.validate()
+        expected_error = form.error
+
+        form = ContactForm(data)
+        assert run(form.avalidate()) == expected
+        assert form.error == expected_error
+
+
+def test_async_validator():
+    async def is_even(values):
+        await asyncio.sleep(0)
+        return all(value % 2 == 0 for value in values), "Must be even"
+
+    class MyForm(f.Form):
+        num = f.Integer(is_even)
+
+    form = MyForm({"num": "2"})
+    assert run(form.avalidate()) == {"num": 2}
+
+    form = MyForm({"num": "3"})
+    assert run(form.avalidate()) is None
+    assert form.num.error == "Must be even"
+    assert form.error == "Must be even"
+
+
+def test_async_type_and_clean():
+    class Upper(f.Text):
+        async def atype(self, value, **kwargs):
+            await asyncio.sleep(0)
+            return None if value == "bad" else value.upper()
+
+    class MyForm(f.Form):
+        code = Upper(multiple=True)
+
+        async def clean_code(self, value):
+            await asyncio.sleep(0)
+            return "-".join(value)
+
+    form = MyForm({"code": ["a", "b"]})
+    assert run(form.avalidate()) == {"code": "A-B"}
+
+    form = MyForm({"code": ["a", "bad"]})
+    assert run(form.avalidate()) is None
+    assert form.code.error_value == "bad"
+
+
+def test_fields_are_validated_concurrently():
+    # The validator of `first` waits for the one of `second`. If the fields
+    # were validated one after the other, this would never finish.
+    second_started = asyncio.Event()
+
+    async def wait_for_second(values):
+        await second_started.wait()
+        return True
+
+    async def start_second(values):
+        second_started.set()
+        return True
+
+    class MyForm(f.Form):
+        a_first = f.Text(wait_for_second)
+        b_second = f.Text(start_second)
+
+    form = MyForm({"a_first": "a", "b_second": "b"})
+    assert run(form.avalidate()) == {"a_first": "a", "b_second": "b"}
+
+
+def test_formset_forms_are_validated_concurrently():
+    num_forms = 3
+    waiting = []
+    all_started = asyncio.Event()
+
+    async def wait_for_all(values):
+        waiting.append(values)
+        if len(waiting) == num_forms:
+            all_started.set()
+        await all_started.wait()
+        return True
+
+    class ChildForm(f.Form):
+        meh = f.Text(wait_for_all)
+
+    class MyForm(f.Form):
+        children = f.FormSet(ChildForm)
+
+    form = MyForm({
+        f"children--_NEW{i}--meh": str(i) for i in range(num_forms)
+    })
+    data = run(form.avalidate())
+    assert len(data["children"]) == num_forms
+    assert form.children._valid_data is data["children"]
+
+
+def test_formset_avalidate_errors():
+    async def not_bad(values):
+        return values[0] != "bad"
+
+    class ChildForm(f.Form):
+        meh = f.Text(not_bad)
+
+    class MyForm(f.Form):
+        children = f.FormSet(ChildForm, lazy=True)
+
+    form = MyForm({
+        "children--_NEW1--meh": "ok",
+        "children--_NEW2--meh": "bad",
+    })
+    assert run(form.avalidate()) is None
+    assert form.children.validate() is None
+    assert form.children[1].meh.error == "Invalid value"
+    # Only the invalid form is kept
+    assert form.children._forms[0] is None
+
+    class MinForm(f.Form):
+        children = f.FormSet(ChildForm, min_num=3)
+
+    form = MinForm({"children--_NEW1--meh": "ok"})
+    assert run(form.avalidate()) is None
+    assert form.children.error == "Please submit at least 3 forms."
+
+
+def test_email_dns_check_runs_in_threads(monkeypatch):
+    # A fake resolver that only returns when both lookups are running
+    # at the same time.
+    barrier = threading.Barrier(2, timeout=2)
+
+    def fake_type_email(value, check_dns=False, **kwargs):
+        assert check_dns
+        barrier.wait()
+        return value.lower()
+
+    monkeypatch.setattr(email_module, "type_email", fake_type_email)
+
+    class MyForm(f.Form):
+        email = f.Email(check_dns=True)
+        other = f.Email(check_dns=True)
+
+    form = MyForm({"email": "A@EXAMPLE.COM", "other": "b@example.com"})
+    assert run(form.avalidate()) == {
+        "email": "a@example.com",
+        "other": "b@example.com",
+    }
+
+
+@pytest.mark.parametrize("check_dns", [False, True])
+def test_email_invalid_async(monkeypatch, check_dns):
+    monkeypatch.setattr(
+        email_module, "type_email", lambda value, **kwargs: None
+    )
+
+    class MyForm(f.Form):
+        email = f.Email(check_dns=check_dns)
+
+    form = MyForm({"email": "nope"})
+    assert run(form.avalidate()) is None
+    assert form.email.error == "Doesn‘t look like a valid e-mail."
@@ -0,0 +1,54 @@
+import pickle
+
+import pytest
+
+import hyperform as f
+from hyperform.bulk import get_form_path, load_form_class
+
+from bulk_forms import ContactForm
+
+
+def make_records(num):
+    for i in range(num):
+        if i % 7 == 0:
+            yield {"age": "200"}
+        else:
+            yield {"name": f"person {i}", "age": str(i % 100)}
+
+
+def test_validate_bulk_in_order():
+    results = list(f.validate_bulk(
+        ContactForm, make_records(250), workers=2, chunk_size=20, max_pending=3
+    ))
+    expected = list(ContactForm.validate_many(make_records(250)))
+
+    assert [index for index, _ in results] == list(range(250))
+    assert results == expected
+    assert isinstance(results[0][1], f.FormErrors)
+    assert results[1][1] == {"name": "Person 1", "age": 1}
+
+
+def test_validate_bulk_with_a_form_path():
+    results = list(f.validate_bulk(
+        "bulk_forms:ContactForm", make_records(10), workers=1, chunk_size=3
+    ))
+    assert results == list(ContactForm.validate_many(make_records(10)))
+
+
+def test_form_path():
+    assert get_form_path(ContactForm) == "bulk_forms:ContactForm"
+    assert load_form_class("bulk_forms:ContactForm") is ContactForm
+
+    class LocalForm(f.Form):
+        pass
+
+    with pytest.raises(ValueError):
+        get_form_path(LocalForm)
+
+
+def test_forms_are_picklable():
+    form = ContactForm({"name": "alice", "age": "30"})
+    form = pickle.loads(pickle.dumps(form))
+
+    assert form.validate() == {"name": "Alice", "age": 30}
+    assert pickle.loads(pickle.dumps(ContactForm.name))._spec == ContactForm.name._spec
@@ -0,0 +1,88 @@
+import random
+
+import pytest
+
+import hyperform as f
+
+
+np = pytest.importorskip("numpy")
+
+from hyperform.columnar import validate_column  # noqa: E402
+
+CORPUS = [
+    None, "", "  ", "0", "1", "-1", "+7", " 42 ", "007", "3.5", "-2.25", ".5", "5.",
+    "1e3", "-1e-2", "1_000", "١٢", "99999999999999999999", "-99999999999999999999",
+    "nan", "inf", "-inf", "abc", "1.2.3", "1e", "--5", "+", "-", "0x10", "5 5",
+    "100", "101", "1000", 12, 3.0,
+]
+
+FIELDS = [
+    lambda: f.Integer(),
+    lambda: f.Integer(required=True),
+    lambda: f.Integer(strict=False),
+    lambda: f.Integer(strict=False, required=True),
+    lambda: f.Integer(strict=False, min_num=1),
+    lambda: f.Integer(min_num=2),
+    lambda: f.Integer(f.InRange(0, 100)),
+    lambda: f.Integer(f.MoreThan(0), f.LessThan(100), required=True),
+    lambda: f.Float(),
+    lambda: f.Float(required=True, strict=False),
+    lambda: f.Float(f.InRange(-1, 1000)),
+    lambda: f.Float(f.LessThan(10), f.MoreThan(-10), strict=False),
+]
+
+
+def scalar_validate(field, column):
+    results = []
+    for raw in column:
+        tmp = field._bind(field.name)
+        tmp.input_values = [] if raw is None else [raw]
+        py_value = tmp.validate()
+        results.append((tmp.error, py_value))
+    return results
+
+
+@pytest.mark.parametrize("make_field", FIELDS)
+def test_same_results_as_scalar_path(make_field):
+    field = make_field()
+    rnd = random.Random(42)
+    column = CORPUS + [rnd.choice(CORPUS) for _ in range(200)]
+
+    result = validate_column(field, column)
+    expected = scalar_validate(field, column)
+    messages = dict(zip(result.errors.tolist(), result.messages))
+
+    for index, (error, py_value) in enumerate(expected):
+        if error:
+            assert not result.valid[index], column[index]
+            assert messages[index] == error
+        else:
+            assert result.valid[index], column[index]
+            if py_value is None:
+                assert result.empty[index]
+            else:
+                assert not result.empty[index]
+                value = result.values[index]
+                assert value == py_value or (value != value and py_value != py_value)
+
+
+def test_clean_column():
+    field = f.Integer(f.InRange(1, 10))
+    result = validate_column(field, ["1", "5", "11", "10"])
+
+    assert result.values.dtype == np.int64
+    assert result.valid.tolist() == [True, True, False, True]
+    assert result.errors.tolist() == [2]
+    assert result.messages == ["Number must be between 1 and 10."]
+
+
+@pytest.mark.parametrize("field", [
+    f.Text(),
+    f.Integer(multiple=True),
+    f.Integer(clean=lambda value: value),
+    f.Integer(f.LongerThan(2)),
+    f.Integer(f.Unique(None)),
+])
+def test_unsupported_fields(field):
+    with pytest.raises(ValueError):
+        validate_column(field, ["1"])
@@ -0,0 +1,103 @@
+from datetime import date
+
+import pytest
+
+import hyperform as f
+from hyperform.compiler import is_inlineable
+
+
+def make_forms():
+    class ItemForm(f.Form):
+        name = f.Text(required=True)
+
+    class BaseForm(f.Form):
+        title = f.Text(required=True, error_messages={"required": "Title!"})
+        body = f.Text(f.ShorterThan(10))
+        count = f.Integer(f.InRange(1, 5))
+        price = f.Float(strict=False)
+        tags = f.Text(collection=True, sep=";", min_num=1, max_num=3)
+        codes = f.Integer(multiple=True, max_num=2)
+        flag = f.Boolean()
+        when = f.Date(f.After(date(2000, 1, 1)))
+        at = f.SplittedDateTime()
+        slug = f.Slug(max_length=8)
+        loose = f.Integer(multiple=True, strict=False, required=True)
+        items = f.FormSet(ItemForm)
+
+        def clean_body(self, pyvalue):
+            return pyvalue.upper() if pyvalue else pyvalue
+
+    @f.compile_form
+    class CompiledForm(BaseForm):
+        pass
+
+    return BaseForm, CompiledForm
+
+
+INPUTS = [
+    {},
+    {"title": "Hello"},
+    {"title": "  ", "body": "short"},
+    {"title": "Hello", "body": "way too long for this"},
+    {"title": "Hello", "count": "3", "price": "abc", "tags": "a ; b;c"},
+    {"title": "Hello", "count": "9", "tags": "a;b;c;d"},
+    {"title": "Hello", "count": "x"},
+    {"title": "Hello", "codes": ["1", "2", "3"]},
+    {"title": "Hello", "codes": ["1", "2"], "flag": "off"},
+    {"title": "Hello", "when": "1999-01-01"},
+    {"title": "Hello", "when": "2019-05-05", "at": ["2019-05-05", "4:20 PM"]},
+    {"title": "Hello", "at": ["nope", "4:20 PM"], "slug": "Hola Mundo Cruel"},
+    {"title": "Hello", "loose": ["x", "y"]},
+    {"title": "Hello", "loose": ["x", "4"], "items--_NEW1--name": "item"},
+    {"title": "Hello", "items--_NEW1--name": ""},
+]
+
+OBJECTS = [None, {"title": "Hello", "count": 3, "flag": False}]
+
+
+@pytest.mark.parametrize("input_data", INPUTS)
+@pytest.mark.parametrize("object", OBJECTS)
+def test_compiled_validate_is_equivalent(input_data, object):
+    BaseForm, CompiledForm = make_forms()
+    form = BaseForm(input_data, object)
+    cform = CompiledForm(input_data, object)
+
+    assert cform.validate() == form.validate()
+    assert cform.error == form.error
+    assert cform.updated_fields == form.updated_fields
+    for name in form._fields:
+        field = getattr(form, name)
+        cfield = getattr(cform, name)
+        assert cfield.error == field.error
+        assert cfield.error_value == field.error_value
+        assert cfield.updated == field.updated
+
+
+def test_compile_form_caches_the_function():
+    BaseForm, CompiledForm = make_forms()
+    assert BaseForm._compiled_validate is None
+    assert CompiledForm._compiled_validate is not None
+
+    class SubForm(CompiledForm):
+        extra = f.Text(required=True)
+
+    assert SubForm._compiled_validate is not None
+    assert SubForm._compiled_validate is not CompiledForm._compiled_validate
+    form = SubForm({"title": "Hello"})
+    assert form.validate() is None
+    assert form.extra.error == "This field is required."
+
+
+def test_compiled_attribute():
+    class MyForm(f.Form):
+        _compiled = True
+        title = f.Text()
+
+    assert MyForm._compiled_validate is not None
+    assert MyForm({"title": "meh"}).validate() == {"title": "meh"}
+
+
+def test_fields_with_custom_typecast_are_not_inlined():
+    assert is_inlineable(f.Text())
+    assert is_inlineable(f.Password())
+    assert not is_inlineable(f.SplittedDateTime())
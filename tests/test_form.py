@@ -305,3 +305,93 @@ def test_cant_delete_by_default():
     assert form.subject.value == data["subject"]
     assert form.email.value == data["email"]
     assert form.message.value == data["message"]
+
+
+def test_schema_is_compiled_with_the_class():
+    class SectionForm(f.Form):
+        title = f.Text()
+
+    class BaseForm(f.Form):
+        subject = f.Text()
+
+        def clean_subject(self, pyvalue):
+            return pyvalue
+
+    class ContactForm(BaseForm):
+        message = f.Text()
+        sections = f.FormSet(SectionForm)
+
+        def prepare_message(self, object_value):
+            return [object_value]
+
+    assert ContactForm._fields == ("message", "subject")
+    assert ContactForm._formsets == ("sections",)
+    assert ContactForm._field_specs == (
+        ("message", ContactForm.message, "prepare_message", None),
+        ("subject", ContactForm.subject, None, "clean_subject"),
+    )
+
+    form = ContactForm()
+    assert form.message.custom_prepare == form.prepare_message
+    assert form.subject.custom_clean == form.clean_subject
+    assert form.message is not ContactForm.message
+
+
+def test_get_errors():
+    class SectionForm(f.Form):
+        title = f.Text(required=True)
+
+    class MyForm(f.Form):
+        subject = f.Text(required=True)
+        count = f.Integer()
+        message = f.Text()
+        sections = f.FormSet(SectionForm, extra=0)
+        tags = f.FormSet(SectionForm, extra=0, min_num=1)
+
+    form = MyForm({
+        "count": "x",
+        f"sections{SEP}_NEW1{SEP}title": "",
+        f"sections{SEP}_NEW2{SEP}title": "ok",
+    })
+    assert form.validate() is None
+    assert form.get_errors() == {
+        "subject": "This field is required.",
+        "count": "Not a valid integer.",
+        "sections": {f"sections{SEP}_NEW1": {"title": "This field is required."}},
+        "tags": "Please submit at least 1 forms.",
+    }
+
+
+def test_validate_many():
+    class MyForm(f.Form):
+        name = f.Text(required=True)
+        age = f.Integer()
+
+    records = iter([
+        {"name": "Alice", "age": "30"},
+        {"age": "x"},
+        {"name": "Bob"},
+    ])
+    results = MyForm.validate_many(records)
+
+    assert next(results) == (0, {"name": "Alice", "age": 30})
+    index, errors = next(results)
+    assert index == 1
+    assert isinstance(errors, f.FormErrors)
+    assert errors == {
+        "name": "This field is required.",
+        "age": "Not a valid integer.",
+    }
+    assert next(results) == (2, {"name": "Bob", "age": None})
+
+
+def test_validate_many_with_prefix_and_delete():
+    class MyForm(f.Form):
+        name = f.Text(required=True)
+
+    records = [
+        {f"row{SEP}{DELETED}": "1"},
+        {f"row{SEP}name": "Alice"},
+    ]
+    results = list(MyForm.validate_many(records, prefix="row", can_delete=True))
+    assert results == [(0, {DELETED: True}), (1, {"name": "Alice"})]
@@ -0,0 +1,100 @@
+import io
+
+import pytest
+
+import hyperform as f
+
+
+ITEMS = [
+    ("lorem", 1),
+    ("Group", [("ipsum", 2), ("sit amet", 3)]),
+]
+
+
+def test_iter_select_same_as_as_select():
+    field = f.Integer(name="meh")
+    field.load_data(object_value=2)
+    chunks = list(field.iter_select(ITEMS, label="Choose", classes="x"))
+    assert len(chunks) > 3
+    assert "".join(chunks) == field.as_select(ITEMS, label="Choose", classes="x")
+
+
+def test_iter_select_options():
+    field = f.Text(name="meh")
+    field.load_data(object_value="b")
+    options = f.Options([("A", "a"), ("B", "b")])
+    assert "".join(field.iter_select(options)) == field.as_select(options)
+
+
+def test_field_render_to():
+    field = f.Integer(name="meh")
+    buffer = io.StringIO()
+    field.render_to(buffer.write, "select", ITEMS)
+    assert buffer.getvalue() == field.as_select(ITEMS)
+
+    buffer = io.StringIO()
+    field.render_to(buffer.write, required=True)
+    assert buffer.getvalue() == field.as_input(required=True)
+
+
+def test_field_render_to_unknown_widget():
+    field = f.Integer(name="meh")
+    with pytest.raises(ValueError):
+        field.render_to(print, "nope")
+
+
+def test_form_iter_html():
+    class ItemForm(f.Form):
+        name = f.Text()
+
+    class MyForm(f.Form):
+        size = f.Integer()
+        tos = f.Boolean(required=True)
+        items = f.FormSet(ItemForm, lazy=True)
+
+    form = MyForm(
+        {"size": "nope", "items.1.name": "a", "items.2.name": "b"},
+        object={"items": [{"id": 1}, {"id": 2}]},
+    )
+    form.validate()
+    form.error = "Oops"
+
+    html = "".join(form.iter_html(size="textarea"))
+    assert html == "\n".join([
+        form.render_error(),
+        form.size.as_textarea(),
+        form.size.render_error(),
+        form.tos.as_checkbox(),
+        form.tos.render_error(),
+        form.items[0].name.as_input(),
+        form.items[1].name.as_input(),
+        "",
+    ])
+
+    buffer = io.StringIO()
+    form.render_to(buffer.write, size="textarea")
+    assert buffer.getvalue() == html
+
+
+def test_form_iter_html_callable_widget():
+    class MyForm(f.Form):
+        size = f.Integer()
+
+    form = MyForm({"size": "2"})
+    html = "".join(form.iter_html(size=lambda field: field.iter_select(ITEMS)))
+    assert html == form.size.as_select(ITEMS) + "\n"
+    html = "".join(form.iter_html(size=lambda field: field.as_radio(value=2)))
+    assert html == form.size.as_radio(value=2) + "\n"
+
+
+def test_lazy_form_set_iter_html_doesnt_keep_the_forms():
+    class ItemForm(f.Form):
+        name = f.Text()
+
+    class MyForm(f.Form):
+        items = f.FormSet(ItemForm, lazy=True)
+
+    form = MyForm(object={"items": [{"id": i, "name": str(i)} for i in range(1, 11)]})
+    html = "".join(form.iter_html())
+    assert html.count("<input") == 10
+    assert form.items._forms == [None] * 10
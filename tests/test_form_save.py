@@ -83,3 +83,40 @@ def test_no_model_no_updated_object():
     obj = form.save()
 
     assert obj == {ID: 42, "a": "lorem ipsum", "b": 5}
+
+
+class TrackedForm(MyForm):
+    def update_object(self, data):
+        self._object.written = sorted(data)
+        return super().update_object(data)
+
+
+def test_save_only_updated_fields():
+    input_data = {"a": "new value", "b": "5"}
+    object = MyModel(id=42, a="old value", b=5)
+    form = TrackedForm(input_data, object)
+
+    assert form.save() is object
+    assert object.written == ["a"]
+    assert object.a == "new value"
+
+
+def test_save_clears_missing_fields():
+    object = MyModel(id=42, a="old value", b=5)
+    form = TrackedForm({"b": "5"}, object)
+
+    assert form.save() is object
+    assert object.written == ["a"]
+    assert object.a is None
+
+
+def test_save_unchanged_skips_update():
+    input_data = {"a": "old value", "b": "5"}
+    object = MyModel(id=42, a="old value", b=5)
+    form = TrackedForm(input_data, object)
+
+    assert form.save() is object
+    assert not hasattr(object, "written")
+
+    assert form.save(c=1) is object
+    assert object.written == ["c"]
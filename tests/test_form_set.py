@@ -231,3 +231,104 @@ def test_max_num_forms():
     assert len(form.sections) == 3
     assert form.validate() is None
     assert form.sections.error == "Please submit at most 2 forms."
+
+
+def test_form_sets_only_read_their_own_rows():
+    class SectionForm(f.Form):
+        title = f.Text()
+
+    class TagForm(f.Form):
+        name = f.Text()
+
+    class WrapperForm(f.Form):
+        sections = f.FormSet(SectionForm, extra=0)
+        tags = f.FormSet(TagForm, extra=0)
+
+    input_data = {
+        f"sections{SEP}{NEW}1{SEP}title": "title 1",
+        f"tags{SEP}{NEW}1{SEP}name": "tag 1",
+        f"tags{SEP}{NEW}2{SEP}name": "tag 2",
+    }
+    form = WrapperForm(input_data)
+
+    assert [sf.prefix for sf in form.sections] == [f"sections{SEP}{NEW}1"]
+    assert [tf.prefix for tf in form.tags] == [
+        f"tags{SEP}{NEW}1",
+        f"tags{SEP}{NEW}2",
+    ]
+
+
+def test_nested_form_sets_rows():
+    class TagForm(f.Form):
+        name = f.Text()
+
+    class SectionForm(f.Form):
+        title = f.Text()
+        tags = f.FormSet(TagForm, extra=0)
+
+    class WrapperForm(f.Form):
+        sections = f.FormSet(SectionForm, extra=0)
+
+    input_data = {
+        f"sections{SEP}{NEW}1.tags{SEP}{NEW}1{SEP}name": "tag 1",
+        f"sections{SEP}{NEW}1.tags{SEP}{NEW}2{SEP}name": "tag 2",
+        f"sections{SEP}{NEW}2{SEP}title": "title 2",
+    }
+    form = WrapperForm(input_data)
+
+    assert len(form.sections) == 2
+    section1, section2 = form.sections
+    assert section1.prefix == f"sections{SEP}{NEW}1"
+    assert [tf.name.value for tf in section1.tags] == ["tag 1", "tag 2"]
+    assert section2.title.value == "title 2"
+    assert len(section2.tags) == 0
+
+
+def test_lazy_form_set():
+    class SectionForm(f.Form):
+        title = f.Text(required=True)
+
+    class WrapperForm(f.Form):
+        sections = f.FormSet(SectionForm, extra=0, lazy=True)
+
+    input_data = {
+        f"sections{SEP}{NEW}1{SEP}title": "title 1",
+        f"sections{SEP}{NEW}2{SEP}title": "",
+        f"sections{SEP}{NEW}3{SEP}title": "title 3",
+    }
+    form = WrapperForm(input_data)
+
+    assert len(form.sections) == 3
+    assert form.sections._forms == [None, None, None]
+
+    assert form.sections[-1].title.value == "title 3"
+    assert form.sections._forms[:2] == [None, None]
+    assert form.sections[2] is form.sections[-1]
+
+    assert form.validate() is None
+    form1, form2, form3 = form.sections._forms
+    assert form1 is None
+    assert form2.title.error == "This field is required."
+    assert form3 is form.sections[2]
+
+    assert [sf.prefix for sf in form.sections] == [
+        f"sections{SEP}{NEW}1",
+        f"sections{SEP}{NEW}2",
+        f"sections{SEP}{NEW}3",
+    ]
+
+
+def test_lazy_form_set_validate():
+    class SectionForm(f.Form):
+        title = f.Text()
+
+    class WrapperForm(f.Form):
+        sections = f.FormSet(SectionForm, extra=2, lazy=True)
+
+    input_data = {f"sections{SEP}{NEW}1{SEP}title": "title 1"}
+    form = WrapperForm(input_data)
+
+    assert form.validate() == {
+        "sections": [{"title": "title 1"}, {"title": None}],
+    }
+    assert form.sections._forms == [None, None]
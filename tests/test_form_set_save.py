@@ -213,3 +213,114 @@ def test_save_cant_delete():
     assert obj.items[0].name == "name 1"
     assert obj.items[1].name is None
     assert obj.items[2].name == "name 3"
+
+
+def test_nested_form_sets_are_validated_once():
+    calls = []
+    form_calls = []
+
+    def counter(values):
+        calls.append(values)
+        return True
+
+    class TagForm(ORMForm):
+        name = f.Text(counter)
+
+        def validate(self):
+            form_calls.append(self.prefix)
+            return super().validate()
+
+    class SectionForm(ORMForm):
+        title = f.Text(counter)
+        tags = f.FormSet(TagForm, extra=0, backref="section")
+
+    class WrapperForm(ORMForm):
+        title = f.Text(counter)
+        sections = f.FormSet(SectionForm, extra=0, backref="wrapper")
+
+    input_data = {
+        "title": "Wrapper",
+        f"sections{SEP}{NEW}1{SEP}title": "Section 1",
+        f"sections{SEP}{NEW}1.tags{SEP}{NEW}1{SEP}name": "tag 1",
+        f"sections{SEP}{NEW}1.tags{SEP}{NEW}2{SEP}name": "tag 2",
+        f"sections{SEP}{NEW}2{SEP}title": "Section 2",
+        f"sections{SEP}{NEW}2.tags{SEP}{NEW}1{SEP}name": "tag 3",
+    }
+    form = WrapperForm(input_data)
+
+    assert form.validate()
+    assert len(calls) == 6
+    assert len(form_calls) == 3
+
+    form.sections.validate()
+    form.save()
+    assert len(calls) == 6
+
+    form.load_data(input_data)
+    assert form.validate()
+    assert len(calls) == 12
+
+
+def test_save_lazy_form_set():
+    class SubForm(ORMForm):
+        name = f.Text()
+
+    class WrapperForm(ORMForm):
+        items = f.FormSet(SubForm, extra=0, lazy=True)
+
+    obj = MyModel(id=1, items=[MyModel(id=1, name="a"), MyModel(id=2, name="b")])
+    item1, item2 = obj.items
+    input_data = {
+        f"items{SEP}1{SEP}name": "x",
+        f"items{SEP}2{SEP}{DELETED}": "1",
+        f"items{SEP}{NEW}1{SEP}name": "new",
+    }
+    form = WrapperForm(input_data, obj)
+
+    assert form.validate()
+    assert form.items._forms == [None, None, None]
+
+    assert form.save() == obj
+    assert item1.name == "x"
+    assert item2.deleted
+    assert [item.name for item in obj.items] == ["x", "new"]
+
+
+def test_save_skips_unchanged_forms():
+    written = []
+
+    class SubForm(ORMForm):
+        name = f.Text()
+
+        def update_object(self, data):
+            written.append((self._object.id, sorted(data)))
+            return super().update_object(data)
+
+    class WrapperObject(object):
+        def __init__(self):
+            self.items = [MyModel(id=i, name=str(i)) for i in range(1, 101)]
+
+    class WrapperForm(ORMForm):
+        name = f.Text()
+        items = f.FormSet(SubForm, backref="wrapper")
+
+        def update_object(self, data):
+            written.append(("wrapper", sorted(data)))
+            return super().update_object(data)
+
+    obj = WrapperObject()
+    obj.id = 1
+    obj.name = "wrapper"
+    input_data = {"name": "wrapper"}
+    for item in obj.items:
+        input_data[f"items{SEP}{item.id}{SEP}name"] = item.name
+
+    form = WrapperForm(input_data, obj)
+    assert form.save() is obj
+    assert written == []
+
+    input_data[f"items{SEP}7{SEP}name"] = "seven"
+    form = WrapperForm(input_data, obj)
+    assert form.save() is obj
+    assert written == [(7, ["name"])]
+    assert obj.items[6].name == "seven"
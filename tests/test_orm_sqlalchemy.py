@@ -1,6 +1,9 @@
-from sqlalchemy import create_engine, Column, Integer, String, ForeignKey
+import asyncio
+
+import pytest
+from sqlalchemy import create_engine, event, select, Column, Integer, String, ForeignKey
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, relationship
+from sqlalchemy.orm import relationship, selectinload, sessionmaker
 
 import hyperform as f
 from hyperform.constants import SEP, NEW, DELETED
@@ -31,6 +34,43 @@ class Car(Base):
     owner = relationship("Person", back_populates="cars")
 
 
+class Author(Base):
+    __tablename__ = "authors"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String, nullable=False)
+    books = relationship("Book", back_populates="author")
+    tags = relationship("Tag", back_populates="author")
+
+
+class Book(Base):
+    __tablename__ = "books"
+
+    id = Column(Integer, primary_key=True)
+    title = Column(String, nullable=False)
+    author_id = Column(Integer, ForeignKey("authors.id"))
+    author = relationship("Author", back_populates="books")
+    chapters = relationship("Chapter", back_populates="book")
+
+
+class Chapter(Base):
+    __tablename__ = "chapters"
+
+    id = Column(Integer, primary_key=True)
+    title = Column(String, nullable=False)
+    book_id = Column(Integer, ForeignKey("books.id"))
+    book = relationship("Book", back_populates="chapters")
+
+
+class Tag(Base):
+    __tablename__ = "tags"
+
+    id = Column(Integer, primary_key=True)
+    slug = Column(String, nullable=False, unique=True)
+    author_id = Column(Integer, ForeignKey("authors.id"))
+    author = relationship("Author", back_populates="tags")
+
+
 Base.metadata.create_all(engine)
 
 
@@ -106,3 +146,440 @@ def test_orm_save_update_and_delete():
     assert isinstance(cars[0], Car)
     assert cars[0].make == "Renault"
     assert cars[0].model == "Le Car"
+
+
+def test_orm_save_flushes_once():
+    input_data = {"name": "Many Cars", "age": 40}
+    for i in range(1, 51):
+        input_data[f"cars{SEP}{NEW}{i}{SEP}make"] = f"Make {i}"
+        input_data[f"cars{SEP}{NEW}{i}{SEP}model"] = "X"
+    form = PersonForm(input_data)
+
+    flushes = []
+
+    def on_flush(*args):
+        flushes.append(1)
+
+    event.listen(session, "after_flush", on_flush)
+    try:
+        obj = form.save()
+    finally:
+        event.remove(session, "after_flush", on_flush)
+    session.commit()
+
+    assert len(flushes) == 1
+    assert obj.id is not None
+    assert sorted(car.make for car in obj.cars) == sorted(
+        f"Make {i}" for i in range(1, 51)
+    )
+
+
+class OwnerIdCarForm(f.SQLAForm):
+    _model = Car
+    _session = session
+
+    make = f.Text(required=True)
+    model = f.Text(required=True)
+
+
+class OwnerIdPersonForm(f.SQLAForm):
+    _model = Person
+    _session = session
+
+    name = f.Text(required=True)
+    age = f.Integer(required=True)
+    cars = f.FormSet(OwnerIdCarForm, backref="owner_id")
+
+
+def test_orm_save_backref_to_a_column():
+    input_data = {
+        "name": "Column Backref",
+        "age": 30,
+        f"cars{SEP}{NEW}1{SEP}make": "Renault",
+        f"cars{SEP}{NEW}1{SEP}model": "Le Car",
+    }
+    form = OwnerIdPersonForm(input_data)
+    obj = form.save()
+    session.commit()
+
+    assert obj.id is not None
+    cars = list(obj.cars)
+    assert len(cars) == 1
+    assert cars[0].owner_id == obj.id
+
+
+def test_orm_save_error_resets_the_deferred_flush():
+    form = PersonForm({"name": "Error", "age": 1})
+
+    def fail(data):
+        raise RuntimeError
+
+    form.create_object = fail
+    try:
+        form.save()
+    except RuntimeError:
+        pass
+
+    form = CarForm({"make": "Ford", "model": "T"})
+    obj = form.save()
+    assert obj.id is not None
+    session.commit()
+
+
+def test_orm_save_batched_deletes(monkeypatch):
+    from hyperform import sqla
+
+    monkeypatch.setitem(sqla.MAX_PARAMS, "sqlite", 4)
+
+    person = Person(name="Deleter", age=50)
+    cars = [Car(make=f"Make {i}", model="X", owner=person) for i in range(10)]
+    session.add(person)
+    session.add_all(cars)
+    session.commit()
+    ids = [car.id for car in cars]
+
+    input_data = {"name": "Deleter", "age": 50}
+    for car in cars[:9]:
+        input_data[f"cars{SEP}{car.id}{SEP}{DELETED}"] = "1"
+    input_data[f"cars{SEP}{cars[9].id}{SEP}make"] = "Make 9"
+    input_data[f"cars{SEP}{cars[9].id}{SEP}model"] = "X"
+    input_data[f"cars{SEP}{NEW}1{SEP}make"] = "New"
+    input_data[f"cars{SEP}{NEW}1{SEP}model"] = "Y"
+    form = PersonForm(input_data, person)
+
+    statements = []
+
+    def on_execute(conn, cursor, statement, *args):
+        statements.append(statement.split()[0])
+
+    event.listen(engine, "before_cursor_execute", on_execute)
+    try:
+        obj = form.save()
+    finally:
+        event.remove(engine, "before_cursor_execute", on_execute)
+
+    assert statements.count("DELETE") == 3  # 9 rows in chunks of 4
+    # The deletes run before the flush of the pending changes
+    assert statements.index("DELETE") < statements.index("INSERT")
+    for car in cars[:9]:
+        assert car not in session
+    session.commit()
+
+    assert session.query(Car).filter(Car.id.in_(ids)).count() == 1
+    assert sorted(car.make for car in obj.cars) == ["Make 9", "New"]
+
+
+def test_orm_delete_and_reuse_a_unique_value():
+    class TagForm(f.SQLAForm):
+        _model = Tag
+        _session = session
+
+        slug = f.Text(f.Unique(Tag.slug), required=True)
+
+    class AuthorTagsForm(f.SQLAForm):
+        _model = Author
+        _session = session
+
+        name = f.Text(required=True)
+        tags = f.FormSet(TagForm, backref="author")
+
+    author = Author(name="Tagger")
+    tag = Tag(slug="reused", author=author)
+    session.add_all([author, tag])
+    session.commit()
+
+    form = AuthorTagsForm({
+        "name": "Tagger",
+        f"tags{SEP}{tag.id}{SEP}{DELETED}": "1",
+        f"tags{SEP}{NEW}1{SEP}slug": "reused",
+    }, author)
+    form.save()
+    session.commit()
+
+    assert [tag.slug for tag in author.tags] == ["reused"]
+    assert author.tags[0] is not tag
+
+
+def test_orm_delete_with_listeners_uses_the_session():
+    person = Person(name="Listener", age=51)
+    cars = [Car(make=f"Make {i}", model="X", owner=person) for i in range(3)]
+    session.add(person)
+    session.add_all(cars)
+    session.commit()
+
+    deleted = []
+
+    def on_delete(mapper, connection, target):
+        deleted.append(target)
+
+    input_data = {"name": "Listener", "age": 51}
+    for car in cars:
+        input_data[f"cars{SEP}{car.id}{SEP}{DELETED}"] = "1"
+    form = PersonForm(input_data, person)
+
+    event.listen(Car, "after_delete", on_delete)
+    try:
+        form.save()
+    finally:
+        event.remove(Car, "after_delete", on_delete)
+    session.commit()
+
+    assert deleted == cars
+    assert person.cars == []
+
+
+def test_orm_delete_with_relationships_uses_the_session():
+    person = Person(name="To delete", age=1)
+    car = Car(make="Ford", model="T", owner=person)
+    session.add_all([person, car])
+    session.commit()
+
+    class DeletablePersonForm(PersonForm):
+        pass
+
+    form = DeletablePersonForm({DELETED: "1"}, person, can_delete=True)
+    assert form.save() is None
+    session.commit()
+
+    assert session.get(Person, person.id) is None
+    assert session.get(Car, car.id).owner_id is None
+
+
+def test_orm_save_unchanged_rows_without_sql():
+    person = Person(name="Unchanged", age=60)
+    cars = [Car(make=f"Make {i}", model="X", owner=person) for i in range(100)]
+    session.add(person)
+    session.add_all(cars)
+    session.commit()
+
+    input_data = {"name": "Unchanged", "age": 60}
+    for car in cars:
+        input_data[f"cars{SEP}{car.id}{SEP}make"] = car.make
+        input_data[f"cars{SEP}{car.id}{SEP}model"] = car.model
+    input_data[f"cars{SEP}{cars[3].id}{SEP}model"] = "Y"
+    form = PersonForm(input_data, person)
+    assert form.validate()
+
+    statements = []
+
+    def on_execute(conn, cursor, statement, *args):
+        statements.append(statement.split()[0])
+
+    event.listen(engine, "before_cursor_execute", on_execute)
+    try:
+        assert form.save() is person
+    finally:
+        event.remove(engine, "before_cursor_execute", on_execute)
+    session.commit()
+
+    assert statements == ["UPDATE"]
+    assert cars[3].model == "Y"
+
+
+class ChapterForm(f.SQLAForm):
+    _model = Chapter
+    _session = session
+
+    title = f.Text(required=True)
+
+
+class BookForm(f.SQLAForm):
+    _model = Book
+    _session = session
+
+    title = f.Text(required=True)
+    chapters = f.FormSet(ChapterForm, backref="book")
+
+
+class AuthorForm(f.SQLAForm):
+    _model = Author
+    _session = session
+
+    name = f.Text(required=True)
+    books = f.FormSet(BookForm, backref="author")
+    # Not a relationship
+    links = f.FormSet(ChapterForm)
+
+
+def test_load_options():
+    options = AuthorForm.load_options()
+    assert len(options) == 1
+    expected = selectinload(Author.books).selectinload(Book.chapters)
+    assert options[0].path == expected.path
+    assert PersonForm.load_options()[0].path == selectinload(Person.cars).path
+    assert ChapterForm.load_options() == []
+
+
+def test_load_options_fixed_number_of_queries():
+    author = Author(name="Prolific")
+    for i in range(20):
+        book = Book(title=f"Book {i}", author=author)
+        for j in range(5):
+            Chapter(title=f"Chapter {j}", book=book)
+    session.add(author)
+    session.commit()
+    author_id = author.id
+
+    def count_queries(options):
+        session.expunge_all()
+        statements = []
+
+        def on_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", on_execute)
+        try:
+            stmt = select(Author).where(Author.id == author_id).options(*options)
+            obj = session.scalars(stmt).one()
+            form = AuthorForm(object=obj)
+        finally:
+            event.remove(engine, "before_cursor_execute", on_execute)
+        assert len(form.books) == 20
+        assert len(form.books[0].chapters) == 5
+        return len(statements)
+
+    assert count_queries([]) == 22
+    assert count_queries(AuthorForm.load_options()) == 3
+
+
+class UniqueChapterForm(f.SQLAForm):
+    _model = Chapter
+    _session = session
+
+    title = f.Text(f.Unique(Chapter.title), required=True)
+
+
+class ChaptersForm(f.Form):
+    chapters = f.FormSet(UniqueChapterForm, extra=0)
+
+
+def test_unique_validator_is_a_batch_validator():
+    field = f.Text(f.ShorterThan(10), f.Unique(Chapter.title))
+    assert len(field.validators) == 1
+    assert len(field.batch_validators) == 1
+    assert UniqueChapterForm._batch_specs[0][0] == "title"
+
+
+def test_unique_form():
+    chapter = Chapter(title="Unique 1")
+    session.add(chapter)
+    session.commit()
+
+    form = UniqueChapterForm({"title": "Unique 1"})
+    assert form.validate() is None
+    assert form.title.error == f.Unique.message
+    assert form.get_errors() == {"title": f.Unique.message}
+
+    # Its own value
+    form = UniqueChapterForm({"title": "Unique 1"}, chapter)
+    assert form.validate()
+
+    form = UniqueChapterForm({"title": "Unique 2"})
+    assert form.validate()
+
+
+def test_unique_repeated_in_the_same_form():
+    class TagsForm(f.SQLAForm):
+        _model = Chapter
+        _session = session
+
+        titles = f.Text(f.Unique(Chapter.title), multiple=True)
+
+    form = TagsForm({"titles": ["Unique M", "Unique M", "Unique N"]})
+    assert form.validate()
+    assert form.titles.error is None
+
+
+def test_unique_only_excludes_rows_of_the_same_model():
+    chapter = Chapter(id=1000, title="Unique X")
+    book = Book(id=1000, title="Unique X")
+    session.add_all([chapter, book])
+    session.commit()
+
+    class BookForm(f.SQLAForm):
+        _model = Book
+        _session = session
+
+        title = f.Text(f.Unique(Chapter.title), required=True)
+
+    # The book has the same primary key as the chapter, but it's not the
+    # row using the title.
+    form = BookForm({"title": "Unique X"}, book)
+    assert form.validate() is None
+    assert form.title.error == f.Unique.message
+
+
+def test_unique_without_a_session():
+    class NoSessionForm(f.Form):
+        title = f.Text(f.Unique(Chapter.title))
+
+    form = NoSessionForm({"title": "Unique 1"})
+    with pytest.raises(ValueError, match="needs a session"):
+        form.validate()
+
+
+def test_unique_form_set():
+    chapters = [Chapter(title="Unique A"), Chapter(title="Unique B")]
+    session.add_all(chapters)
+    session.commit()
+    a, b = chapters
+
+    input_data = {
+        # Unchanged
+        f"chapters{SEP}{a.id}{SEP}title": "Unique A",
+        # Deleted, so its title can be used by a new chapter
+        f"chapters{SEP}{b.id}{SEP}{DELETED}": "1",
+        f"chapters{SEP}{NEW}1{SEP}title": "Unique B",
+        # Already used by the chapter of another test
+        f"chapters{SEP}{NEW}2{SEP}title": "Unique 1",
+        f"chapters{SEP}{NEW}3{SEP}title": "Unique C",
+        # Repeated
+        f"chapters{SEP}{NEW}4{SEP}title": "Unique C",
+    }
+    if not session.scalars(select(Chapter).where(Chapter.title == "Unique 1")).first():
+        session.add(Chapter(title="Unique 1"))
+        session.commit()
+
+    form = ChaptersForm(input_data, {"chapters": chapters})
+    statements = []
+
+    def on_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", on_execute)
+    try:
+        assert form.validate() is None
+    finally:
+        event.remove(engine, "before_cursor_execute", on_execute)
+
+    assert len(statements) == 1
+    assert " IN " in statements[0]
+    errors = {
+        form.prefix: form.title.error
+        for form in form.chapters
+    }
+    assert errors == {
+        f"chapters{SEP}{a.id}": None,
+        f"chapters{SEP}{b.id}": None,
+        f"chapters{SEP}{NEW}1": None,
+        f"chapters{SEP}{NEW}2": f.Unique.message,
+        f"chapters{SEP}{NEW}3": None,
+        f"chapters{SEP}{NEW}4": f.Unique.message,
+    }
+    assert form.chapters[3]._is_valid is False
+    assert form.chapters[4]._is_valid
+
+
+def test_unique_form_set_avalidate():
+    input_data = {
+        f"chapters{SEP}{NEW}1{SEP}title": "Unique D",
+        f"chapters{SEP}{NEW}2{SEP}title": "Unique D",
+    }
+    form = ChaptersForm(input_data)
+    loop = asyncio.new_event_loop()
+    try:
+        assert loop.run_until_complete(form.avalidate()) is None
+    finally:
+        loop.close()
+    assert form.chapters[0].title.error is None
+    assert form.chapters[1].title.error == f.Unique.message
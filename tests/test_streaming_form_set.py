@@ -0,0 +1,226 @@
+import tracemalloc
+
+import hyperform as f
+from hyperform.constants import SEP, NEW, DELETED
+
+
+class MyModel(object):
+    def __init__(self, **kwargs):
+        kwargs.setdefault("deleted", False)
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+
+
+class RowForm(f.Form):
+    _model = MyModel
+
+    name = f.Text(required=True)
+    quantity = f.Integer()
+
+    def create_object(self, data):
+        return self._model(**data)
+
+    def delete_object(self):
+        self._object.deleted = True
+
+
+def iter_objects(num):
+    for i in range(1, num + 1):
+        yield MyModel(id=i, name=f"row {i}", quantity=i)
+
+
+def test_save_in_chunks():
+    chunks = []
+    objects = list(iter_objects(2500))
+    input_data = {
+        f"rows{SEP}1{SEP}name": "updated",
+        f"rows{SEP}1{SEP}quantity": "1",
+        f"rows{SEP}2{SEP}{DELETED}": "1",
+        f"rows{SEP}{NEW}1{SEP}name": "new",
+        f"rows{SEP}{NEW}2{SEP}quantity": "3",
+    }
+    for i in range(3, 2501):
+        input_data[f"rows{SEP}{i}{SEP}name"] = f"row {i}"
+        input_data[f"rows{SEP}{i}{SEP}quantity"] = str(i)
+
+    stream = f.StreamingFormSet(
+        RowForm,
+        name="rows",
+        chunk_size=1000,
+        on_chunk=lambda summary: chunks.append(summary.updated + summary.unchanged),
+    )
+    summary = stream.save(input_data, iter(objects))
+
+    assert summary.created == 1
+    assert summary.updated == 1
+    assert summary.deleted == 1
+    assert summary.unchanged == 2498
+    assert summary.invalid == 1
+    assert not summary.is_valid
+    assert summary.errors == {
+        f"rows{SEP}{NEW}2": {"name": "This field is required."},
+    }
+    assert chunks == [999, 1999, 2499]
+
+    assert objects[0].name == "updated"
+    assert objects[1].deleted
+
+
+def test_validate_does_not_save():
+    objects = list(iter_objects(3))
+    input_data = {
+        f"rows{SEP}1{SEP}name": "updated",
+        f"rows{SEP}2{SEP}{DELETED}": "1",
+        f"rows{SEP}3{SEP}name": "",
+    }
+    stream = f.StreamingFormSet(RowForm, name="rows", chunk_size=2)
+    summary = stream.validate(input_data, objects)
+
+    assert summary.updated == 1
+    assert summary.deleted == 1
+    assert summary.invalid == 1
+    assert objects[0].name == "row 1"
+    assert not objects[1].deleted
+
+
+def test_max_errors():
+    input_data = {
+        f"rows{SEP}{NEW}{i}{SEP}quantity": "x" for i in range(1, 11)
+    }
+    stream = f.StreamingFormSet(RowForm, name="rows", max_errors=3)
+    summary = stream.validate(input_data)
+
+    assert summary.invalid == 10
+    assert list(summary.errors) == [
+        f"rows{SEP}{NEW}1",
+        f"rows{SEP}{NEW}2",
+        f"rows{SEP}{NEW}3",
+    ]
+
+
+def test_backref():
+    parent = MyModel(id=1)
+    input_data = {f"rows{SEP}{NEW}1{SEP}name": "new"}
+
+    created = []
+
+    class ChildForm(RowForm):
+        def create_object(self, data):
+            obj = super().create_object(data)
+            created.append(obj)
+            return obj
+
+    stream = f.StreamingFormSet(ChildForm, name="rows", backref="parent")
+    summary = stream.save(input_data, parent=parent)
+
+    assert summary.created == 1
+    assert created[0].parent is parent
+
+
+def test_rows_without_an_object_are_ignored():
+    input_data = {
+        f"rows{SEP}99{SEP}name": "unknown",
+        f"rows{SEP}{NEW}1{SEP}quantity": "1",
+        f"rows{SEP}{NEW}1{SEP}name": "new",
+    }
+    stream = f.StreamingFormSet(RowForm, name="rows")
+    summary = stream.validate(input_data)
+
+    assert summary.created == 1
+    assert summary.invalid == 0
+
+
+def test_memory_does_not_grow_with_the_rows():
+    def get_peak(num):
+        input_data = {}
+        for i in range(1, num + 1):
+            input_data[f"rows{SEP}{i}{SEP}name"] = f"row {i}"
+            input_data[f"rows{SEP}{NEW}{i}{SEP}name"] = f"new {i}"
+        stream = f.StreamingFormSet(RowForm, name="rows", chunk_size=50)
+
+        tracemalloc.start()
+        try:
+            summary = stream.validate(input_data, iter_objects(num))
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert summary.created == num
+        assert summary.updated == num
+        return peak
+
+    assert get_peak(4000) < get_peak(500) * 1.2
+
+
+def test_max_chunk_bytes():
+    chunks = []
+    input_data = {
+        f"rows{SEP}{NEW}{i}{SEP}name": "x" * 40 for i in range(1, 11)
+    }
+    stream = f.StreamingFormSet(
+        RowForm,
+        name="rows",
+        chunk_size=100,
+        max_chunk_bytes=100,
+        on_chunk=lambda summary: chunks.append(summary.created),
+    )
+    summary = stream.save(input_data)
+
+    assert summary.created == 10
+    # Three rows of 40 bytes reach the 100 bytes
+    assert chunks == [3, 6, 9, 10]
+
+
+class FakeUnique(object):
+    batch = True
+    message = "Already used."
+
+    def __init__(self, used):
+        self.used = used
+        self.calls = []
+
+    def find_used(self, values, exclude, form):
+        self.calls.append(values)
+        return {value for value in values if value in self.used}
+
+
+def test_batch_validators_run_once_per_chunk():
+    unique = FakeUnique(used={"taken"})
+
+    class UniqueRowForm(f.Form):
+        name = f.Text(unique, required=True)
+
+    input_data = {
+        f"rows{SEP}{NEW}1{SEP}name": "a",
+        f"rows{SEP}{NEW}2{SEP}name": "a",
+        f"rows{SEP}{NEW}3{SEP}name": "taken",
+        f"rows{SEP}{NEW}4{SEP}name": "b",
+    }
+    stream = f.StreamingFormSet(UniqueRowForm, name="rows", chunk_size=2)
+    summary = stream.validate(input_data)
+
+    assert unique.calls == [["a"], ["taken", "b"]]
+    assert summary.created == 2
+    assert summary.errors == {
+        f"rows{SEP}{NEW}2": {"name": "Already used."},
+        f"rows{SEP}{NEW}3": {"name": "Already used."},
+    }
+
+
+def test_new_rows_with_only_nested_formsets():
+    class TagForm(f.Form):
+        name = f.Text()
+
+    class ParentRowForm(f.Form):
+        name = f.Text()
+        tags = f.FormSet(TagForm)
+
+    input_data = {
+        f"rows{SEP}{NEW}1.tags{SEP}{NEW}1{SEP}name": "a",
+        f"rows{SEP}{NEW}1.tags{SEP}{NEW}2{SEP}name": "b",
+        f"rows{SEP}{NEW}2{SEP}name": "own",
+    }
+    stream = f.StreamingFormSet(ParentRowForm, name="rows")
+    summary = stream.validate(input_data)
+
+    assert summary.created == 2
+    assert summary.invalid == 0